@@ -0,0 +1,236 @@
+"""
+Replay calls through the end-of-turn policies: fixed, prosody and adaptive.
+
+Every call is turned into the stream of short VAD windows the handler sees
+(speech seconds and RMS energy per window), then replayed through:
+
+- fixed: ReplyOnPause's defaults, 0.6 s chunks, the turn ends on the first
+  chunk with less than 0.1 s of speech (without the VAD speech padding)
+- prosody: EndpointDetector without learning the caller's profile
+- adaptive: EndpointDetector, the caller's profile learned within the call
+
+For each policy it reports the latency from the end of speech to the end of
+turn decision (p50 / p95 / mean), the latency saved against fixed, and the
+false-cutoff rate: turns ended while the caller still had speech left in them.
+
+Calls are WAV files (mono, 16-bit) of the caller's channel, each with a JSON
+file of the same name listing its turns as [start, end] seconds of speech:
+{"turns": [[0.4, 3.1], [7.9, 9.2]]}. Without `--calls`, synthetic callers
+(each with their own phrase lengths, pause rhythm and energy contours) are
+replayed with their exact speech timings instead of a VAD.
+
+Usage:
+    uv run python scripts/benchmarks/endpointing.py
+    uv run python scripts/benchmarks/endpointing.py --calls data/recorded_calls
+"""
+
+import argparse
+import json
+import sys
+import wave
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+from loguru import logger
+
+from realtime_phone_agents.agent.endpointing import (
+    SHORT_WINDOW_VAD_OPTIONS,
+    EndpointDetector,
+    window_energy,
+)
+from realtime_phone_agents.config import settings
+
+FIXED_CHUNK_S = 0.6
+FIXED_STARTED_TALKING_S = 0.2
+FIXED_SPEECH_S = 0.1
+
+
+@dataclass
+class Call:
+    name: str
+    window_s: float
+    speech: np.ndarray  # speech seconds per window
+    energy: np.ndarray  # RMS energy per window
+    turns: list[tuple[float, float]]  # [start, end] seconds of each turn's speech
+
+
+# --- Calls ---
+
+
+def synthetic_call(index: int, window_s: float, turns: int, seed: int) -> Call:
+    """A caller with their own rhythm: phrases, pauses inside turns and energy contours."""
+    rng = np.random.default_rng(seed + index)
+    pause_median = rng.uniform(0.15, 0.6)
+    pause_sigma = rng.uniform(0.2, 0.5)
+    phrase_mean = rng.uniform(0.6, 2.0)
+    level = rng.uniform(0.05, 0.3)
+
+    # (start, end, energy of the last window relative to the phrase)
+    phrases: list[tuple[float, float, float]] = []
+    spans = []
+    t = rng.uniform(0.5, 1.5)
+    for _ in range(turns):
+        start = t
+        for p in range(rng.integers(1, 5)):
+            if p:
+                t += min(rng.lognormal(np.log(pause_median), pause_sigma), 1.5)
+            end = t + max(rng.gamma(4.0, phrase_mean / 4.0), 0.3)
+            last = p == 3 or rng.random() < 0.4
+            if last:
+                tail = 0.3 if rng.random() < 0.7 else 1.0
+            else:
+                tail = 1.4 if rng.random() < 0.5 else 1.0
+            phrases.append((t, end, tail))
+            t = end
+            if last:
+                break
+        spans.append((start, t))
+        t += rng.uniform(2.0, 5.0)  # the agent answers
+
+    windows = int(np.ceil(t / window_s))
+    edges = np.arange(windows + 1) * window_s
+    speech = np.zeros(windows)
+    energy = np.full(windows, level * 0.03)
+    for start, end, tail in phrases:
+        overlap = np.clip(np.minimum(edges[1:], end) - np.maximum(edges[:-1], start), 0, None)
+        voiced = np.flatnonzero(overlap > 0)
+        speech[voiced] += overlap[voiced]
+        energy[voiced] = level * rng.lognormal(0.0, 0.15, len(voiced))
+        energy[voiced[-1]] *= tail
+
+    # VAD mistakes: a little speech found in noise
+    noise = rng.random(windows) < 0.02
+    speech[noise & (speech == 0)] = 0.07
+    return Call(f"synthetic-{index}", window_s, speech, energy, spans)
+
+
+def recorded_call(path: Path, window_s: float, vad) -> Call:
+    """A recorded call, through the handler's VAD."""
+    with wave.open(str(path)) as wav:
+        sample_rate = wav.getframerate()
+        audio = np.frombuffer(wav.readframes(wav.getnframes()), dtype=np.int16)
+
+    size = int(sample_rate * window_s)
+    windows = [audio[i : i + size] for i in range(0, len(audio) - size + 1, size)]
+    speech = np.array(
+        [vad.vad((sample_rate, window), SHORT_WINDOW_VAD_OPTIONS)[0] for window in windows]
+    )
+    energy = np.array([window_energy(window) for window in windows])
+    turns = json.loads(path.with_suffix(".json").read_text())["turns"]
+    return Call(path.stem, window_s, speech, energy, [tuple(turn) for turn in turns])
+
+
+# --- Policies ---
+
+
+def fixed_policy(call: Call) -> list[float]:
+    """End of turn times of ReplyOnPause's default chunking."""
+    per_chunk = max(round(FIXED_CHUNK_S / call.window_s), 1)
+    decisions, started = [], False
+    for i in range(0, len(call.speech) - per_chunk + 1, per_chunk):
+        speech = call.speech[i : i + per_chunk].sum()
+        if speech > FIXED_STARTED_TALKING_S:
+            started = True
+        if started and speech < FIXED_SPEECH_S:
+            decisions.append((i + per_chunk) * call.window_s)
+            started = False
+    return decisions
+
+
+def detector_policy(call: Call, detector: EndpointDetector) -> list[float]:
+    """End of turn times of an EndpointDetector."""
+    decisions = []
+    for i, (speech, energy) in enumerate(zip(call.speech, call.energy)):
+        if detector.observe(call.window_s, speech, energy) is not None:
+            decisions.append((i + 1) * call.window_s)
+    return decisions
+
+
+POLICIES = {
+    "fixed": fixed_policy,
+    "prosody": lambda call: detector_policy(
+        call, EndpointDetector(min_pauses=sys.maxsize, false_cutoff_step=0.0, margin_decay=0.0)
+    ),
+    "adaptive": lambda call: detector_policy(call, EndpointDetector()),
+}
+
+
+# --- Scoring ---
+
+
+def score(call: Call, decisions: list[float]) -> tuple[list[float], int, int]:
+    """
+    Match decisions with the call's turns.
+
+    Returns:
+        Latency of every turn ended after its speech, false cutoffs (turns
+        ended before their speech was over) and turns never ended
+    """
+    latencies, false_cutoffs, missed = [], 0, 0
+    for index, (start, end) in enumerate(call.turns):
+        next_start = call.turns[index + 1][0] if index + 1 < len(call.turns) else np.inf
+        in_turn = [t for t in decisions if start < t < next_start]
+        if any(t < end for t in in_turn):
+            false_cutoffs += 1
+        if after := [t for t in in_turn if t >= end]:
+            latencies.append(after[0] - end)
+        else:
+            missed += 1
+    return latencies, false_cutoffs, missed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--calls", help="Directory of recorded calls (.wav + .json)")
+    parser.add_argument("--synthetic-calls", type=int, default=200)
+    parser.add_argument("--turns", type=int, default=12, help="Turns per synthetic call")
+    parser.add_argument("--window-ms", type=int, default=settings.endpointing.window_ms)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    logger.remove()
+    logger.add(sys.stderr, level="WARNING")
+
+    window_s = args.window_ms / 1000
+    if args.calls:
+        from fastrtc import get_silero_model
+
+        vad = get_silero_model()
+        calls = [recorded_call(path, window_s, vad) for path in sorted(Path(args.calls).glob("*.wav"))]
+    else:
+        calls = [
+            synthetic_call(i, window_s, args.turns, args.seed)
+            for i in range(args.synthetic_calls)
+        ]
+    if not calls:
+        sys.exit(f"No calls found in {args.calls}")
+
+    results = {}
+    for policy, decide in POLICIES.items():
+        latencies, false_cutoffs, missed = [], 0, 0
+        for call in calls:
+            call_latencies, call_false_cutoffs, call_missed = score(call, decide(call))
+            latencies.extend(call_latencies)
+            false_cutoffs += call_false_cutoffs
+            missed += call_missed
+        results[policy] = (np.array(latencies) * 1000, false_cutoffs, missed)
+
+    turns = sum(len(call.turns) for call in calls)
+    print(f"\nCalls: {len(calls)} | turns: {turns} | window: {args.window_ms} ms\n")
+    print(
+        f"{'policy':>8} | {'p50 (ms)':>8} | {'p95 (ms)':>8} | {'mean (ms)':>9} | "
+        f"{'saved (ms)':>10} | {'false cutoffs':>13} | {'missed':>6}"
+    )
+    print("-" * 82)
+    fixed_mean = results["fixed"][0].mean()
+    for policy, (latencies, false_cutoffs, missed) in results.items():
+        p50, p95 = np.percentile(latencies, [50, 95])
+        print(
+            f"{policy:>8} | {p50:>8.0f} | {p95:>8.0f} | {latencies.mean():>9.0f} | "
+            f"{fixed_mean - latencies.mean():>10.0f} | {false_cutoffs / turns:>13.1%} | {missed:>6}"
+        )
+
+
+if __name__ == "__main__":
+    main()
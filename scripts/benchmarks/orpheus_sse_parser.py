@@ -0,0 +1,179 @@
+"""
+Benchmark Orpheus SSE token parsing.
+
+Compares the previous per-line path (decode, prefix check, `json.loads` of the
+whole payload, `rfind` + slicing of the token string) against the fast-path
+OrpheusSSEParser, on a recorded completions stream replayed in network-sized
+reads. Both paths must produce the same token numbers.
+
+Without --recording, a stream in the llama.cpp completions format is
+synthesized. Use --record to capture a real stream from the configured
+Orpheus server first.
+
+Usage:
+    uv run python scripts/benchmarks/orpheus_sse_parser.py
+    uv run python scripts/benchmarks/orpheus_sse_parser.py --record data/orpheus_stream.sse
+    uv run python scripts/benchmarks/orpheus_sse_parser.py --recording data/orpheus_stream.sse
+"""
+
+import argparse
+import json
+import random
+import time
+from pathlib import Path
+
+from realtime_phone_agents.tts.runpod.orpheus.options import (
+    CUSTOM_TOKEN_PREFIX,
+    OrpheusTTSOptions,
+)
+from realtime_phone_agents.tts.runpod.orpheus.sse import OrpheusSSEParser
+
+TOKENS_PER_UTTERANCE = 1200
+REPEATS = 50
+SEED = 7
+
+
+def synthesize_stream(num_tokens: int = TOKENS_PER_UTTERANCE) -> bytes:
+    """Build a completions stream with the shape llama.cpp sends."""
+    rng = random.Random(SEED)
+    events = []
+    for i in range(num_tokens):
+        number = 10 + (i % 7) * 4096 + rng.randrange(4096)
+        event = {
+            "choices": [
+                {
+                    "text": f"{CUSTOM_TOKEN_PREFIX}{number}>",
+                    "index": 0,
+                    "logprobs": None,
+                    "finish_reason": None,
+                }
+            ],
+            "created": 1760000000,
+            "model": "orpheus-3b-0.1-ft",
+            "system_fingerprint": "b6000-abcdef",
+            "object": "text_completion",
+            "id": "chatcmpl-0123456789abcdef",
+        }
+        events.append(b"data: " + json.dumps(event, separators=(",", ":")).encode())
+    events.append(b"data: [DONE]")
+    return b"\n\n".join(events) + b"\n\n"
+
+
+def record_stream(path: Path, text: str) -> None:
+    """Capture the raw SSE stream of one utterance from the Orpheus server."""
+    import requests
+
+    options = OrpheusTTSOptions()
+    payload = {
+        "model": options.model,
+        "prompt": f"<|audio|>{options.voice}: {text}<|eot_id|>",
+        "max_tokens": options.max_tokens,
+        "temperature": options.temperature,
+        "top_p": options.top_p,
+        "repeat_penalty": options.repetition_penalty,
+        "stream": True,
+    }
+    with requests.post(
+        f"{options.api_url}/v1/completions",
+        headers=options.headers,
+        json=payload,
+        stream=True,
+        timeout=None,
+    ) as response:
+        response.raise_for_status()
+        path.write_bytes(b"".join(response.iter_content(chunk_size=None)))
+    print(f"Recorded {path.stat().st_size:,} bytes to {path}")
+
+
+def split_reads(stream: bytes, rng: random.Random) -> list[bytes]:
+    """Split a stream into network reads of 1 to 4 events, cut at arbitrary bytes."""
+    event_size = max(len(stream) // max(stream.count(b"data: "), 1), 1)
+    reads, position = [], 0
+    while position < len(stream):
+        size = rng.randint(event_size // 2, event_size * 4)
+        reads.append(stream[position : position + size])
+        position += size
+    return reads
+
+
+def legacy_parse(reads: list[bytes]) -> list[int]:
+    """The previous parsing path: one decode + json.loads per line."""
+    numbers = []
+    for line in b"".join(reads).splitlines():
+        if not line:
+            continue
+        line_str = line.decode("utf-8")
+        if not line_str.startswith("data: "):
+            continue
+        data_str = line_str[6:].strip()
+        if data_str == "[DONE]":
+            break
+        data = json.loads(data_str)
+        token_text = data["choices"][0].get("text", "").strip()
+        start = token_text.rfind(CUSTOM_TOKEN_PREFIX)
+        if start == -1:
+            continue
+        last_token = token_text[start:]
+        if last_token.endswith(">"):
+            numbers.append(int(last_token[14:-1]))
+    return numbers
+
+
+def fast_parse(reads: list[bytes]) -> list[int]:
+    parser = OrpheusSSEParser()
+    numbers = []
+    for data in reads:
+        numbers.extend(parser.feed(data))
+        if parser.done:
+            break
+    else:
+        numbers.extend(parser.flush())
+    return numbers
+
+
+def time_per_utterance(parse, reads: list[bytes]) -> float:
+    start = time.perf_counter()
+    for _ in range(REPEATS):
+        parse(reads)
+    return (time.perf_counter() - start) / REPEATS
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--recording", type=Path, help="Raw SSE stream to replay")
+    parser.add_argument("--record", type=Path, help="Record a stream to this path first")
+    parser.add_argument(
+        "--text",
+        default="Hi, I found a lovely two bedroom apartment in Chamberí, close to the metro.",
+        help="Utterance to record",
+    )
+    args = parser.parse_args()
+
+    if args.record:
+        record_stream(args.record, args.text)
+        args.recording = args.record
+
+    stream = args.recording.read_bytes() if args.recording else synthesize_stream()
+    reads = split_reads(stream, random.Random(SEED))
+
+    expected = legacy_parse(reads)
+    assert fast_parse(reads) == expected, "Fast path disagrees with the reference parser"
+
+    source = args.recording or "synthetic llama.cpp stream"
+    print(f"Stream: {source} | {len(expected)} tokens | {len(reads)} network reads\n")
+
+    legacy = time_per_utterance(legacy_parse, reads)
+    fast = time_per_utterance(fast_parse, reads)
+
+    print(f"{'parser':>10} | {'ms / utterance':>14} | {'µs / token':>10}")
+    print("-" * 42)
+    for name, seconds in [("legacy", legacy), ("fast path", fast)]:
+        print(
+            f"{name:>10} | {seconds * 1000:>14.2f} | "
+            f"{seconds / max(len(expected), 1) * 1e6:>10.2f}"
+        )
+    print(f"\nSpeedup: {legacy / fast:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,185 @@
+"""
+Benchmark filtered property search latency with and without payload indexes.
+
+Loads synthetic listings into a scratch Qdrant collection laid out like the
+Superlinked one (same payload keys, dot product, exact search), then runs the
+same filtered searches (location equality plus room and price ranges) before
+and after creating the payload indexes declared for the filter fields.
+
+Needs a running Qdrant, e.g. the one from `make start-call-center`. With
+`--url :memory:` the qdrant-client local mode is used as a stand-in: it runs
+end to end but ignores payload indexes, so both columns should match.
+
+Usage:
+    uv run python scripts/benchmarks/qdrant_payload_indexes.py
+    uv run python scripts/benchmarks/qdrant_payload_indexes.py --sizes 10000 100000 --queries 200
+"""
+
+import argparse
+import time
+
+import numpy as np
+from qdrant_client import QdrantClient, models
+
+from realtime_phone_agents.infrastructure.superlinked.constants import NEIGHBORHOODS
+from realtime_phone_agents.infrastructure.superlinked.index import property_schema
+from realtime_phone_agents.infrastructure.superlinked.payload_indexes import (
+    declared_payload_indexes,
+    ensure_payload_indexes,
+    payload_field_name,
+)
+
+VECTOR_NAME = "bench_vector"
+UPLOAD_BATCH = 2048
+
+LOCATION = payload_field_name(property_schema.location)
+ROOMS = payload_field_name(property_schema.rooms)
+BATHS = payload_field_name(property_schema.baths)
+SQFT = payload_field_name(property_schema.sqft)
+PRICE = payload_field_name(property_schema.price)
+
+
+def synthetic_payloads(rng: np.random.Generator, count: int) -> list[dict]:
+    rooms = rng.integers(1, 7, size=count)
+    sqft = rng.integers(300, 2000, size=count)
+    price = rng.integers(100_000, 3_000_000, size=count)
+    locations = rng.integers(0, len(NEIGHBORHOODS), size=count)
+    return [
+        {
+            LOCATION: NEIGHBORHOODS[locations[i]],
+            ROOMS: int(rooms[i]),
+            BATHS: int(max(1, rooms[i] - 1)),
+            SQFT: int(sqft[i]),
+            PRICE: int(price[i]),
+        }
+        for i in range(count)
+    ]
+
+
+def load_collection(client: QdrantClient, name: str, size: int, dim: int) -> None:
+    if client.collection_exists(name):
+        client.delete_collection(name)
+    client.create_collection(
+        name,
+        vectors_config={VECTOR_NAME: models.VectorParams(size=dim, distance=models.Distance.DOT)},
+    )
+    rng = np.random.default_rng(0)
+    for start in range(0, size, UPLOAD_BATCH):
+        count = min(UPLOAD_BATCH, size - start)
+        vectors = rng.standard_normal((count, dim), dtype=np.float32)
+        vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+        client.upload_collection(
+            name,
+            vectors={VECTOR_NAME: vectors},
+            payload=synthetic_payloads(rng, count),
+            ids=range(start, start + count),
+            batch_size=UPLOAD_BATCH,
+            wait=True,
+        )
+
+
+def random_filters(rng: np.random.Generator, count: int) -> list[models.Filter]:
+    """Filters like the ones the agent sends: a neighborhood, rooms and a budget."""
+    return [
+        models.Filter(
+            must=[
+                models.FieldCondition(
+                    key=LOCATION,
+                    match=models.MatchValue(value=NEIGHBORHOODS[rng.integers(len(NEIGHBORHOODS))]),
+                ),
+                models.FieldCondition(key=ROOMS, range=models.Range(gte=int(rng.integers(1, 5)))),
+                models.FieldCondition(
+                    key=PRICE, range=models.Range(lte=int(rng.integers(300_000, 1_500_000)))
+                ),
+            ]
+        )
+        for _ in range(count)
+    ]
+
+
+def search_latencies(
+    client: QdrantClient, name: str, dim: int, filters: list[models.Filter]
+) -> np.ndarray:
+    rng = np.random.default_rng(1)
+    latencies = []
+    for query_filter in filters:
+        query = rng.standard_normal(dim, dtype=np.float32)
+        start = time.perf_counter()
+        client.query_points(
+            name,
+            query=query.tolist(),
+            using=VECTOR_NAME,
+            query_filter=query_filter,
+            limit=3,
+            search_params=models.SearchParams(exact=True),
+            with_payload=True,
+        )
+        latencies.append(time.perf_counter() - start)
+    return np.array(latencies) * 1000
+
+
+def wait_until_green(client: QdrantClient, name: str, timeout_s: float = 600) -> None:
+    deadline = time.monotonic() + timeout_s
+    while client.get_collection(name).status != models.CollectionStatus.GREEN:
+        if time.monotonic() > deadline:
+            raise TimeoutError(f"Collection {name} didn't finish indexing")
+        time.sleep(0.5)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--url", default="http://localhost:6333")
+    parser.add_argument("--api-key", default=None)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument(
+        "--dim", type=int, default=128, help="Vector size (the real index uses 386)"
+    )
+    parser.add_argument("--queries", type=int, default=100)
+    parser.add_argument("--keep", action="store_true", help="Keep the scratch collections")
+    args = parser.parse_args()
+
+    local = args.url == ":memory:"
+    if local:
+        client = QdrantClient(location=":memory:")
+        print("Local mode stand-in: payload indexes are ignored\n")
+    else:
+        client = QdrantClient(url=args.url, api_key=args.api_key, timeout=300)
+
+    filters = random_filters(np.random.default_rng(2), args.queries)
+    declared = declared_payload_indexes()
+
+    print(
+        f"{'listings':>10} | {'no index p50':>12} | {'p95':>8} | "
+        f"{'indexed p50':>11} | {'p95':>8} | {'speedup':>7}"
+    )
+    print("-" * 74)
+
+    for size in args.sizes:
+        name = f"bench_payload_indexes_{size}"
+        load_collection(client, name, size, args.dim)
+        wait_until_green(client, name)
+        search_latencies(client, name, args.dim, filters[:10])  # warm up
+        before = search_latencies(client, name, args.dim, filters)
+
+        if local:
+            for field_name, schema_type in declared.items():
+                client.create_payload_index(name, field_name, schema_type)
+        else:
+            ensure_payload_indexes(client, name, declared)
+            wait_until_green(client, name)
+        search_latencies(client, name, args.dim, filters[:10])
+        after = search_latencies(client, name, args.dim, filters)
+
+        p50_before, p95_before = np.percentile(before, [50, 95])
+        p50_after, p95_after = np.percentile(after, [50, 95])
+        print(
+            f"{size:>10} | {p50_before:>9.2f} ms | {p95_before:>5.2f} ms | "
+            f"{p50_after:>8.2f} ms | {p95_after:>5.2f} ms | {p50_before / p50_after:>6.1f}x"
+        )
+
+        if not args.keep:
+            client.delete_collection(name)
+
+
+if __name__ == "__main__":
+    main()
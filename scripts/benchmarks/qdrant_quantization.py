@@ -0,0 +1,187 @@
+"""
+Recall and latency report of the Qdrant storage options on the property vectors.
+
+Copies the vectors of the ingested property collection (`make ingest-properties`)
+into scratch collections, one per storage option, optionally replicated with
+small perturbations to reach catalog sizes. Every option answers the same
+approximate (HNSW) searches, compared against exact float32 search:
+
+- recall@k: share of the exact top-k found
+- p50 / p95 search latency
+- RAM per vector: original vectors (unless on disk) plus quantized ones,
+  page cache of on-disk data excluded
+
+Usage:
+    uv run python scripts/benchmarks/qdrant_quantization.py
+    uv run python scripts/benchmarks/qdrant_quantization.py --replicate 200 --k 3
+"""
+
+import argparse
+import time
+
+import numpy as np
+from qdrant_client import QdrantClient, models
+
+from realtime_phone_agents.config import settings
+from realtime_phone_agents.infrastructure.superlinked.qdrant_connection import (
+    qdrant_client_params,
+    qdrant_url,
+)
+from realtime_phone_agents.infrastructure.superlinked.qdrant_storage import (
+    apply_storage_options,
+    quantization_search_params,
+)
+
+SOURCE_COLLECTION = "default"  # Superlinked's APP_ID
+SCRATCH_PREFIX = "bench_quantization"
+
+# name, quantization, oversampling, rescore, on_disk
+OPTIONS = [
+    ("float32", "none", 1.0, False, False),
+    ("float32 on disk", "none", 1.0, False, True),
+    ("scalar", "scalar", 1.0, False, False),
+    ("scalar rescore x2", "scalar", 2.0, True, False),
+    ("scalar rescore x2 on disk", "scalar", 2.0, True, True),
+    ("binary", "binary", 1.0, False, False),
+    ("binary rescore x3", "binary", 3.0, True, False),
+    ("binary rescore x3 on disk", "binary", 3.0, True, True),
+]
+
+
+def load_property_vectors(client: QdrantClient) -> tuple[str, np.ndarray]:
+    """Read every vector of the property collection."""
+    vectors_config = client.get_collection(SOURCE_COLLECTION).config.params.vectors
+    vector_name = next(iter(vectors_config))
+
+    vectors, offset = [], None
+    while True:
+        points, offset = client.scroll(
+            SOURCE_COLLECTION, limit=256, offset=offset, with_vectors=[vector_name]
+        )
+        vectors.extend(point.vector[vector_name] for point in points)
+        if offset is None:
+            break
+    return vector_name, np.array(vectors, dtype=np.float32)
+
+
+def replicate(vectors: np.ndarray, copies: int, noise: float, seed: int = 0) -> np.ndarray:
+    """Grow the catalog with perturbed copies of the property vectors."""
+    rng = np.random.default_rng(seed)
+    scale = noise * np.abs(vectors).mean()
+    parts = [vectors] + [
+        vectors + rng.normal(0, scale, vectors.shape).astype(np.float32)
+        for _ in range(copies - 1)
+    ]
+    return np.concatenate(parts)
+
+
+def create_collection(
+    client: QdrantClient, name: str, vector_name: str, vectors: np.ndarray, option: tuple
+) -> None:
+    _, quantization, _, _, on_disk = option
+    if client.collection_exists(name):
+        client.delete_collection(name)
+    client.create_collection(
+        name,
+        vectors_config={
+            vector_name: models.VectorParams(
+                size=vectors.shape[1], distance=models.Distance.DOT
+            )
+        },
+    )
+    apply_storage_options(client, name, quantization=quantization, on_disk=on_disk)
+    client.upload_collection(
+        name, vectors={vector_name: vectors}, ids=range(len(vectors)), batch_size=512
+    )
+    while client.get_collection(name).status != models.CollectionStatus.GREEN:
+        time.sleep(0.5)
+
+
+def search(
+    client: QdrantClient,
+    name: str,
+    vector_name: str,
+    queries: np.ndarray,
+    k: int,
+    search_params: models.SearchParams,
+) -> tuple[list[set[int]], np.ndarray]:
+    results, latencies = [], []
+    for query in queries:
+        start = time.perf_counter()
+        response = client.query_points(
+            name, query=query.tolist(), using=vector_name, limit=k, search_params=search_params
+        )
+        latencies.append(time.perf_counter() - start)
+        results.append({point.id for point in response.points})
+    return results, np.array(latencies) * 1000
+
+
+def ram_bytes_per_vector(dim: int, quantization: str, on_disk: bool) -> int:
+    original = 0 if on_disk else dim * 4
+    quantized = {"none": 0, "scalar": dim, "binary": (dim + 7) // 8}[quantization]
+    return original + quantized
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--url", default=qdrant_url())
+    parser.add_argument("--api-key", default=settings.qdrant.api_key or None)
+    parser.add_argument("--replicate", type=int, default=40, help="Copies of the catalog")
+    parser.add_argument("--noise", type=float, default=0.05)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--k", type=int, default=3)
+    parser.add_argument("--keep", action="store_true", help="Keep the scratch collections")
+    args = parser.parse_args()
+
+    client = QdrantClient(url=args.url, api_key=args.api_key, **qdrant_client_params())
+    vector_name, vectors = load_property_vectors(client)
+    catalog = replicate(vectors, args.replicate, args.noise)
+
+    rng = np.random.default_rng(1)
+    queries = catalog[rng.integers(0, len(catalog), args.queries)]
+    queries = queries + rng.normal(0, args.noise * np.abs(queries).mean(), queries.shape)
+
+    dim = catalog.shape[1]
+    print(f"Vectors: {len(catalog)} x {dim} | queries: {args.queries} | k: {args.k}\n")
+    print(
+        f"{'option':>26} | {'recall@k':>8} | {'p50 (ms)':>8} | {'p95 (ms)':>8} | "
+        f"{'RAM / vector':>12} | {'RAM total':>9}"
+    )
+    print("-" * 88)
+
+    truth = None
+    for option in OPTIONS:
+        name, quantization, oversampling, rescore, on_disk = option
+        collection = f"{SCRATCH_PREFIX}_{name.replace(' ', '_')}"
+        create_collection(client, collection, vector_name, catalog, option)
+
+        if truth is None:
+            exact = models.SearchParams(exact=True)
+            truth, _ = search(client, collection, vector_name, queries, args.k, exact)
+
+        params = models.SearchParams(
+            exact=False,
+            quantization=(
+                quantization_search_params(oversampling, rescore)
+                if quantization != "none"
+                else None
+            ),
+        )
+        search(client, collection, vector_name, queries[:20], args.k, params)  # warm up
+        found, latencies = search(client, collection, vector_name, queries, args.k, params)
+
+        recall = np.mean([len(f & t) / len(t) for f, t in zip(found, truth) if t])
+        p50, p95 = np.percentile(latencies, [50, 95])
+        per_vector = ram_bytes_per_vector(dim, quantization, on_disk)
+        total_mb = per_vector * len(catalog) / 1e6
+        print(
+            f"{name:>26} | {recall:>8.3f} | {p50:>8.2f} | {p95:>8.2f} | "
+            f"{per_vector:>10} B | {total_mb:>6.1f} MB"
+        )
+
+        if not args.keep:
+            client.delete_collection(collection)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+"""
+Benchmark Qdrant search and upsert over HTTP and gRPC.
+
+Runs the same workload through an AsyncQdrantClient (the client Superlinked
+searches and writes with) built with `qdrant_client_params` for each
+transport, on a scratch collection laid out like the property one:
+
+- latency: one request at a time (p50 / p95)
+- throughput: `--concurrency` requests in flight, as with concurrent calls
+
+Needs a running Qdrant with both ports open, e.g. from `make start-call-center`.
+
+Usage:
+    uv run python scripts/benchmarks/qdrant_transport.py
+    uv run python scripts/benchmarks/qdrant_transport.py --url http://localhost:6333 --concurrency 32
+"""
+
+import argparse
+import asyncio
+import time
+
+import numpy as np
+from qdrant_client import AsyncQdrantClient, models
+
+from realtime_phone_agents.config import settings
+from realtime_phone_agents.infrastructure.superlinked.qdrant_connection import (
+    qdrant_client_params,
+)
+
+COLLECTION = "bench_qdrant_transport"
+VECTOR_NAME = "bench_vector"
+TRANSPORTS = ["http", "grpc"]
+
+
+def random_points(rng: np.random.Generator, start: int, count: int, dim: int) -> list:
+    vectors = rng.standard_normal((count, dim), dtype=np.float32)
+    return [
+        models.PointStruct(
+            id=start + i,
+            vector={VECTOR_NAME: vectors[i].tolist()},
+            payload={"rooms": int(rng.integers(1, 6)), "price": int(rng.integers(1, 30)) * 50_000},
+        )
+        for i in range(count)
+    ]
+
+
+async def prepare_collection(client: AsyncQdrantClient, size: int, dim: int) -> None:
+    if await client.collection_exists(COLLECTION):
+        await client.delete_collection(COLLECTION)
+    await client.create_collection(
+        COLLECTION,
+        vectors_config={VECTOR_NAME: models.VectorParams(size=dim, distance=models.Distance.DOT)},
+    )
+    rng = np.random.default_rng(0)
+    for start in range(0, size, 1000):
+        await client.upsert(COLLECTION, random_points(rng, start, min(1000, size - start), dim))
+
+
+def search_request(client: AsyncQdrantClient, rng: np.random.Generator, dim: int):
+    return client.query_points(
+        COLLECTION,
+        query=rng.standard_normal(dim, dtype=np.float32).tolist(),
+        using=VECTOR_NAME,
+        query_filter=models.Filter(
+            must=[models.FieldCondition(key="rooms", range=models.Range(gte=2))]
+        ),
+        limit=3,
+        search_params=models.SearchParams(exact=True),
+        with_payload=True,
+    )
+
+
+def upsert_request(client: AsyncQdrantClient, rng: np.random.Generator, dim: int):
+    # Overwrite random existing points, the collection size stays the same
+    start = int(rng.integers(0, 1000))
+    return client.upsert(COLLECTION, random_points(rng, start, 10, dim), wait=True)
+
+
+async def latencies(make_request, requests: int) -> np.ndarray:
+    durations = []
+    for _ in range(requests):
+        start = time.perf_counter()
+        await make_request()
+        durations.append(time.perf_counter() - start)
+    return np.array(durations) * 1000
+
+
+async def throughput(make_request, requests: int, concurrency: int) -> float:
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one():
+        async with semaphore:
+            await make_request()
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(requests)))
+    return requests / (time.perf_counter() - start)
+
+
+async def run(args) -> None:
+    rng = np.random.default_rng(1)
+    results = []
+
+    for transport in TRANSPORTS:
+        client = AsyncQdrantClient(
+            url=args.url, api_key=args.api_key, **qdrant_client_params(transport=transport)
+        )
+        if transport == TRANSPORTS[0]:
+            await prepare_collection(client, args.points, args.dim)
+
+        for path, request in [("search", search_request), ("upsert", upsert_request)]:
+
+            def make_request():
+                return request(client, rng, args.dim)
+
+            await latencies(make_request, 20)  # warm up the connections
+            lat = await latencies(make_request, args.requests)
+            qps = await throughput(make_request, args.requests, args.concurrency)
+            results.append((transport, path, *np.percentile(lat, [50, 95]), qps))
+
+        await client.close()
+
+    print(f"Points: {args.points} | dim: {args.dim} | concurrency: {args.concurrency}\n")
+    print(f"{'transport':>9} | {'path':>6} | {'p50 (ms)':>8} | {'p95 (ms)':>8} | {'req/s':>8}")
+    print("-" * 52)
+    for transport, path, p50, p95, qps in results:
+        print(f"{transport:>9} | {path:>6} | {p50:>8.2f} | {p95:>8.2f} | {qps:>8.0f}")
+
+    if not args.keep:
+        client = AsyncQdrantClient(url=args.url, api_key=args.api_key)
+        await client.delete_collection(COLLECTION)
+        await client.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--url", default=f"http://localhost:{settings.qdrant.port}")
+    parser.add_argument("--api-key", default=None)
+    parser.add_argument("--points", type=int, default=20_000)
+    parser.add_argument("--dim", type=int, default=386, help="Vector size of the property index")
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--keep", action="store_true", help="Keep the scratch collection")
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
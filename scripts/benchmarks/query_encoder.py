@@ -0,0 +1,162 @@
+"""
+Compare the query encoders of the description space: torch, int8 and onnx.
+
+Builds one `QueryEncoderEngine` per encoder on the space's embedding model
+and embeds the same search queries, one per call like the agent's searches,
+through each of them:
+
+- p50 / p95 latency and CPU time (all threads) per query, without cache
+- cosine agreement with the torch encoder: lowest and mean over the queries
+- the same queries through the LRU cache, reworded the way transcriptions
+  vary (case, spacing, trailing punctuation): hit rate and p50 latency
+
+Usage:
+    uv run python scripts/benchmarks/query_encoder.py
+    uv run python scripts/benchmarks/query_encoder.py --encoders torch int8 --threads 4
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+
+import numpy as np
+from loguru import logger
+
+from realtime_phone_agents.infrastructure.superlinked.index import description_space
+from realtime_phone_agents.infrastructure.superlinked.query_encoder import (
+    QueryEncoderEngine,
+)
+
+ENCODERS = ["torch", "int8", "onnx"]
+REFERENCE = "torch"
+
+FEATURES = [
+    "bright apartment",
+    "renovated flat",
+    "luxury property",
+    "family home",
+    "exterior apartment",
+    "penthouse",
+    "studio",
+    "duplex",
+]
+DETAILS = [
+    "with a terrace",
+    "close to the metro",
+    "with a swimming pool",
+    "with parking",
+    "with a balcony and elevator",
+    "with views of the park",
+    "with a private garden",
+    "near the university",
+]
+
+
+def random_queries(count: int, seed: int = 0) -> list[str]:
+    rng = np.random.default_rng(seed)
+    return [
+        f"{FEATURES[rng.integers(len(FEATURES))]} {DETAILS[rng.integers(len(DETAILS))]}"
+        for _ in range(count)
+    ]
+
+
+def reword(query: str, seed: int) -> str:
+    """The same query as a different transcription could write it."""
+    variants = [
+        query.capitalize() + ".",
+        query.upper(),
+        "  " + query.replace(" ", "  ") + "?",
+        query,
+    ]
+    return variants[seed % len(variants)]
+
+
+def build_engine(encoder: str, threads: int, cache_size: int) -> QueryEncoderEngine | None:
+    config = description_space.transformation_config.embedding_config
+    engine = QueryEncoderEngine(
+        config.model_name,
+        config.model_cache_dir,
+        config.embedding_engine_config,
+        encoder=encoder,
+        threads=threads,
+        cache_size=cache_size,
+        min_cosine=-1.0,  # report the agreement instead of dropping the encoder
+    )
+    if engine.query_encoder != encoder:
+        print(f"Skipping {encoder}: the encoder failed to load")
+        return None
+    return engine
+
+
+def time_queries(engine: QueryEncoderEngine, queries: list[str]):
+    vectors, wall, cpu = [], [], []
+    for query in queries:
+        wall_start, cpu_start = time.perf_counter(), time.process_time()
+        [vector] = engine.encode_queries([query])
+        cpu.append(time.process_time() - cpu_start)
+        wall.append(time.perf_counter() - wall_start)
+        vectors.append(vector)
+    return np.stack(vectors), np.array(wall) * 1000, np.array(cpu) * 1000
+
+
+async def time_cached_queries(engine: QueryEncoderEngine, queries: list[str]) -> np.ndarray:
+    engine.cache.clear()
+    durations = []
+    for i, query in enumerate(queries):
+        start = time.perf_counter()
+        await engine.embed([reword(query, i)], is_query_context=True)
+        durations.append(time.perf_counter() - start)
+    return np.array(durations) * 1000
+
+
+def cosine(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    return (a * b).sum(axis=1) / (np.linalg.norm(a, axis=1) * np.linalg.norm(b, axis=1))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--encoders", nargs="+", choices=ENCODERS, default=ENCODERS)
+    parser.add_argument("--queries", type=int, default=300)
+    parser.add_argument("--threads", type=int, default=2, help="onnx encoder threads, 0 for the defaults")
+    parser.add_argument("--cache-size", type=int, default=1024)
+    args = parser.parse_args()
+
+    logger.remove()
+    logger.add(sys.stderr, level="WARNING")
+
+    queries = random_queries(args.queries)
+    distinct = len(set(queries))
+
+    rows, vectors = {}, {}
+    for encoder in dict.fromkeys([REFERENCE, *args.encoders]):
+        engine = build_engine(encoder, args.threads, args.cache_size)
+        if engine is None:
+            continue
+        engine.encode_queries(queries[:10])  # warm up
+        vectors[encoder], wall, cpu = time_queries(engine, queries)
+        cached = asyncio.run(time_cached_queries(engine, queries))
+        hit_rate = engine.cache.hits / (engine.cache.hits + engine.cache.misses)
+        rows[encoder] = (wall, cpu, cached, hit_rate)
+
+    print(
+        f"\nModel: {description_space.transformation_config.embedding_config.model_name} | "
+        f"queries: {args.queries} ({distinct} distinct) | threads: {args.threads or 'default'}\n"
+    )
+    print(
+        f"{'encoder':>7} | {'p50 (ms)':>8} | {'p95 (ms)':>8} | {'cpu p50':>7} | {'cpu p95':>7} | "
+        f"{'min cos':>7} | {'mean cos':>8} | {'hit rate':>8} | {'cached p50':>10}"
+    )
+    print("-" * 96)
+    for encoder, (wall, cpu, cached, hit_rate) in rows.items():
+        agreement = cosine(vectors[REFERENCE], vectors[encoder])
+        print(
+            f"{encoder:>7} | {np.percentile(wall, 50):>8.2f} | {np.percentile(wall, 95):>8.2f} | "
+            f"{np.percentile(cpu, 50):>7.2f} | {np.percentile(cpu, 95):>7.2f} | "
+            f"{agreement.min():>7.4f} | {agreement.mean():>8.4f} | "
+            f"{hit_rate:>8.1%} | {np.percentile(cached, 50):>10.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,198 @@
+"""
+Compare the property search backends: Qdrant, InMemoryExecutor and NumPy.
+
+Builds one `PropertySearchService` per backend on the same catalog and runs
+the same structured searches (the params `property_search_query` gets from
+its natural query parsing, without the OpenAI call) through each of them:
+
+- match: top-k ids of every backend against the InMemoryExecutor ones.
+  Different ids are tolerated where the scores tie (within `--tolerance`,
+  Qdrant stores float16 vectors)
+- p50 / p95 search latency, query embedding included
+
+The Qdrant backend ingests into the property collection, so it only runs on
+the catalog as is (no `--replicate`) and is skipped if Qdrant is unreachable.
+
+Usage:
+    uv run python scripts/benchmarks/search_backends.py
+    uv run python scripts/benchmarks/search_backends.py --replicate 40 --backends in_memory numpy
+"""
+
+import argparse
+import asyncio
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from loguru import logger
+
+from realtime_phone_agents.config import settings
+from realtime_phone_agents.infrastructure.superlinked.constants import NEIGHBORHOODS
+from realtime_phone_agents.infrastructure.superlinked.query import (
+    structured_property_search_query,
+)
+from realtime_phone_agents.infrastructure.superlinked.service import (
+    PropertySearchService,
+)
+
+BACKENDS = ["in_memory", "numpy", "qdrant"]
+REFERENCE = "in_memory"
+
+DESCRIPTIONS = [
+    None,
+    "bright apartment with a terrace",
+    "renovated flat close to the metro",
+    "luxury property with a swimming pool",
+    "quiet family home with parking",
+    "exterior apartment with a balcony and elevator",
+]
+
+
+def random_searches(count: int, seed: int = 0) -> list[dict]:
+    """Structured search params, each filter set or left out at random."""
+    rng = np.random.default_rng(seed)
+
+    def maybe(value):
+        return value if rng.random() < 0.5 else None
+
+    return [
+        {
+            "description_query": DESCRIPTIONS[rng.integers(len(DESCRIPTIONS))],
+            "location": maybe(NEIGHBORHOODS[rng.integers(len(NEIGHBORHOODS))]),
+            "min_rooms": maybe(int(rng.integers(1, 5))),
+            "min_baths": maybe(int(rng.integers(1, 3))),
+            "sqft_bigger_than": maybe(int(rng.integers(4, 20)) * 10),
+            "price_smaller_than": maybe(int(rng.integers(2, 30)) * 100_000),
+            "description_weight": 1.0,
+            "size_weight": float(rng.choice([0.0, 0.5])),
+            "price_weight": float(rng.choice([0.0, 0.5])),
+        }
+        for _ in range(count)
+    ]
+
+
+def replicate_catalog(path: str, copies: int, directory: str) -> str:
+    """Write the catalog repeated `copies` times, with new ids, to a CSV file."""
+    df = pd.read_csv(path)
+    step = int(df["id"].max()) + 1
+    df = pd.concat([df.assign(id=df["id"] + i * step) for i in range(copies)])
+    replicated = Path(directory) / "properties.csv"
+    df.to_csv(replicated, index=False)
+    return str(replicated)
+
+
+def build_service(backend: str, data_path: str) -> PropertySearchService | None:
+    service = PropertySearchService(
+        qdrant_host=settings.qdrant.host,
+        qdrant_port=settings.qdrant.port,
+        qdrant_api_key=settings.qdrant.api_key,
+        qdrant_cluster_url=settings.qdrant.cluster_url,
+        qdrant_use_cloud=settings.qdrant.use_qdrant_cloud,
+        search_backend=backend,
+        qdrant_transport=settings.qdrant.transport,
+    )
+    if service.backend != backend:
+        print(f"Skipping {backend}: the service fell back to {service.backend}")
+        return None
+
+    start = time.perf_counter()
+    service.ingest_properties(data_path)
+    print(f"{backend}: ingested in {time.perf_counter() - start:.1f} s")
+    return service
+
+
+async def run_searches(
+    service: PropertySearchService, searches: list[dict], k: int
+) -> tuple[list[list[tuple[str, float]]], np.ndarray]:
+    results, durations = [], []
+    for params in searches:
+        start = time.perf_counter()
+        result = await service.app.async_query(
+            structured_property_search_query, **params, limit=k
+        )
+        durations.append(time.perf_counter() - start)
+        results.append([(entry.id, entry.metadata.score) for entry in result.entries])
+    return results, np.array(durations) * 1000
+
+
+def compare(
+    reference: list[tuple[str, float]], candidate: list[tuple[str, float]], tolerance: float
+) -> str:
+    """Return "match", "tie" (ids differ only where scores tie) or "mismatch"."""
+    if [i for i, _ in reference] == [i for i, _ in candidate]:
+        return "match"
+    if len(reference) != len(candidate):
+        return "mismatch"
+    for (ref_id, ref_score), (cand_id, cand_score) in zip(reference, candidate):
+        if ref_id != cand_id and abs(ref_score - cand_score) > tolerance:
+            return "mismatch"
+    return "tie"
+
+
+async def run(args) -> bool:
+    with tempfile.TemporaryDirectory() as directory:
+        data_path = args.data
+        backends = args.backends
+        if args.replicate > 1:
+            data_path = replicate_catalog(args.data, args.replicate, directory)
+            backends = [b for b in backends if b != "qdrant"]
+
+        catalog_size = len(pd.read_csv(data_path))
+        searches = random_searches(args.queries)
+
+        timings, outputs = {}, {}
+        for backend in dict.fromkeys([REFERENCE, *backends]):
+            service = build_service(backend, data_path)
+            if service is None:
+                continue
+            await run_searches(service, searches[:10], args.k)  # warm up
+            outputs[backend], timings[backend] = await run_searches(
+                service, searches, args.k
+            )
+
+    print(f"\nCatalog: {catalog_size} properties | searches: {args.queries} | k: {args.k}\n")
+    print(
+        f"{'backend':>9} | {'p50 (ms)':>8} | {'p95 (ms)':>8} | "
+        f"{'match':>5} | {'tie':>5} | {'mismatch':>8}"
+    )
+    print("-" * 58)
+
+    consistent = True
+    for backend, latencies in timings.items():
+        tolerance = args.tolerance * (10 if backend == "qdrant" else 1)
+        verdicts = [
+            compare(ref, cand, tolerance)
+            for ref, cand in zip(outputs[REFERENCE], outputs[backend])
+        ]
+        mismatches = verdicts.count("mismatch")
+        consistent &= mismatches == 0
+        p50, p95 = np.percentile(latencies, [50, 95])
+        print(
+            f"{backend:>9} | {p50:>8.2f} | {p95:>8.2f} | "
+            f"{verdicts.count('match'):>5} | {verdicts.count('tie'):>5} | {mismatches:>8}"
+        )
+    return consistent
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--data", default="data/properties.csv")
+    parser.add_argument("--backends", nargs="+", choices=BACKENDS, default=BACKENDS)
+    parser.add_argument("--replicate", type=int, default=1, help="Copies of the catalog")
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--k", type=int, default=3)
+    parser.add_argument("--tolerance", type=float, default=1e-4, help="Score tie tolerance")
+    args = parser.parse_args()
+
+    logger.remove()
+    logger.add(sys.stderr, level="WARNING")
+
+    if not asyncio.run(run(args)):
+        sys.exit("Backends returned different results")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Benchmark the SNAC decoder backends on CPU.
+
+Decodes the same Orpheus-sized code windows (4 frames, 28 tokens) with every
+backend and reports the real-time factor (decode time / audio duration, lower
+is better) and the worst-case SNR against the torch reference, checked
+against `orpheus.snac_min_snr_db`.
+
+Usage:
+    uv run python scripts/benchmarks/snac_backends.py
+    uv run python scripts/benchmarks/snac_backends.py --threads 2 --windows 200
+"""
+
+import argparse
+import time
+from typing import get_args
+
+import torch
+
+from realtime_phone_agents.config import settings
+from realtime_phone_agents.tts.runpod.orpheus.snac_backends import (
+    OnnxSNACBackend,
+    SNACBackend,
+    SNACBackendName,
+    TorchSNACBackend,
+    measure_snr,
+    random_code_windows,
+)
+
+BACKENDS = list(get_args(SNACBackendName))
+SAMPLE_RATE = 24000
+WINDOW_SAMPLES = 2048  # audio kept per decoded window
+WARMUP_WINDOWS = 5
+
+
+def real_time_factor(backend: SNACBackend, windows) -> float:
+    for codes in windows[:WARMUP_WINDOWS]:
+        backend.decode(codes)
+
+    start = time.perf_counter()
+    for codes in windows:
+        backend.decode(codes)
+    elapsed = time.perf_counter() - start
+
+    return elapsed / (len(windows) * WINDOW_SAMPLES / SAMPLE_RATE)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--threads", type=int, default=settings.orpheus.decode_torch_threads)
+    parser.add_argument("--windows", type=int, default=100)
+    args = parser.parse_args()
+
+    torch.set_num_threads(args.threads)
+    windows = random_code_windows(args.windows, seed=1)
+    reference = TorchSNACBackend()
+    min_snr_db = settings.orpheus.snac_min_snr_db
+
+    print(f"Windows: {args.windows} | threads: {args.threads} | min SNR: {min_snr_db} dB\n")
+    print(f"{'backend':>10} | {'RTF':>6} | {'x real time':>11} | {'SNR (dB)':>9} | {'ok':>3}")
+    print("-" * 52)
+
+    for name in BACKENDS:
+        try:
+            backend = (
+                reference
+                if name == "torch"
+                else OnnxSNACBackend(quantized=name == "onnx-int8", threads=args.threads)
+            )
+        except Exception as e:
+            print(f"{name:>10} | unavailable: {e}")
+            continue
+
+        rtf = real_time_factor(backend, windows)
+        snr = measure_snr(backend, reference, windows[:20])
+        ok = "yes" if snr >= min_snr_db else "no"
+        print(f"{name:>10} | {rtf:>6.3f} | {1 / rtf:>11.1f} | {snr:>9.1f} | {ok:>3}")
+
+
+if __name__ == "__main__":
+    main()
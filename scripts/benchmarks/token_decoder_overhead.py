@@ -0,0 +1,145 @@
+"""
+Benchmark the per-utterance overhead of the Orpheus token decoders.
+
+Compares the previous sync decoder, which bridged to the async one through a
+new thread, event loop and queue per utterance, against the sync and async
+generators over the shared TokenDecoder core. SNAC decoding is replaced by a
+no-op so only the decoder plumbing is measured. The async generator hands
+every window to a worker thread, off the event loop, so its time includes
+that hop.
+
+Both modes are first checked against the reference bridge: every mode must
+yield the same windows, in the same order, for the same token stream.
+
+Usage:
+    uv run python scripts/benchmarks/token_decoder_overhead.py
+"""
+
+import asyncio
+import queue
+import threading
+import time
+
+from realtime_phone_agents.tts.runpod.orpheus.options import CUSTOM_TOKEN_PREFIX
+from realtime_phone_agents.tts.runpod.orpheus.token_decoders import (
+    tokens_decoder,
+    tokens_decoder_sync,
+)
+
+TOKENS_PER_UTTERANCE = 1200
+UTTERANCES = 200
+
+
+def token_stream(num_tokens: int = TOKENS_PER_UTTERANCE) -> list[str]:
+    """Token strings as Orpheus streams them, with a few skipped (non-positive) codes."""
+    tokens = []
+    for i in range(num_tokens):
+        if i % 97 == 0:
+            tokens.append(f"{CUSTOM_TOKEN_PREFIX}5>")
+        tokens.append(f"{CUSTOM_TOKEN_PREFIX}{10 + (i % 7) * 4096 + 1 + i % 4000}>")
+    return tokens
+
+
+def decode_noop(window: list[int], count: int) -> tuple[int, ...]:
+    return tuple(window)
+
+
+def legacy_tokens_decoder_sync(syn_token_gen):
+    """The previous sync decoder: a thread and an event loop per utterance."""
+    audio_queue = queue.Queue()
+
+    async def async_token_gen():
+        for token in syn_token_gen:
+            yield token
+
+    async def async_producer():
+        async for audio_chunk in tokens_decoder(async_token_gen(), decode=decode_noop):
+            audio_queue.put(audio_chunk)
+        audio_queue.put(None)
+
+    thread = threading.Thread(target=lambda: asyncio.run(async_producer()))
+    thread.start()
+
+    while True:
+        audio = audio_queue.get()
+        if audio is None:
+            break
+        yield audio
+
+    thread.join()
+
+
+def run_sync(tokens: list[str]) -> list:
+    return list(tokens_decoder_sync(iter(tokens), decode=decode_noop))
+
+
+def run_async(tokens: list[str]) -> list:
+    async def token_gen():
+        for token in tokens:
+            yield token
+
+    async def collect():
+        return [chunk async for chunk in tokens_decoder(token_gen(), decode=decode_noop)]
+
+    return asyncio.run(collect())
+
+
+def check_modes(tokens: list[str]) -> None:
+    expected = list(legacy_tokens_decoder_sync(iter(tokens)))
+    assert expected, "The reference decoder yielded nothing"
+    assert run_sync(tokens) == expected, "Sync decoder disagrees with the reference"
+    assert run_async(tokens) == expected, "Async decoder disagrees with the reference"
+
+    # Streams shorter than one window yield nothing, in every mode
+    short = tokens[:20]
+    assert list(legacy_tokens_decoder_sync(iter(short))) == []
+    assert run_sync(short) == run_async(short) == []
+    print(f"Sync and async modes match the reference ({len(expected)} windows)\n")
+
+
+def time_per_utterance(decode, tokens: list[str]) -> float:
+    start = time.perf_counter()
+    for _ in range(UTTERANCES):
+        for _ in decode(iter(tokens)):
+            pass
+    return (time.perf_counter() - start) / UTTERANCES
+
+
+def time_async_per_utterance(tokens: list[str]) -> float:
+    async def token_gen():
+        for token in tokens:
+            yield token
+
+    async def run():
+        start = time.perf_counter()
+        for _ in range(UTTERANCES):
+            async for _ in tokens_decoder(token_gen(), decode=decode_noop):
+                pass
+        return (time.perf_counter() - start) / UTTERANCES
+
+    return asyncio.run(run())
+
+
+def main():
+    tokens = token_stream()
+    check_modes(tokens)
+
+    legacy = time_per_utterance(legacy_tokens_decoder_sync, tokens)
+    sync = time_per_utterance(
+        lambda gen: tokens_decoder_sync(gen, decode=decode_noop), tokens
+    )
+    native_async = time_async_per_utterance(tokens)
+
+    print(f"{'decoder':>22} | {'ms / utterance':>14}")
+    print("-" * 40)
+    for name, seconds in [
+        ("thread + loop bridge", legacy),
+        ("sync generator", sync),
+        ("async generator", native_async),
+    ]:
+        print(f"{name:>22} | {seconds * 1000:>14.3f}")
+    print(f"\nOverhead removed per utterance: {(legacy - sync) * 1000:.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
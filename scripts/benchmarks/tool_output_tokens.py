@@ -0,0 +1,66 @@
+"""
+Benchmark the prompt tokens spent on search_property_tool output.
+
+Compares the previous pretty-printed full-record JSON against the compact
+summaries returned to the agent, per tool call and accumulated over a
+conversation (every tool output stays in the checkpointed history).
+
+Usage:
+    uv run python scripts/benchmarks/tool_output_tokens.py
+"""
+
+import json
+from pathlib import Path
+from statistics import mean
+
+import pandas as pd
+
+from realtime_phone_agents.agent.tools.formatting import format_properties
+
+PROPERTIES_PATH = Path(__file__).parent.parent.parent / "data" / "properties.csv"
+LIMITS = [1, 3, 5]
+CONVERSATION_SEARCHES = 6
+
+
+def get_token_counter():
+    """Return a token counting function, using tiktoken when available."""
+    try:
+        import tiktoken
+
+        encoding = tiktoken.get_encoding("o200k_base")
+        return (lambda text: len(encoding.encode(text))), "tiktoken o200k_base"
+    except Exception:
+        return (lambda text: len(text) // 4), "approximation (chars / 4)"
+
+
+def main():
+    df = pd.read_csv(PROPERTIES_PATH)
+    records = json.loads(df.to_json(orient="records"))
+    count_tokens, tokenizer_name = get_token_counter()
+
+    print(f"Properties: {len(records)} | Tokenizer: {tokenizer_name}\n")
+    print(f"{'limit':>5} | {'before':>8} | {'after':>8} | {'saved':>6} | {'per conversation':>22}")
+    print("-" * 62)
+
+    for limit in LIMITS:
+        before, after = [], []
+        for start in range(0, len(records) - limit + 1, limit):
+            window = records[start : start + limit]
+            before.append(count_tokens(format_properties(window, compact=False)))
+            after.append(count_tokens(format_properties(window, compact=True)))
+
+        saved = 1 - mean(after) / mean(before)
+        conversation = (
+            f"{mean(before) * CONVERSATION_SEARCHES:,.0f} -> "
+            f"{mean(after) * CONVERSATION_SEARCHES:,.0f}"
+        )
+        print(
+            f"{limit:>5} | {mean(before):>8.0f} | {mean(after):>8.0f} | "
+            f"{saved:>6.0%} | {conversation:>22}"
+        )
+
+    print(f"\nPer conversation assumes {CONVERSATION_SEARCHES} searches kept in history.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,36 @@
+"""
+Check how much of every avatar's system prompt is cacheable by the provider.
+
+Provider-side prompt caching only hits on a byte-identical prompt prefix, so
+the prefix shared by all avatars should cover the rules and examples.
+
+Usage:
+    uv run python scripts/check_prompt_prefix.py
+"""
+
+from realtime_phone_agents.avatars.base import SHARED_SYSTEM_PROMPT
+from realtime_phone_agents.avatars.registry import get_prompt_prefix_report
+
+
+def main():
+    report = get_prompt_prefix_report()
+
+    print(f"{'avatar':<8} | {'prompt chars':>12} | {'shared prefix':>13} | {'cacheable':>9}")
+    print("-" * 52)
+    for avatar_id, lengths in sorted(report.items()):
+        ratio = lengths["shared_prefix_chars"] / lengths["prompt_chars"]
+        print(
+            f"{avatar_id:<8} | {lengths['prompt_chars']:>12} | "
+            f"{lengths['shared_prefix_chars']:>13} | {ratio:>9.0%}"
+        )
+
+    shared_prefix = min(lengths["shared_prefix_chars"] for lengths in report.values())
+    if shared_prefix < len(SHARED_SYSTEM_PROMPT):
+        print("\n⚠️  Avatar prompts diverge before the end of SHARED_SYSTEM_PROMPT")
+        raise SystemExit(1)
+
+    print("\n✅ SHARED_SYSTEM_PROMPT is fully shared by all avatars")
+
+
+if __name__ == "__main__":
+    main()
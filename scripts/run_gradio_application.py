@@ -28,12 +28,14 @@ try:
 except (ImportError, AttributeError):
     pass
 
+import asyncio
 import sys
 
 import inquirer
 
 from realtime_phone_agents.agent.fastrtc_agent import FastRTCAgent
-from realtime_phone_agents.agent.tools.property_search import search_property_tool
+from realtime_phone_agents.agent.tools.property_search import get_property_tools
+from realtime_phone_agents.api.warmup import warm_up_tts
 from realtime_phone_agents.infrastructure.superlinked.service import (
     get_property_search_service,
 )
@@ -169,6 +171,9 @@ def main():
         if tts_model in ["together", "orpheus-runpod"]:
             print_info(f"Setting voice to {avatar} for {tts_model} model...")
             tts_model_instance.set_voice(avatar)
+
+        print_info(f"Warming up {tts_model} TTS model...")
+        asyncio.run(warm_up_tts(tts_model_instance))
         
         print_success("TTS model initialized")
     except Exception as e:
@@ -183,7 +188,7 @@ def main():
         agent = FastRTCAgent(
             stt_model=stt_model_instance,
             tts_model=tts_model_instance,
-            tools=[search_property_tool],
+            tools=get_property_tools(),
             thread_id=str("gradio-application-" + str(uuid4())),
             avatar=avatar,
         )
@@ -36,6 +36,8 @@ pod = runpod.create_pod(
         "QDRANT__API_KEY": settings.qdrant.api_key,
         "QDRANT__CLUSTER_URL": settings.qdrant.cluster_url,
         "QDRANT__USE_QDRANT_CLOUD": str(settings.qdrant.use_qdrant_cloud),
+        "QDRANT__TRANSPORT": settings.qdrant.transport,
+        "QDRANT__GRPC_PORT": str(settings.qdrant.grpc_port),
         
         # RunPod Configuration
         "RUNPOD__API_KEY": settings.runpod.api_key,
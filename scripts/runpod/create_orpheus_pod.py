@@ -28,4 +28,5 @@ print(f"Pod URL: {pod_url}")
 print(f"\n{'='*60}")
 print("Add the following to your .env file:")
 print(f"ORPHEUS__API_URL={pod_url}")
+print("(or append it to ORPHEUS__API_URLS to load balance across several pods)")
 print(f"{'='*60}\n")
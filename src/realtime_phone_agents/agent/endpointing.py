@@ -0,0 +1,385 @@
+"""
+Adaptive end-of-turn detection on top of fastrtc's ReplyOnPause.
+
+ReplyOnPause runs the VAD on 0.6 s chunks and ends the turn on the first one
+with (almost) no speech, so every turn waits between 0.6 and 1.2 s of silence
+before STT starts, whoever is speaking and however the turn ended.
+
+`AdaptiveReplyOnPause` runs the VAD on short windows instead and lets an
+`EndpointDetector` decide how much trailing silence ends the turn:
+
+- speaking rhythm: the lengths of the caller's pauses inside a turn are
+  learned online (exponential moving mean and variance). Once a few are
+  known, the wait is their mean plus `pause_margin_std` standard deviations,
+  so quick speakers get a short wait and hesitant ones a longer one
+- prosody: a turn whose last voiced window fades out (energy well below the
+  turn's median) is likely finished and waits less, one that stops abruptly
+  at full energy is likely mid-sentence and waits more
+- false cutoffs: when the caller speaks again right after a turn was ended,
+  the cutoff was premature. The silence is learned as a pause and the
+  caller's safety margin grows; it decays back on turns that ended well
+
+Each call gets its own handler copy, so the profile is learned per caller
+within the call.
+"""
+
+from collections import deque
+from dataclasses import dataclass, field
+
+import numpy as np
+from fastrtc import ReplyOnPause, SileroVadOptions
+from fastrtc.utils import create_message
+from loguru import logger
+
+from realtime_phone_agents.config import settings
+
+# VAD options for short windows: no padding or minimum duration longer than a window
+SHORT_WINDOW_VAD_OPTIONS = SileroVadOptions(
+    min_speech_duration_ms=60,
+    min_silence_duration_ms=100,
+    window_size_samples=512,
+    speech_pad_ms=0,
+)
+
+
+@dataclass
+class CallerProfile:
+    """Speaking rhythm of one caller, learned online within the call."""
+
+    pause_mean_s: float = 0.0
+    pause_var_s2: float = 0.0
+    pauses: int = 0
+    margin: float = 1.0
+    turns: int = 0
+    false_cutoffs: int = 0
+
+    def observe_pause(self, pause_s: float, alpha: float) -> None:
+        """Learn a pause inside a turn (exponential moving mean and variance)."""
+        if not self.pauses:
+            self.pause_mean_s = pause_s
+        else:
+            delta = pause_s - self.pause_mean_s
+            self.pause_mean_s += alpha * delta
+            self.pause_var_s2 = (1 - alpha) * (
+                self.pause_var_s2 + alpha * delta * delta
+            )
+        self.pauses += 1
+
+
+@dataclass
+class EndpointDecision:
+    """Why a turn was ended."""
+
+    silence_s: float
+    wait_s: float
+    prosody: str  # "falling", "sustained" or "neutral"
+
+
+@dataclass
+class _TurnState:
+    voiced_s: float = 0.0
+    started: bool = False
+    silence_s: float = 0.0
+    energies: list[float] = field(default_factory=list)
+
+
+class EndpointDetector:
+    """
+    Decides when a turn ends, from a stream of short VAD windows.
+
+    Independent of the VAD and of fastrtc, so recorded calls can be replayed
+    through it (see scripts/benchmarks/endpointing.py).
+    """
+
+    def __init__(
+        self,
+        started_talking_ms: int = settings.endpointing.started_talking_ms,
+        speech_ms: int = settings.endpointing.speech_ms,
+        default_wait_ms: int = settings.endpointing.default_wait_ms,
+        min_wait_ms: int = settings.endpointing.min_wait_ms,
+        max_wait_ms: int = settings.endpointing.max_wait_ms,
+        min_pauses: int = settings.endpointing.min_pauses,
+        pause_margin_std: float = settings.endpointing.pause_margin_std,
+        pause_alpha: float = settings.endpointing.pause_alpha,
+        falling_energy_ratio: float = settings.endpointing.falling_energy_ratio,
+        falling_wait_factor: float = settings.endpointing.falling_wait_factor,
+        sustained_energy_ratio: float = settings.endpointing.sustained_energy_ratio,
+        sustained_wait_factor: float = settings.endpointing.sustained_wait_factor,
+        resume_window_ms: int = settings.endpointing.resume_window_ms,
+        false_cutoff_step: float = settings.endpointing.false_cutoff_step,
+        max_margin: float = settings.endpointing.max_margin,
+        margin_decay: float = settings.endpointing.margin_decay,
+    ):
+        """
+        Args:
+            started_talking_ms: Speech after which the caller started a turn
+            speech_ms: Speech in a window above which the window is voiced
+            default_wait_ms: Silence that ends a turn until the caller's pauses are known
+            min_wait_ms: Shortest silence that ends a turn
+            max_wait_ms: Longest silence needed to end a turn
+            min_pauses: Pauses learned before the caller's rhythm replaces the default wait
+            pause_margin_std: Standard deviations of the caller's pauses added to their mean
+            pause_alpha: Weight of each new pause in the moving statistics
+            falling_energy_ratio: Last voiced window energy, relative to the turn's
+                median, below which the turn is fading out
+            falling_wait_factor: Wait multiplier of fading turns
+            sustained_energy_ratio: Relative energy above which the turn stopped abruptly
+            sustained_wait_factor: Wait multiplier of abruptly stopped turns
+            resume_window_ms: Speech this soon after a cutoff makes it a false cutoff
+            false_cutoff_step: Margin increase after a false cutoff
+            max_margin: Largest margin
+            margin_decay: Margin decrease (toward 1) after a turn that ended well
+        """
+        self.started_talking_s = started_talking_ms / 1000
+        self.speech_s = speech_ms / 1000
+        self.default_wait_s = default_wait_ms / 1000
+        self.min_wait_s = min_wait_ms / 1000
+        self.max_wait_s = max_wait_ms / 1000
+        self.min_pauses = min_pauses
+        self.pause_margin_std = pause_margin_std
+        self.pause_alpha = pause_alpha
+        self.falling_energy_ratio = falling_energy_ratio
+        self.falling_wait_factor = falling_wait_factor
+        self.sustained_energy_ratio = sustained_energy_ratio
+        self.sustained_wait_factor = sustained_wait_factor
+        self.resume_window_s = resume_window_ms / 1000
+        self.false_cutoff_step = false_cutoff_step
+        self.max_margin = max_margin
+        self.margin_decay = margin_decay
+
+        self.profile = CallerProfile()
+        self._turn = _TurnState()
+        # Silence since the last cutoff, None once the resume window is over
+        self._since_cutoff_s: float | None = None
+        self._cutoff_silence_s = 0.0
+
+    @property
+    def started_talking(self) -> bool:
+        """Whether a turn is in progress."""
+        return self._turn.started
+
+    def rhythm_wait(self) -> float:
+        """Silence that ends a turn of this caller, before prosody."""
+        profile = self.profile
+        if profile.pauses < self.min_pauses:
+            wait = self.default_wait_s
+        else:
+            wait = profile.pause_mean_s + self.pause_margin_std * np.sqrt(
+                profile.pause_var_s2
+            )
+        return wait * profile.margin
+
+    def prosody(self) -> str:
+        """Energy contour of the end of the turn: "falling", "sustained" or "neutral"."""
+        energies = self._turn.energies
+        if len(energies) < 3:
+            return "neutral"
+        ratio = energies[-1] / (float(np.median(energies)) or 1.0)
+        if ratio < self.falling_energy_ratio:
+            return "falling"
+        if ratio > self.sustained_energy_ratio:
+            return "sustained"
+        return "neutral"
+
+    def wait(self) -> float:
+        """Silence that ends the current turn."""
+        factor = {
+            "falling": self.falling_wait_factor,
+            "sustained": self.sustained_wait_factor,
+        }.get(self.prosody(), 1.0)
+        return float(
+            np.clip(self.rhythm_wait() * factor, self.min_wait_s, self.max_wait_s)
+        )
+
+    def observe(
+        self, duration_s: float, speech_s: float, energy: float
+    ) -> EndpointDecision | None:
+        """
+        Feed one VAD window.
+
+        Args:
+            duration_s: Duration of the window
+            speech_s: Speech the VAD found in the window
+            energy: RMS energy of the window
+
+        Returns:
+            The decision if the window ends the turn, None otherwise
+        """
+        turn = self._turn
+        voiced = speech_s >= self.speech_s
+
+        if self._since_cutoff_s is not None:
+            if voiced:
+                self._false_cutoff()
+            else:
+                self._since_cutoff_s += duration_s
+                if self._since_cutoff_s > self.resume_window_s:
+                    self._cutoff_kept()
+
+        if voiced:
+            if turn.started and turn.silence_s > 0:
+                self.profile.observe_pause(turn.silence_s, self.pause_alpha)
+            turn.silence_s = 0.0
+            turn.voiced_s += speech_s
+            turn.energies.append(energy)
+            if turn.voiced_s >= self.started_talking_s:
+                turn.started = True
+            return None
+
+        if not turn.started:
+            # Isolated noise, forget it after a pause
+            turn.silence_s += duration_s
+            if turn.silence_s >= self.default_wait_s:
+                self._turn = _TurnState()
+            return None
+
+        turn.silence_s += duration_s
+        wait = self.wait()
+        if turn.silence_s < wait:
+            return None
+
+        decision = EndpointDecision(turn.silence_s, wait, self.prosody())
+        self._end_turn(turn.silence_s)
+        return decision
+
+    def end_turn(self) -> None:
+        """End the current turn without a pause (e.g. on max continuous speech)."""
+        self._end_turn(0.0)
+
+    def _end_turn(self, silence_s: float) -> None:
+        self.profile.turns += 1
+        self._turn = _TurnState()
+        self._since_cutoff_s = 0.0
+        self._cutoff_silence_s = silence_s
+
+    def _false_cutoff(self) -> None:
+        """The caller resumed right after the cutoff, the turn wasn't over."""
+        profile = self.profile
+        profile.false_cutoffs += 1
+        profile.observe_pause(
+            self._cutoff_silence_s + self._since_cutoff_s, self.pause_alpha
+        )
+        profile.margin = min(profile.margin + self.false_cutoff_step, self.max_margin)
+        self._since_cutoff_s = None
+        logger.debug(f"False end-of-turn cutoff, margin now {profile.margin:.2f}")
+
+    def _cutoff_kept(self) -> None:
+        """The resume window passed without speech, the turn was over."""
+        profile = self.profile
+        profile.margin = max(profile.margin - self.margin_decay, 1.0)
+        self._since_cutoff_s = None
+
+
+def window_energy(audio: np.ndarray) -> float:
+    """RMS energy of an int16 or float window, on the float scale."""
+    samples = audio.astype(np.float32)
+    if audio.dtype == np.int16:
+        samples /= 32768.0
+    return float(np.sqrt(np.mean(samples * samples))) if samples.size else 0.0
+
+
+class AdaptiveReplyOnPause(ReplyOnPause):
+    """
+    ReplyOnPause whose end-of-turn wait adapts to the caller.
+
+    The VAD runs on `window_ms` windows and each window is fed to a per-call
+    `EndpointDetector`. A few windows before the turn started are kept, so the
+    onset of the turn isn't lost.
+    """
+
+    def __init__(
+        self,
+        fn,
+        *args,
+        window_ms: int = settings.endpointing.window_ms,
+        preroll_ms: int = settings.endpointing.preroll_ms,
+        **kwargs,
+    ):
+        """
+        Args:
+            fn: Reply function, as for ReplyOnPause
+            *args: Other ReplyOnPause arguments
+            window_ms: Duration of the windows fed to the VAD
+            preroll_ms: Audio kept from before the turn started
+            **kwargs: Other ReplyOnPause arguments
+        """
+        super().__init__(fn, *args, **kwargs)
+        if self.model_options is None:
+            self.model_options = SHORT_WINDOW_VAD_OPTIONS
+        self.window_ms = window_ms
+        self.preroll_ms = preroll_ms
+        self.detector = EndpointDetector()
+        self._preroll: deque[np.ndarray] = deque(maxlen=max(preroll_ms // window_ms, 1))
+
+    def copy(self):
+        """Create the handler of a new call, with a fresh caller profile."""
+        return AdaptiveReplyOnPause(
+            self.fn,
+            self.startup_fn,
+            self.algo_options,
+            self.model_options,
+            self.can_interrupt,
+            self.expected_layout,
+            self.output_sample_rate,
+            self.output_frame_size,
+            self.input_sample_rate,
+            self.model,
+            self.needs_args,
+            window_ms=self.window_ms,
+            preroll_ms=self.preroll_ms,
+        )
+
+    def determine_pause(self, audio: np.ndarray, sampling_rate: int, state) -> bool:
+        duration = len(audio) / sampling_rate
+        if duration < self.window_ms / 1000:
+            return False
+
+        speech, _ = self.model.vad((sampling_rate, audio), self.model_options)
+        was_talking = self.detector.started_talking
+        decision = self.detector.observe(duration, speech, window_energy(audio))
+        state.buffer = None
+
+        if decision is not None:
+            logger.debug(
+                f"End of turn after {decision.silence_s:.2f} s of silence "
+                f"(wait {decision.wait_s:.2f} s, {decision.prosody})"
+            )
+            return True
+
+        if not self.detector.started_talking:
+            self._preroll.append(audio)
+            return False
+
+        if not was_talking:
+            self.send_message_sync(create_message("log", "started_talking"))
+            audio = np.concatenate([*self._preroll, audio])
+            self._preroll.clear()
+        state.stream = (
+            audio if state.stream is None else np.concatenate((state.stream, audio))
+        )
+
+        if (
+            len(state.stream) / sampling_rate
+            >= self.algo_options.max_continuous_speech_s
+        ):
+            self.detector.end_turn()
+            return True
+        return False
+
+
+def create_reply_handler(
+    fn, adaptive: bool = settings.endpointing.adaptive
+) -> ReplyOnPause:
+    """
+    Wrap a reply function in the configured pause handler.
+
+    Args:
+        fn: Reply function, called with the audio of each turn
+        adaptive: Use AdaptiveReplyOnPause, ReplyOnPause with its defaults otherwise
+
+    Returns:
+        The stream handler
+    """
+    if adaptive:
+        return AdaptiveReplyOnPause(fn)
+    return ReplyOnPause(fn)
@@ -1,7 +1,11 @@
-from typing import AsyncIterator, List, Optional, Tuple
+import asyncio
+from collections import OrderedDict
+from typing import AsyncIterator, List, Literal, Optional, Tuple
 
 import numpy as np
-from fastrtc import ReplyOnPause, Stream
+from fastrtc import Stream, get_current_context
+from realtime_phone_agents.agent.endpointing import create_reply_handler
+from realtime_phone_agents.agent.prefetch import get_search_prefetcher
 from realtime_phone_agents.agent.stream import VoiceAgentStream
 from langchain.agents import create_agent
 from langchain_groq import ChatGroq
@@ -11,8 +15,13 @@ from opik.integrations.langchain import OpikTracer
 from opik import opik_context
 import opik
 
-from realtime_phone_agents.agent.tools.property_search import search_property_tool
+from realtime_phone_agents.agent.tools.property_search import get_property_tools
 from realtime_phone_agents.agent.utils import model_has_tool_calls
+from realtime_phone_agents.audio import (
+    EffectBedMixer,
+    OutputScheduler,
+    TelephonyOutputStage,
+)
 from realtime_phone_agents.background_effects import get_sound_effect
 from realtime_phone_agents.config import settings
 from realtime_phone_agents.stt import get_stt_model
@@ -42,6 +51,7 @@ class FastRTCAgent:
         fallback_message: str = "I'm sorry, I couldn't find anything useful in the system.",
         avatar: str | None = "tara",
         tools: List | None = None,
+        output_profile: Literal["default", "telephony"] = "default",
     ):
         """
         Initialize the FastRTC agent with all its dependencies.
@@ -55,7 +65,8 @@ class FastRTCAgent:
             thread_id: Thread ID for agent conversation tracking
             fallback_message: Message to return when no answer is found
             avatar: Avatar for the agent
-            tools: List of tools for the agent (defaults to property search tool)
+            tools: List of tools for the agent (defaults to property search and details tools)
+            output_profile: "telephony" converts all output to 8 kHz for phone calls
         """
         # Create Opik tracer for LangChain callbacks
         self._opik_tracer = OpikTracer(
@@ -65,8 +76,18 @@ class FastRTCAgent:
         
         # Dependency injection with sensible defaults
         self._stt_model = stt_model or get_stt_model(settings.stt_model)
+        self._output_profile = output_profile
         self._tts_model = tts_model or get_tts_model(settings.tts_model)
-        self._voice_effect = voice_effect or get_sound_effect()
+
+        if output_profile == "telephony":
+            # Ask providers for the lowest useful rate and pre-render effects at 8 kHz
+            self._tts_model.request_sample_rate(settings.audio.telephony_tts_sample_rate)
+            self._voice_effect = voice_effect or get_sound_effect(
+                target_rate=settings.audio.telephony_sample_rate, encoding="mulaw"
+            )
+        else:
+            self._voice_effect = voice_effect or get_sound_effect()
+        self._prefetcher = get_search_prefetcher() if settings.prefetch.enabled else None
 
         self._avatar = get_avatar(avatar)
 
@@ -82,6 +103,9 @@ class FastRTCAgent:
         self._tool_use_message = tool_use_message
         self._sound_effect_seconds = sound_effect_seconds
 
+        # Output scheduler of every call, reused across the turns of the call
+        self._schedulers: OrderedDict[str, OutputScheduler] = OrderedDict()
+
         # Build the FastRTC Stream with the handler
         self._stream = self._build_stream()
 
@@ -95,20 +119,20 @@ class FastRTCAgent:
 
         Args:
             system_prompt: Custom system prompt (defaults to DEFAULT_SYSTEM_PROMPT)
-            tools: List of tools (defaults to [search_property_mock_tool])
+            tools: List of tools (defaults to get_property_tools())
 
         Returns:
             Configured LangChain agent
         """
-        llm = ChatGroq(
+        self._llm = ChatGroq(
             model=settings.groq.model,
             api_key=settings.groq.api_key,
         )
 
-        tools = tools or [search_property_tool]
+        tools = tools or get_property_tools()
 
         agent = create_agent(
-            llm,
+            self._llm,
             checkpointer=InMemorySaver(),
             system_prompt=system_prompt,
             tools=tools,
@@ -126,19 +150,90 @@ class FastRTCAgent:
 
         async def handler_wrapper(audio: AudioChunk) -> AsyncIterator[AudioChunk]:
             """Handler that uses instance variables directly."""
-            async for chunk in self._process_audio(audio):
+            output_stage = self._create_output_stage()
+            # Each turn gets its own bed, concurrent calls never share one
+            mixer = self._create_mixer()
+
+            async def output_chunks() -> AsyncIterator[AudioChunk]:
+                async for chunk in self._process_audio(audio, mixer):
+                    yield output_stage.process(chunk) if output_stage else chunk
+
+            chunks = output_chunks()
+            if settings.audio.paced_output:
+                chunks = self._get_scheduler().pace(chunks)
+
+            async for chunk in chunks:
                 yield chunk
 
         return VoiceAgentStream(
-            handler=ReplyOnPause(handler_wrapper),
+            handler=create_reply_handler(handler_wrapper),
             modality="audio",
             mode="send-receive",
         )
 
+    def _get_scheduler(self, max_calls: int = 1000) -> OutputScheduler:
+        """
+        Get the output scheduler of the current call, created on its first turn.
+
+        The jitter buffer depth a turn settled on carries over to the next turns
+        of the call. Calls are told apart by their FastRTC connection id, the
+        thread id stands in outside of a FastRTC connection.
+
+        Args:
+            max_calls: Schedulers kept, the least recently used call's is dropped
+
+        Returns:
+            The OutputScheduler of the call
+        """
+        try:
+            call_id = get_current_context().webrtc_id
+        except RuntimeError:
+            call_id = self._thread_id
+
+        scheduler = self._schedulers.get(call_id)
+        if scheduler is None:
+            scheduler = OutputScheduler()
+            self._schedulers[call_id] = scheduler
+            if len(self._schedulers) > max_calls:
+                self._schedulers.popitem(last=False)
+        else:
+            self._schedulers.move_to_end(call_id)
+        return scheduler
+
+    def _create_output_stage(self) -> TelephonyOutputStage | None:
+        """
+        Create the per-turn output stage for the configured output profile.
+
+        Returns:
+            A TelephonyOutputStage for the telephony profile, None otherwise
+        """
+        if self._output_profile == "telephony":
+            return TelephonyOutputStage(settings.audio.telephony_sample_rate)
+        return None
+
+    def _create_mixer(self) -> EffectBedMixer | None:
+        """
+        Create the per-turn effect bed mixer, if enabled and the voice effect is file-based.
+
+        Returns:
+            An EffectBedMixer over the voice effect's audio file, None otherwise
+        """
+        path = getattr(self._voice_effect, "path", None)
+        if not settings.audio.effect_bed_enabled or path is None:
+            return None
+
+        return EffectBedMixer(
+            path,
+            gain=settings.audio.effect_bed_gain,
+            fill_gain=settings.audio.effect_bed_fill_gain,
+            fade_ms=settings.audio.effect_bed_fade_ms,
+        )
+
     @opik.track(name="generate-avatar-response", capture_input=False, capture_output=False)
     async def _process_audio(
         self,
         audio: AudioChunk,
+        mixer: EffectBedMixer | None = None,
     ) -> AsyncIterator[AudioChunk]:
         """
         Process audio input through the complete pipeline:
@@ -147,6 +242,7 @@ class FastRTCAgent:
 
         Args:
             audio: Input audio chunk (sample_rate, samples)
+            mixer: The turn's effect bed mixer, None to play effects sequentially
 
         Yields:
             Audio chunks to be played back to the user
@@ -156,18 +252,29 @@ class FastRTCAgent:
         transcription = await self._transcribe(audio)
         logger.info(f"Transcription: {transcription}")
 
-        # Step 2: Process with agent and stream responses
-        async for audio_chunk in self._process_with_agent(transcription):
-            if audio_chunk is not None:
-                yield audio_chunk
+        # Step 2: Speculatively start a property search while the LLM reasons
+        if self._prefetcher is not None:
+            self._prefetcher.start(self._thread_id, transcription)
+
+        # Step 3: Process with agent and stream responses
+        try:
+            async for audio_chunk in self._process_with_agent(transcription, mixer):
+                if audio_chunk is not None:
+                    yield audio_chunk
+        finally:
+            if self._prefetcher is not None:
+                self._prefetcher.discard(self._thread_id)
 
-        # Step 3: Speak final answer
+        # Step 4: Speak final answer, fading out the effect bed under it
         final_response = await self._get_final_response()
         logger.info(f"Final response: {final_response}")
 
+        if mixer is not None:
+            mixer.stop(fade=True)
+
         if final_response:
             async for audio_chunk in self._synthesize_speech(final_response):
-                yield audio_chunk
+                yield self._mix(audio_chunk, mixer)
 
     @opik.track(name="stt-transcription", capture_input=False, capture_output=True)
     async def _transcribe(self, audio: AudioChunk) -> str:
@@ -180,12 +287,14 @@ class FastRTCAgent:
         Returns:
             Transcribed text
         """
-        return self._stt_model.stt(audio)
+        # STT clients block (and may queue for a pooled endpoint), keep the loop free
+        return await asyncio.to_thread(self._stt_model.stt, audio)
 
     @opik.track(name="generate-agent-response")
     async def _process_with_agent(
         self,
         transcription: str,
+        mixer: EffectBedMixer | None = None,
     ) -> AsyncIterator[Optional[AudioChunk]]:
         """
         Process transcription through the agent and handle tool calls.
@@ -193,38 +302,62 @@ class FastRTCAgent:
 
         Args:
             transcription: User's transcribed message
+            mixer: The turn's effect bed mixer, None to play effects sequentially
 
         Yields:
             Audio chunks for tool use messages and effects
         """
         final_text: str | None = None
-        
-        # Stream LangChain agent updates with Opik tracing
-        async for chunk in self._react_agent.astream(
+
+        # Stream LangChain agent updates with Opik tracing. The next update is
+        # requested ahead of time, so tools run while the tool-use message plays.
+        updates = self._react_agent.astream(
             {"messages": [{"role": "user", "content": transcription}]},
             {
                 "configurable": {"thread_id": self._thread_id},
                 "callbacks": [self._opik_tracer]
             },
             stream_mode="updates",
-        ):
-            for step, data in chunk.items():
-                # Handle tool calls
-                if step == "model" and model_has_tool_calls(data):
-                    # Speak tool-use message
-                    async for audio_chunk in self._synthesize_speech(
-                        self._tool_use_message
-                    ):
-                        yield audio_chunk
-
-                    # Play sound effect
-                    if self._sound_effect_seconds > 0:
-                        async for effect_chunk in self._play_sound_effect():
-                            yield effect_chunk
-
-                # Capture final text from model response
-                if step == "model":
-                    final_text = self._extract_final_text(data)
+        )
+        next_update = asyncio.ensure_future(anext(updates, None))
+
+        try:
+            while True:
+                # Fill the wait for the agent (tool calls, LLM) with the effect bed
+                if mixer is not None and mixer.active:
+                    async for bed_chunk in self._fill_until(next_update, mixer):
+                        yield bed_chunk
+
+                chunk = await next_update
+                if chunk is None:
+                    break
+                next_update = asyncio.ensure_future(anext(updates, None))
+
+                for step, data in chunk.items():
+                    # Handle tool calls
+                    if step == "model" and model_has_tool_calls(data):
+                        if mixer is not None:
+                            mixer.start()
+
+                        # Speak tool-use message
+                        async for audio_chunk in self._synthesize_speech(
+                            self._tool_use_message
+                        ):
+                            yield self._mix(audio_chunk, mixer)
+
+                        # Play sound effect (sequentially, if it isn't mixed)
+                        if mixer is None and self._sound_effect_seconds > 0:
+                            async for effect_chunk in self._play_sound_effect():
+                                yield effect_chunk
+
+                    # Capture final text from model response
+                    if step == "model":
+                        final_text = self._extract_final_text(data)
+        finally:
+            # Let a pending step unwind before closing the agent stream
+            next_update.cancel()
+            await asyncio.gather(next_update, return_exceptions=True)
+            await updates.aclose()
 
         # Store final text for later retrieval
         self._last_final_text = final_text
@@ -236,6 +369,32 @@ class FastRTCAgent:
                 output={"final_text": final_text},
             )
 
+    async def _fill_until(
+        self, pending: asyncio.Future, mixer: EffectBedMixer
+    ) -> AsyncIterator[AudioChunk]:
+        """
+        Emit bed-only chunks until the pending agent update is ready.
+
+        Args:
+            pending: Future of the next agent update
+            mixer: The turn's effect bed mixer
+
+        Yields:
+            Effect bed chunks at the voice effect's sample rate
+        """
+        sample_rate = getattr(self._voice_effect, "target_rate", 16000)
+        chunk_s = settings.audio.effect_bed_fill_chunk_ms / 1000
+
+        while not pending.done():
+            yield mixer.fill(sample_rate, chunk_s)
+            await asyncio.wait({pending}, timeout=chunk_s)
+
+    def _mix(self, chunk: AudioChunk, mixer: EffectBedMixer | None) -> AudioChunk:
+        """Mix the effect bed under a speech chunk, if the bed is playing."""
+        if mixer is None:
+            return chunk
+        return mixer.mix(chunk)
+
     def _extract_final_text(self, model_step_data) -> Optional[str]:
         """
         Extract the final text response from model step data.
@@ -305,6 +464,11 @@ class FastRTCAgent:
         """Get the text-to-speech model."""
         return self._tts_model
 
+    @property
+    def llm(self):
+        """Get the LLM backing the React agent."""
+        return self._llm
+
     @property
     def react_agent(self):
         """Get the React agent."""
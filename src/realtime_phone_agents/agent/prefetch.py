@@ -0,0 +1,336 @@
+"""
+Speculative property search prefetch.
+
+Most turns that end in a property search tool call mention a neighborhood or
+a room count, which can be detected in the transcription before the LLM has
+decided anything. The prefetcher starts the search right away, in parallel
+with the LLM call, and the tool reuses the result only when it searches for
+the same thing: the same normalized query, or a query that, like the
+transcription, has no constraint beyond the neighborhood and room count.
+Any other constraint (price, size, features...) makes the tool search again.
+
+With structured search, only transcriptions without other constraints are
+prefetched, as a filters-only search with the default weights, and the tool
+reuses it only if its arguments are exactly those.
+"""
+
+import asyncio
+import re
+import time
+import unicodedata
+from typing import Any
+
+from loguru import logger
+from pydantic import BaseModel, Field
+
+from realtime_phone_agents.config import settings
+from realtime_phone_agents.infrastructure.superlinked.constants import NEIGHBORHOODS
+from realtime_phone_agents.infrastructure.superlinked.service import (
+    get_property_search_service,
+)
+
+_NUMBER_WORDS = {
+    "one": 1,
+    "two": 2,
+    "three": 3,
+    "four": 4,
+    "five": 5,
+    "six": 6,
+    "seven": 7,
+    "eight": 8,
+    "nine": 9,
+    "ten": 10,
+}
+
+_ROOMS_PATTERN = re.compile(
+    r"\b(\d+|" + "|".join(_NUMBER_WORDS) + r")[\s-]*(?:bed)?(?:rooms?|bedrooms?)\b"
+)
+
+_WORD_PATTERN = re.compile(r"[a-z0-9]+")
+
+# Words that don't constrain a search, anything else in a query is a constraint
+_NEUTRAL_WORDS = frozenset(
+    _WORD_PATTERN.findall(
+        """
+        a about all an and any anything apartment apartments are area at available
+        barrio can could de do does flat flats find for get have hello hi home homes
+        house houses how i im in is it just like look looking me madrid maybe more
+        my need neighborhood neighbourhood now of ok okay on one ones options or
+        place places please properties property search see show so some something
+        than that the then there these this those to us want we what whats with
+        would yeah yes you
+        """
+    )
+)
+
+
+def _normalize(text: str) -> str:
+    """Lowercase and strip accents, so 'Argüelles' matches 'arguelles'."""
+    decomposed = unicodedata.normalize("NFKD", text)
+    return "".join(c for c in decomposed if not unicodedata.combining(c)).lower()
+
+
+def _build_neighborhood_aliases() -> list[tuple[re.Pattern, str]]:
+    """Build word-boundary patterns for every neighborhood and its parts."""
+    aliases: dict[str, str] = {}
+    for name in NEIGHBORHOODS:
+        normalized = _normalize(name)
+        variants = {normalized, normalized.removeprefix("barrio de ")}
+        variants.update(part.strip() for part in normalized.split("-"))
+        for variant in variants:
+            aliases.setdefault(variant, name)
+
+    # Longest aliases first so "ciudad universitaria" wins over shorter overlaps
+    return [
+        (re.compile(rf"\b{re.escape(alias)}\b"), name)
+        for alias, name in sorted(aliases.items(), key=lambda item: -len(item[0]))
+    ]
+
+
+_NEIGHBORHOOD_ALIASES = _build_neighborhood_aliases()
+
+
+class SearchIntent(BaseModel):
+    """Search criteria that can be detected directly in user text."""
+
+    location: str | None = Field(default=None, description="Detected neighborhood")
+    min_rooms: int | None = Field(default=None, description="Detected room count")
+    terms: list[str] = Field(
+        default_factory=list,
+        description="Other constraint words, sorted (price, size, features...)",
+    )
+
+    @property
+    def is_empty(self) -> bool:
+        return self.location is None and self.min_rooms is None
+
+
+def detect_search_intent(text: str) -> SearchIntent:
+    """
+    Detect a neighborhood, a room count and any other constraint in free text.
+
+    Args:
+        text: Transcription or tool query
+
+    Returns:
+        The detected SearchIntent (empty if no neighborhood or room count was found)
+    """
+    normalized = _normalize(text)
+
+    location = None
+    for pattern, name in _NEIGHBORHOOD_ALIASES:
+        if match := pattern.search(normalized):
+            location = name
+            normalized = normalized[: match.start()] + " " + normalized[match.end() :]
+            break
+
+    min_rooms = None
+    rooms_match = _ROOMS_PATTERN.search(normalized)
+    if rooms_match:
+        value = rooms_match.group(1)
+        min_rooms = int(value) if value.isdigit() else _NUMBER_WORDS[value]
+        normalized = (
+            normalized[: rooms_match.start()] + " " + normalized[rooms_match.end() :]
+        )
+
+    terms = set(_WORD_PATTERN.findall(normalized)) - _NEUTRAL_WORDS
+    return SearchIntent(location=location, min_rooms=min_rooms, terms=sorted(terms))
+
+
+def normalize_query(text: str) -> str:
+    """Normalize a search query for comparison: accents, case, punctuation and spacing."""
+    return " ".join(_WORD_PATTERN.findall(_normalize(text)))
+
+
+def normalize_search_params(params: dict[str, Any]) -> dict[str, Any]:
+    """
+    Normalize structured search arguments for comparison.
+
+    Args:
+        params: Arguments of `search_properties_structured`, without limit and summary
+
+    Returns:
+        The arguments with the description query normalized (None if empty) and
+        the weights as floats
+    """
+    description_query = params.get("description_query")
+    return {
+        "description_query": normalize_query(description_query or "") or None,
+        "location": params.get("location"),
+        "min_rooms": params.get("min_rooms"),
+        "min_baths": params.get("min_baths"),
+        "sqft_bigger_than": params.get("sqft_bigger_than"),
+        "price_smaller_than": params.get("price_smaller_than"),
+        "description_weight": float(params.get("description_weight", 1.0)),
+        "size_weight": float(params.get("size_weight", 0.0)),
+        "price_weight": float(params.get("price_weight", 0.0)),
+    }
+
+
+class _PrefetchEntry:
+    def __init__(
+        self,
+        intent: SearchIntent,
+        query: str,
+        params: dict[str, Any] | None,
+        limit: int,
+        task: asyncio.Task,
+    ):
+        self.intent = intent
+        self.query = query
+        self.params = params
+        self.limit = limit
+        self.task = task
+        self.created_at = time.monotonic()
+
+
+class SearchPrefetcher:
+    """Starts speculative searches per session and hands them to the tool."""
+
+    def __init__(
+        self,
+        limit: int = settings.prefetch.limit,
+        ttl_seconds: float = settings.prefetch.ttl_seconds,
+        structured: bool = settings.property_tool.structured_search,
+        summary: bool = settings.property_tool.compact_output,
+    ):
+        self.limit = limit
+        self.ttl_seconds = ttl_seconds
+        self.structured = structured
+        self.summary = summary
+        self._entries: dict[str, _PrefetchEntry] = {}
+
+    def start(self, session_id: str, transcription: str) -> bool:
+        """
+        Start a speculative search if the transcription looks like a search.
+
+        Args:
+            session_id: Conversation thread id
+            transcription: The user's transcribed turn
+
+        Returns:
+            True if a prefetch was started
+        """
+        self.discard(session_id)
+
+        intent = detect_search_intent(transcription)
+        if intent.is_empty:
+            return False
+
+        params = None
+        service = get_property_search_service()
+        if self.structured:
+            if intent.terms:
+                # The tool's arguments would carry these constraints, they can't match
+                return False
+            params = normalize_search_params(
+                {"location": intent.location, "min_rooms": intent.min_rooms}
+            )
+            search = service.search_properties_structured(
+                **params, limit=self.limit, summary=self.summary
+            )
+        else:
+            search = service.search_properties(
+                transcription, self.limit, summary=self.summary
+            )
+
+        task = asyncio.create_task(search)
+        self._entries[session_id] = _PrefetchEntry(
+            intent, normalize_query(transcription), params, self.limit, task
+        )
+        logger.debug(f"Started search prefetch for intent {intent.model_dump()}")
+        return True
+
+    async def take(
+        self, session_id: str, query: str, limit: int
+    ) -> list[dict[str, Any]] | None:
+        """
+        Consume the prefetched result if it matches the tool arguments.
+
+        The query matches if it is the prefetched transcription, normalized, or
+        if neither has any constraint beyond the same neighborhood and room count.
+
+        Args:
+            session_id: Conversation thread id
+            query: The query the LLM passed to the tool
+            limit: The limit the LLM passed to the tool
+
+        Returns:
+            The prefetched properties, or None if there is no matching prefetch
+        """
+        entry = self._entries.get(session_id)
+        intent = detect_search_intent(query)
+        matches = (
+            entry is not None
+            and entry.params is None
+            and (
+                normalize_query(query) == entry.query
+                or (not intent.terms and intent == entry.intent)
+            )
+        )
+        return await self._consume(session_id, matches, limit)
+
+    async def take_params(
+        self, session_id: str, params: dict[str, Any], limit: int
+    ) -> list[dict[str, Any]] | None:
+        """
+        Consume the prefetched result if it matches structured search arguments.
+
+        The arguments match if, normalized, they are the prefetched ones: same
+        filters, same description query and same weights.
+
+        Args:
+            session_id: Conversation thread id
+            params: The arguments the LLM passed to the structured tool, without limit
+            limit: The limit the LLM passed to the tool
+
+        Returns:
+            The prefetched properties, or None if there is no matching prefetch
+        """
+        entry = self._entries.get(session_id)
+        matches = (
+            entry is not None
+            and entry.params is not None
+            and normalize_search_params(params) == entry.params
+        )
+        return await self._consume(session_id, matches, limit)
+
+    async def _consume(
+        self, session_id: str, matches: bool, limit: int
+    ) -> list[dict[str, Any]] | None:
+        entry = self._entries.pop(session_id, None)
+        if entry is None:
+            return None
+
+        expired = time.monotonic() - entry.created_at > self.ttl_seconds
+        if expired or limit > entry.limit or not matches:
+            entry.task.cancel()
+            logger.debug("Discarded search prefetch, tool arguments don't match")
+            return None
+
+        try:
+            properties = await entry.task
+        except Exception as e:
+            logger.warning(f"Search prefetch failed: {e}")
+            return None
+
+        logger.info("Using prefetched search result")
+        return properties[:limit]
+
+    def discard(self, session_id: str) -> None:
+        """Cancel and drop any pending prefetch of the session."""
+        entry = self._entries.pop(session_id, None)
+        if entry is not None and not entry.task.done():
+            entry.task.cancel()
+
+
+# Global prefetcher instance
+_search_prefetcher = None
+
+
+def get_search_prefetcher() -> SearchPrefetcher:
+    """Get or create the global search prefetcher."""
+    global _search_prefetcher
+    if _search_prefetcher is None:
+        _search_prefetcher = SearchPrefetcher()
+    return _search_prefetcher
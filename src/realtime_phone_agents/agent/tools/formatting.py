@@ -0,0 +1,101 @@
+"""Serialization of property records into tool output for the agent."""
+
+import json
+from typing import Any
+
+from realtime_phone_agents.config import settings
+
+
+def truncate_text(text: str, max_chars: int) -> str:
+    """
+    Truncate text at a word boundary.
+
+    Args:
+        text: Text to truncate
+        max_chars: Maximum number of characters to keep
+
+    Returns:
+        The truncated text, ending with "..." if anything was cut
+    """
+    text = " ".join(text.split())
+    if len(text) <= max_chars:
+        return text
+
+    cut = text[:max_chars].rsplit(" ", 1)[0]
+    return f"{cut.rstrip(',.;:')}..."
+
+
+def summarize_property(
+    prop: dict[str, Any],
+    fields: list[str] = settings.property_tool.summary_fields,
+    description_max_chars: int = settings.property_tool.description_max_chars,
+) -> dict[str, Any]:
+    """
+    Reduce a property record to the fields the agent is allowed to speak.
+
+    Args:
+        prop: Full property record
+        fields: Fields to keep
+        description_max_chars: Maximum description length (0 drops it)
+
+    Returns:
+        The compact property summary
+    """
+    summary = {field: prop[field] for field in fields if field in prop}
+
+    description = prop.get("description")
+    if description_max_chars > 0 and description:
+        summary["description"] = truncate_text(description, description_max_chars)
+
+    return summary
+
+
+def dumps_compact(data: Any) -> str:
+    """Serialize to JSON without any pretty-print whitespace."""
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False)
+
+
+def format_properties(
+    properties: list[dict[str, Any]],
+    compact: bool = settings.property_tool.compact_output,
+) -> str:
+    """
+    Serialize property records into the tool output returned to the agent.
+
+    Args:
+        properties: Full property records
+        compact: Whether to return compact summaries instead of full records
+
+    Returns:
+        The serialized tool output
+    """
+    if not compact:
+        return json.dumps(properties, indent=2)
+
+    return dumps_compact([summarize_property(prop) for prop in properties])
+
+
+def format_cursor_property(
+    prop: dict[str, Any],
+    number: int,
+    total: int,
+    compact: bool = settings.property_tool.compact_output,
+) -> str:
+    """
+    Serialize one property served from the search cursor, with its position.
+
+    Args:
+        prop: Full property record
+        number: 1-based position of the property in the search results
+        total: Number of results held by the cursor
+        compact: Whether to return a compact summary instead of the full record
+
+    Returns:
+        The serialized tool output
+    """
+    output = {
+        "number": number,
+        "of": total,
+        "property": summarize_property(prop) if compact else prop,
+    }
+    return dumps_compact(output) if compact else json.dumps(output, indent=2)
@@ -1,7 +1,27 @@
-import json
+from typing import Any, Awaitable, Callable, Literal
 
 from langchain.tools import tool
+from langchain_core.runnables import RunnableConfig
+from loguru import logger
 
+from realtime_phone_agents.agent.prefetch import (
+    detect_search_intent,
+    get_search_prefetcher,
+)
+from realtime_phone_agents.agent.tools.formatting import (
+    dumps_compact,
+    format_cursor_property,
+    format_properties,
+)
+from realtime_phone_agents.agent.tools.result_cursor import (
+    SearchCursor,
+    get_search_cursor_store,
+)
+from realtime_phone_agents.agent.tools.result_store import (
+    get_property_result_store,
+    get_session_id,
+)
+from realtime_phone_agents.config import settings
 from realtime_phone_agents.infrastructure.superlinked.service import (
     get_property_search_service,
 )
@@ -16,8 +36,52 @@ def search_property_mock_tool(location: str) -> str:
     )
 
 
+async def _search_with_cursor(
+    session_id: str,
+    search_key: str,
+    limit: int,
+    search: Callable[[int], Awaitable[list[dict[str, Any]] | None]],
+    cursor_size: int = settings.property_tool.cursor_size,
+) -> list[dict[str, Any]]:
+    """
+    Run a search once, keep its top results as the session cursor, return the first `limit`.
+
+    Args:
+        session_id: Conversation thread id
+        search_key: Identifies the search, every argument but the limit
+        limit: Number of results to return
+        search: Runs the search for a given number of results
+        cursor_size: Minimum number of results fetched for the cursor
+
+    Returns:
+        The first `limit` results of the search, empty if it found nothing or failed
+    """
+    cursor_store = get_search_cursor_store()
+    cursor = cursor_store.get(session_id)
+
+    if cursor is not None and cursor.search_key == search_key and cursor.covers(limit):
+        logger.info("Serving repeated search from the session cursor")
+        return cursor.first(limit)
+
+    fetch_limit = max(limit, cursor_size)
+    properties = await search(fetch_limit)
+    if not properties:
+        # The searches return [] on errors too: keep no cursor that could
+        # serve the failure again, nor the previous search's results
+        cursor_store.clear(session_id)
+        return []
+
+    cursor = SearchCursor(search_key, properties, fetch_limit)
+    cursor_store.put(session_id, cursor)
+    get_property_result_store().put(session_id, properties)
+
+    return cursor.first(limit)
+
+
 @tool
-async def search_property_tool(query: str, limit: int = 1) -> str:
+async def search_property_tool(
+    query: str, limit: int = 1, *, config: RunnableConfig
+) -> str:
     """Search for real estate properties using natural language queries.
 
     This tool performs semantic search over a property database, allowing you to find
@@ -38,14 +102,245 @@ async def search_property_tool(query: str, limit: int = 1) -> str:
                Use higher values when the user wants to compare multiple options.
 
     Returns:
-        A formatted string containing details of matching properties, including:
-        address, price, bedrooms, bathrooms, square footage, and key features.
+        A compact JSON list of matching properties with their id, price, location,
+        rooms and bathrooms. Use get_property_details_tool with the id to get the
+        description and full details of a property, and browse_search_results_tool
+        to go through the next results of the same search.
         Returns an empty or error message if no properties match the criteria.
     """
-    property_search_service = get_property_search_service()
-    properties = await property_search_service.search_properties(query, limit)
+    session_id = get_session_id(config)
+
+    async def search(fetch_limit: int) -> list[dict[str, Any]]:
+        properties = await get_search_prefetcher().take(session_id, query, fetch_limit)
+        if properties is None:
+            property_search_service = get_property_search_service()
+            properties = await property_search_service.search_properties(
+                query, fetch_limit, summary=settings.property_tool.compact_output
+            )
+        return properties
+
+    properties = await _search_with_cursor(
+        session_id, dumps_compact({"query": query}), limit, search
+    )
 
     if not properties:
         return "No properties found matching the criteria."
 
-    return json.dumps(properties, indent=2)
+    return format_properties(properties)
+
+
+@tool
+async def search_property_structured_tool(
+    description_query: str | None = None,
+    location: str | None = None,
+    min_rooms: int | None = None,
+    min_baths: int | None = None,
+    sqft_bigger_than: int | None = None,
+    price_smaller_than: int | None = None,
+    description_weight: float = 1.0,
+    size_weight: float = 0.0,
+    price_weight: float = 0.0,
+    limit: int = 1,
+    *,
+    config: RunnableConfig,
+) -> str:
+    """Search for real estate properties in Madrid with explicit filters.
+
+    Fill in only the criteria the user mentioned, leave the others empty.
+
+    Examples:
+        - "two bedrooms in Chamberí under 400k": location="Chamberí", min_rooms=2,
+          price_smaller_than=400000
+        - "bright flat with a terrace, cheap": description_query="bright flat with a terrace",
+          price_weight=1.0
+
+    Args:
+        description_query: Features to match against property descriptions, like
+            "bright, with terrace and parking". Leave empty to search by filters only.
+        location: Madrid neighborhood, like "Chamberí", "Malasaña-Universidad" or
+            "Barrio de Salamanca".
+        min_rooms: Minimum number of rooms.
+        min_baths: Minimum number of bathrooms.
+        sqft_bigger_than: Minimum size in square feet.
+        price_smaller_than: Maximum price in euros.
+        description_weight: How much the description match matters (default: 1.0).
+        size_weight: How much bigger properties are preferred, 0 to 1 (default: 0).
+        price_weight: How much cheaper properties are preferred, 0 to 1 (default: 0).
+        limit: Maximum number of matching properties to return (default: 1).
+               Use higher values when the user wants to compare multiple options.
+
+    Returns:
+        A compact JSON list of matching properties with their id, price, location,
+        rooms and bathrooms. Use get_property_details_tool with the id to get the
+        description and full details of a property, and browse_search_results_tool
+        to go through the next results of the same search.
+        Returns an empty or error message if no properties match the criteria.
+    """
+    session_id = get_session_id(config)
+
+    # Map spoken variants ("Salamanca", "Arguelles") to the indexed neighborhood
+    if location:
+        location = detect_search_intent(location).location or location
+
+    params = {
+        "description_query": description_query,
+        "location": location,
+        "min_rooms": min_rooms,
+        "min_baths": min_baths,
+        "sqft_bigger_than": sqft_bigger_than,
+        "price_smaller_than": price_smaller_than,
+        "description_weight": description_weight,
+        "size_weight": size_weight,
+        "price_weight": price_weight,
+    }
+
+    async def search(fetch_limit: int) -> list[dict[str, Any]]:
+        properties = await get_search_prefetcher().take_params(
+            session_id, params, fetch_limit
+        )
+        if properties is None:
+            property_search_service = get_property_search_service()
+            properties = await property_search_service.search_properties_structured(
+                **params,
+                limit=fetch_limit,
+                summary=settings.property_tool.compact_output,
+            )
+        return properties
+
+    properties = await _search_with_cursor(
+        session_id, dumps_compact(params), limit, search
+    )
+
+    if not properties:
+        return "No properties found matching the criteria."
+
+    return format_properties(properties)
+
+
+@tool
+async def get_property_details_tool(property_id: int, *, config: RunnableConfig) -> str:
+    """Get the full details of a property previously returned by a property search.
+
+    Use it when the user asks for more information about a property already found,
+    like its size, its full description or its features.
+
+    Args:
+        property_id: The id of the property, as returned by the property search.
+
+    Returns:
+        The full property record as JSON, or an error message if the property
+        wasn't returned by a previous search in this conversation.
+    """
+    session_id = get_session_id(config)
+    result_store = get_property_result_store()
+    prop = result_store.get(session_id, property_id)
+
+    if prop is None:
+        return f"No details available for property {property_id}. Search for it first."
+
+    # Searches only return the summary fields, read the full record by id
+    full_prop = await get_property_search_service().get_property(property_id)
+    if full_prop is not None:
+        prop = full_prop
+        result_store.put(session_id, [prop])
+
+    return dumps_compact(prop)
+
+
+@tool
+async def browse_search_results_tool(
+    action: Literal["next", "previous", "number"] = "next",
+    number: int | None = None,
+    *,
+    config: RunnableConfig,
+) -> str:
+    """Go through the results of the last property search without searching again.
+
+    Use it when the user wants to hear more options ("yes, the next one"), to go
+    back ("the previous one") or to hear about a given result ("the second one").
+
+    Args:
+        action: "next" or "previous" to move from the property last described,
+            "number" to jump to the result given by `number`.
+        number: Position of the property in the search results, starting at 1.
+            Only used with action "number".
+
+    Returns:
+        A compact JSON object with the property, its number and the number of
+        results, or a message if there is no such result.
+    """
+    cursor = get_search_cursor_store().get(get_session_id(config))
+    if cursor is None or not len(cursor):
+        return "There are no search results yet. Search for properties first."
+
+    if action == "number":
+        if number is None:
+            return "Give the number of the property to describe."
+        prop = cursor.at(number)
+    else:
+        prop = cursor.move(-1 if action == "previous" else 1)
+
+    if prop is None:
+        if action == "previous":
+            return "This is the first property of the search results."
+        if cursor.complete:
+            return f"There are only {len(cursor)} properties matching the criteria."
+        return (
+            f"There are no more properties in the top {len(cursor)} results. "
+            "Offer to search with different criteria."
+        )
+
+    return format_cursor_property(prop, cursor.position + 1, len(cursor))
+
+
+@tool
+def property_catalog_stats_tool(location: str | None = None) -> str:
+    """Get how many properties there are and their price and room ranges.
+
+    Use it for questions about the catalog as a whole rather than about a
+    given property, like "how many apartments do you have in Retiro?" or
+    "what's the cheapest one in Salamanca?". It answers instantly, without
+    searching.
+
+    Args:
+        location: Madrid neighborhood, like "Chamberí" or "Barrio de Salamanca".
+            Leave empty for the whole catalog.
+
+    Returns:
+        A compact JSON object with the number of properties, the minimum,
+        median and maximum price in euros and the number of properties by
+        number of rooms, or an error message if the neighborhood is unknown.
+    """
+    # Map spoken variants ("Salamanca", "Arguelles") to the indexed neighborhood
+    if location:
+        location = detect_search_intent(location).location or location
+
+    stats = get_property_search_service().get_catalog_stats(location)
+    if stats is None:
+        return f"We have no properties in {location}."
+
+    return dumps_compact({"location": location or "all", **stats})
+
+
+def get_property_tools(
+    structured: bool = settings.property_tool.structured_search,
+) -> list:
+    """
+    Get the default agent tools: one property search tool, the results browsing
+    tool, the details tool and the catalog stats tool.
+
+    Args:
+        structured: Use the structured-filter search tool instead of the natural language one
+
+    Returns:
+        The list of tools
+    """
+    search_tool = (
+        search_property_structured_tool if structured else search_property_tool
+    )
+    return [
+        search_tool,
+        browse_search_results_tool,
+        get_property_details_tool,
+        property_catalog_stats_tool,
+    ]
@@ -0,0 +1,88 @@
+"""Per-session cursor over the results of the last property search."""
+
+from collections import OrderedDict
+from typing import Any
+
+
+class SearchCursor:
+    """
+    The top results of one search and the position the agent has reached.
+
+    Positions are 0-based internally and 1-based ("number two") for the agent.
+    """
+
+    def __init__(
+        self, search_key: str, properties: list[dict[str, Any]], fetch_limit: int
+    ):
+        self.search_key = search_key
+        self.properties = properties
+        # Fewer results than requested means the backend has no more of them
+        self.complete = len(properties) < fetch_limit
+        self.position = -1
+
+    def __len__(self) -> int:
+        return len(self.properties)
+
+    def covers(self, limit: int) -> bool:
+        """Whether the first `limit` results of the search are all in the cursor."""
+        return self.complete or limit <= len(self.properties)
+
+    def first(self, limit: int) -> list[dict[str, Any]]:
+        """Return the first `limit` results and move after the last one returned."""
+        shown = self.properties[:limit]
+        self.position = len(shown) - 1
+        return shown
+
+    def move(self, offset: int) -> dict[str, Any] | None:
+        """Move by `offset` results, None (and no move) past either end."""
+        return self.at(self.position + offset + 1)
+
+    def at(self, number: int) -> dict[str, Any] | None:
+        """Move to the 1-based result `number`, None (and no move) if out of range."""
+        if not 1 <= number <= len(self.properties):
+            return None
+        self.position = number - 1
+        return self.properties[self.position]
+
+
+class SearchCursorStore:
+    """
+    Keeps the cursor of the last search of each session, so follow-ups like
+    "the next one" are answered without searching again.
+
+    Sessions are bounded with LRU eviction.
+    """
+
+    def __init__(self, max_sessions: int = 1000):
+        self.max_sessions = max_sessions
+        self._cursors: OrderedDict[str, SearchCursor] = OrderedDict()
+
+    def put(self, session_id: str, cursor: SearchCursor) -> None:
+        """Replace the cursor of a session."""
+        self._cursors[session_id] = cursor
+        self._cursors.move_to_end(session_id)
+        if len(self._cursors) > self.max_sessions:
+            self._cursors.popitem(last=False)
+
+    def get(self, session_id: str) -> SearchCursor | None:
+        """Get the cursor of the last search of a session, if any."""
+        cursor = self._cursors.get(session_id)
+        if cursor is not None:
+            self._cursors.move_to_end(session_id)
+        return cursor
+
+    def clear(self, session_id: str) -> None:
+        """Drop the cursor of a session."""
+        self._cursors.pop(session_id, None)
+
+
+# Global store instance
+_cursor_store = None
+
+
+def get_search_cursor_store() -> SearchCursorStore:
+    """Get or create the global search cursor store."""
+    global _cursor_store
+    if _cursor_store is None:
+        _cursor_store = SearchCursorStore()
+    return _cursor_store
@@ -0,0 +1,87 @@
+"""Per-session side store for full property records returned by the search tool."""
+
+from collections import OrderedDict
+from typing import Any
+
+from langchain_core.runnables import RunnableConfig
+
+
+def get_session_id(config: RunnableConfig | None) -> str:
+    """Extract the conversation thread id from a LangChain runnable config."""
+    if not config:
+        return "default"
+    return str(config.get("configurable", {}).get("thread_id", "default"))
+
+
+class PropertyResultStore:
+    """
+    Keeps the full property records returned to each session, so the agent
+    only receives compact summaries while details stay one lookup away.
+
+    Sessions and records per session are both bounded with LRU eviction.
+    """
+
+    def __init__(self, max_sessions: int = 1000, max_records_per_session: int = 50):
+        self.max_sessions = max_sessions
+        self.max_records_per_session = max_records_per_session
+        self._sessions: OrderedDict[str, OrderedDict[int, dict[str, Any]]] = (
+            OrderedDict()
+        )
+
+    def _session(self, session_id: str) -> OrderedDict[int, dict[str, Any]]:
+        records = self._sessions.get(session_id)
+        if records is None:
+            records = OrderedDict()
+            self._sessions[session_id] = records
+            if len(self._sessions) > self.max_sessions:
+                self._sessions.popitem(last=False)
+        else:
+            self._sessions.move_to_end(session_id)
+        return records
+
+    def put(self, session_id: str, properties: list[dict[str, Any]]) -> None:
+        """
+        Store the full records of a search result.
+
+        Args:
+            session_id: Conversation thread id
+            properties: Property dicts, each containing an "id" key
+        """
+        records = self._session(session_id)
+        for prop in properties:
+            records[int(prop["id"])] = prop
+            records.move_to_end(int(prop["id"]))
+        while len(records) > self.max_records_per_session:
+            records.popitem(last=False)
+
+    def get(self, session_id: str, property_id: int) -> dict[str, Any] | None:
+        """
+        Get a full record previously returned to the session.
+
+        Args:
+            session_id: Conversation thread id
+            property_id: Id of the property
+
+        Returns:
+            The full property record, or None if it isn't stored
+        """
+        records = self._sessions.get(session_id)
+        if records is None:
+            return None
+        return records.get(int(property_id))
+
+    def clear(self, session_id: str) -> None:
+        """Drop every record stored for a session."""
+        self._sessions.pop(session_id, None)
+
+
+# Global store instance
+_result_store = None
+
+
+def get_property_result_store() -> PropertyResultStore:
+    """Get or create the global property result store."""
+    global _result_store
+    if _result_store is None:
+        _result_store = PropertyResultStore()
+    return _result_store
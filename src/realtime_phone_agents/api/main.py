@@ -1,3 +1,4 @@
+import asyncio
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
@@ -5,6 +6,8 @@ from fastapi.middleware.cors import CORSMiddleware
 
 from realtime_phone_agents.api.routes import health, superlinked, voice
 from realtime_phone_agents.api.routes.voice import mount_voice_stream
+from realtime_phone_agents.api.warmup import WarmupState, build_warmup_steps
+from realtime_phone_agents.config import settings
 from realtime_phone_agents.infrastructure.superlinked.service import (
     get_property_search_service,
 )
@@ -15,9 +18,28 @@ async def lifespan(app: FastAPI):
     """Manage application lifespan - startup and shutdown events."""
     # Startup: Initialize PropertySearchService
     app.state.property_service = get_property_search_service()
+
+    # Warm up all components in the background, readiness is exposed on /health/ready
+    app.state.warmup = WarmupState()
+    warmup_task = None
+    if settings.warmup.enabled:
+        steps = build_warmup_steps(
+            app.state.property_service, getattr(app.state, "voice_agent", None)
+        )
+        warmup_task = asyncio.create_task(app.state.warmup.run(steps))
+    else:
+        await app.state.warmup.run({})
+
     yield
-    # Shutdown: Cleanup if needed
-    # Add any cleanup logic here if necessary
+
+    # Shutdown: Cancel the warmup if it is still running
+    if warmup_task is not None and not warmup_task.done():
+        warmup_task.cancel()
+
+    # Close the TTS connections opened in this event loop
+    voice_agent = getattr(app.state, "voice_agent", None)
+    if voice_agent is not None:
+        await voice_agent.tts_model.aclose()
 
 
 app = FastAPI(
@@ -1,4 +1,5 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Request
+from fastapi.responses import JSONResponse
 
 router = APIRouter(prefix="/health", tags=["health"])
 
@@ -16,3 +17,24 @@ async def health_check():
             "status": "unhealthy",
             "message": f"Service initialization failed: {str(e)}",
         }
+
+
+@router.get("/ready")
+async def readiness_check(request: Request):
+    """
+    Readiness endpoint reporting the warmup status of every component.
+
+    Returns 200 once all components are warm and 503 otherwise, so the
+    orchestrator only routes calls to warm replicas.
+    """
+    warmup = getattr(request.app.state, "warmup", None)
+    if warmup is None:
+        return JSONResponse(
+            status_code=503,
+            content={"ready": False, "message": "Warmup has not started"},
+        )
+
+    return JSONResponse(
+        status_code=200 if warmup.ready else 503,
+        content=warmup.report(),
+    )
@@ -60,3 +60,43 @@ async def search_properties(search_request: SearchRequest, request: Request):
         raise HTTPException(
             status_code=500, detail=f"Error searching properties: {str(e)}"
         )
+
+
+@router.get("/properties/{property_id}")
+async def get_property(property_id: int, request: Request):
+    """
+    Get the full record of a property by id, without running a search.
+
+    Args:
+        property_id: Id of the property
+        request: FastAPI request object to access app state
+
+    Returns:
+        The property record
+    """
+    prop = await request.app.state.property_service.get_property(property_id)
+    if prop is None:
+        raise HTTPException(
+            status_code=404, detail=f"Property not found: {property_id}"
+        )
+
+    return {"status": "success", "property": prop}
+
+
+@router.get("/stats")
+async def get_catalog_stats(request: Request, location: str | None = None):
+    """
+    Get the precomputed catalog aggregates of a neighborhood, or of the whole catalog.
+
+    Args:
+        request: FastAPI request object to access app state
+        location: Neighborhood, leave empty for the whole catalog
+
+    Returns:
+        Number of properties, min / median / max price and rooms distribution
+    """
+    stats = request.app.state.property_service.get_catalog_stats(location)
+    if stats is None:
+        raise HTTPException(status_code=404, detail=f"Unknown neighborhood: {location}")
+
+    return {"status": "success", "location": location, "stats": stats}
@@ -47,7 +47,11 @@ def mount_voice_stream(app: FastAPI):
     """
     agent = FastRTCAgent(
         thread_id=str(uuid4()),
+        output_profile="telephony" if settings.audio.telephony_output else "default",
     )
 
+    # Keep a reference so the startup warmup can prime the agent's models
+    app.state.voice_agent = agent
+
     # Mount Websocket endpoint for Twilio Integration
     agent.stream.mount(app, path="/voice")
@@ -0,0 +1,154 @@
+"""
+Startup warmup stage and readiness tracking.
+
+Every component the first call depends on (embedding model, provider
+connections, TTS, STT, LLM) is exercised concurrently at startup, so the
+first caller doesn't pay for model downloads, model loads and TLS handshakes.
+Per-component progress is exposed through `/health/ready`.
+"""
+
+import asyncio
+import time
+from typing import Awaitable, Callable, Literal
+
+import numpy as np
+from loguru import logger
+from pydantic import BaseModel, Field
+
+from realtime_phone_agents.config import settings
+
+WarmupStatus = Literal["pending", "warming", "ready", "failed"]
+
+# Half a second of silence at 16 kHz, enough to exercise the STT request path
+_SILENCE_AUDIO = (16000, np.zeros(8000, dtype=np.int16))
+
+
+class ComponentStatus(BaseModel):
+    """Warmup status of a single component."""
+
+    name: str = Field(..., description="Component name")
+    status: WarmupStatus = Field(default="pending", description="Warmup status")
+    duration_s: float | None = Field(
+        default=None, description="Time spent warming up the component"
+    )
+    error: str | None = Field(default=None, description="Warmup error, if any")
+
+
+class WarmupState:
+    """Tracks the warmup progress of every registered component."""
+
+    def __init__(self, timeout_seconds: float = settings.warmup.timeout_seconds):
+        self.timeout_seconds = timeout_seconds
+        self.components: dict[str, ComponentStatus] = {}
+        self.started_at: float | None = None
+        self.finished_at: float | None = None
+
+    @property
+    def ready(self) -> bool:
+        """True once every component has warmed up successfully."""
+        return self.finished_at is not None and all(
+            component.status == "ready" for component in self.components.values()
+        )
+
+    async def _run_component(
+        self, name: str, warmup_fn: Callable[[], Awaitable[None]]
+    ) -> None:
+        component = self.components[name]
+        component.status = "warming"
+        start = time.perf_counter()
+
+        try:
+            await asyncio.wait_for(warmup_fn(), timeout=self.timeout_seconds)
+            component.status = "ready"
+        except Exception as e:
+            component.status = "failed"
+            component.error = str(e) or type(e).__name__
+            logger.warning(f"Warmup of '{name}' failed: {component.error}")
+        finally:
+            component.duration_s = round(time.perf_counter() - start, 3)
+
+        logger.info(f"Warmup of '{name}' {component.status} in {component.duration_s}s")
+
+    async def run(self, steps: dict[str, Callable[[], Awaitable[None]]]) -> None:
+        """
+        Run all warmup steps concurrently.
+
+        Args:
+            steps: Mapping of component names to warmup coroutine factories
+        """
+        self.components = {name: ComponentStatus(name=name) for name in steps}
+        self.started_at = time.perf_counter()
+
+        await asyncio.gather(
+            *(self._run_component(name, fn) for name, fn in steps.items())
+        )
+
+        self.finished_at = time.perf_counter()
+        logger.info(
+            f"Warmup finished in {self.finished_at - self.started_at:.2f}s "
+            f"(ready: {self.ready})"
+        )
+
+    def report(self) -> dict:
+        """Return a JSON-serializable readiness report."""
+        total = None
+        if self.started_at is not None:
+            end = self.finished_at or time.perf_counter()
+            total = round(end - self.started_at, 3)
+
+        return {
+            "ready": self.ready,
+            "total_duration_s": total,
+            "components": {
+                name: component.model_dump(exclude={"name"})
+                for name, component in self.components.items()
+            },
+        }
+
+
+async def warm_up_property_search(property_service) -> None:
+    """Load the embedding model and run a dummy search end to end."""
+    await property_service.search_properties("apartment with two rooms", limit=1)
+
+
+async def warm_up_tts(tts_model, phrases: list[str] = settings.warmup.phrases) -> None:
+    """Synthesize the prebaked phrases, priming the TTS connection and decoder."""
+    await tts_model.wait_ready()
+    for phrase in phrases:
+        async for _ in tts_model.stream_tts(phrase):
+            pass
+
+
+async def warm_up_stt(stt_model) -> None:
+    """Transcribe a short silence to prime the STT model or connection."""
+    await asyncio.to_thread(stt_model.stt, _SILENCE_AUDIO)
+
+
+async def warm_up_llm(llm) -> None:
+    """Open the connection to the agent LLM with a minimal completion."""
+    await llm.ainvoke("Reply with the single word: ready")
+
+
+def build_warmup_steps(
+    property_service, agent
+) -> dict[str, Callable[[], Awaitable[None]]]:
+    """
+    Build the warmup steps for the API process.
+
+    Args:
+        property_service: The PropertySearchService instance
+        agent: The FastRTCAgent serving the voice stream
+
+    Returns:
+        Mapping of component names to warmup coroutine factories
+    """
+    steps: dict[str, Callable[[], Awaitable[None]]] = {
+        "property_search": lambda: warm_up_property_search(property_service),
+    }
+
+    if agent is not None:
+        steps["tts"] = lambda: warm_up_tts(agent.tts_model)
+        steps["stt"] = lambda: warm_up_stt(agent.stt_model)
+        steps["llm"] = lambda: warm_up_llm(agent.llm)
+
+    return steps
@@ -0,0 +1,13 @@
+"""Audio processing utilities for the agent output path."""
+
+from .mixer import EffectBedMixer
+from .scheduler import OutputScheduler, SchedulerStats
+from .telephony import TELEPHONY_SAMPLE_RATE, TelephonyOutputStage
+
+__all__ = [
+    "EffectBedMixer",
+    "OutputScheduler",
+    "SchedulerStats",
+    "TELEPHONY_SAMPLE_RATE",
+    "TelephonyOutputStage",
+]
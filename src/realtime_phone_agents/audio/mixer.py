@@ -0,0 +1,137 @@
+"""
+Real-time mixing of a looping effect bed (keyboard clicks, office ambience...)
+under the agent's speech.
+
+The bed position is tracked in seconds, so it continues seamlessly across
+chunks of different sample rates, across speech and across tool waits.
+"""
+
+from pathlib import Path
+from typing import Tuple
+
+import numpy as np
+
+from realtime_phone_agents.audio.telephony import decode_mulaw, to_float32, to_int16
+
+AudioChunk = Tuple[int, np.ndarray]  # (sample_rate, samples)
+
+
+class EffectBedMixer:
+    """Overlays a looping effect bed onto output chunks at a configured gain."""
+
+    def __init__(
+        self,
+        path: str | Path,
+        gain: float = 0.3,
+        fill_gain: float = 1.0,
+        fade_ms: int = 300,
+    ):
+        """
+        Args:
+            path: Path to the effect audio file used as the bed
+            gain: Bed gain when mixed under speech
+            fill_gain: Bed gain when it plays alone (e.g. during tool waits)
+            fade_ms: Fade-out duration when the bed is stopped
+        """
+        self.path = Path(path).resolve()
+        self.gain = gain
+        self.fill_gain = fill_gain
+        self.fade_ms = fade_ms
+
+        # Decoded bed per sample rate, looked up in the asset cache once
+        self._beds: dict[int, np.ndarray] = {}
+        self._active = False
+        self._position_s = 0.0
+        self._fade_remaining_s = 0.0
+
+    @property
+    def active(self) -> bool:
+        return self._active or self._fade_remaining_s > 0
+
+    def start(self) -> None:
+        """Start (or resume) the bed where it left off."""
+        self._active = True
+        self._fade_remaining_s = 0.0
+
+    def stop(self, fade: bool = True) -> None:
+        """Stop the bed, fading it out over the next `fade_ms` of audio."""
+        if self._active and fade:
+            self._fade_remaining_s = self.fade_ms / 1000
+        self._active = False
+
+    def reset(self) -> None:
+        """Silence the bed immediately, without a fade."""
+        self._active = False
+        self._fade_remaining_s = 0.0
+
+    def _bed(self, sample_rate: int) -> np.ndarray:
+        bed = self._beds.get(sample_rate)
+        if bed is None:
+            from realtime_phone_agents.background_effects.utils.asset_cache import (
+                get_effect_asset_cache,
+            )
+
+            bed = get_effect_asset_cache().get(self.path, sample_rate, "float32")
+            self._beds[sample_rate] = bed
+        return bed
+
+    def _next_bed_segment(self, sample_rate: int, num_samples: int) -> np.ndarray:
+        """Take the next `num_samples` of the looping bed, with the fade-out applied."""
+        bed = self._bed(sample_rate)
+        start = int(self._position_s * sample_rate) % len(bed)
+        segment = np.take(bed, np.arange(start, start + num_samples), mode="wrap")
+        self._position_s += num_samples / sample_rate
+
+        if not self._active:
+            # Linear fade from the remaining fade level down to zero
+            fade_samples = int(self._fade_remaining_s * sample_rate)
+            full_fade = max(int(self.fade_ms / 1000 * sample_rate), 1)
+            envelope = np.clip(
+                (fade_samples - np.arange(num_samples)) / full_fade, 0.0, 1.0
+            )
+            segment = segment * envelope.astype(np.float32)
+            self._fade_remaining_s = max(
+                self._fade_remaining_s - num_samples / sample_rate, 0.0
+            )
+
+        return segment
+
+    def mix(self, chunk: AudioChunk) -> AudioChunk:
+        """
+        Mix the bed under one output chunk.
+
+        Args:
+            chunk: (sample_rate, samples) as int16, float32 or uint8 μ-law
+
+        Returns:
+            The mixed chunk, in the dtype of the input (μ-law comes back as int16)
+        """
+        if not self.active:
+            return chunk
+
+        sample_rate, samples = chunk
+        if samples.dtype == np.uint8:
+            samples = decode_mulaw(samples)
+
+        speech = to_float32(samples)
+        mixed = speech + self.gain * self._next_bed_segment(sample_rate, len(speech))
+
+        if samples.dtype == np.int16:
+            return sample_rate, to_int16(mixed)
+        return sample_rate, np.clip(mixed, -1.0, 1.0)
+
+    def fill(self, sample_rate: int, duration_s: float) -> AudioChunk:
+        """
+        Produce a bed-only chunk, used to fill silence while waiting on tools.
+
+        Args:
+            sample_rate: Sample rate of the chunk (Hz)
+            duration_s: Duration of the chunk (seconds)
+
+        Returns:
+            A float32 chunk of the bed alone
+        """
+        num_samples = int(sample_rate * duration_s)
+        return sample_rate, self.fill_gain * self._next_bed_segment(
+            sample_rate, num_samples
+        )
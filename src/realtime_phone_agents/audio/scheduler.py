@@ -0,0 +1,217 @@
+"""
+Paced real-time output scheduler.
+
+TTS providers and effects deliver audio in bursts of irregular sizes (512+
+samples from Together, ~2048 per Orpheus window, 100 ms effect chunks).
+`OutputScheduler` re-frames everything to fixed-size frames and releases them
+against a playout clock, behind a small jitter buffer that grows when the
+producer can't keep up (underrun) and shrinks again once delivery is steady.
+"""
+
+import asyncio
+import time
+from collections import deque
+from typing import AsyncIterator, Tuple
+
+import numpy as np
+from loguru import logger
+from pydantic import BaseModel, Field
+
+from realtime_phone_agents.audio.telephony import decode_mulaw, to_int16
+from realtime_phone_agents.config import settings
+
+AudioChunk = Tuple[int, np.ndarray]  # (sample_rate, samples)
+
+
+class SchedulerStats(BaseModel):
+    """Playout statistics of one paced turn."""
+
+    frames: int = Field(default=0, description="Frames released")
+    underruns: int = Field(default=0, description="Times the buffer ran dry mid-turn")
+    stall_ms: float = Field(default=0.0, description="Total time spent rebuffering")
+    max_buffer_ms: float = Field(default=0.0, description="Peak buffered audio")
+    target_buffer_ms: float = Field(
+        default=0.0, description="Final jitter buffer target"
+    )
+
+
+class FrameBuffer:
+    """Re-frames chunks of any size into fixed-duration int16 frames."""
+
+    def __init__(self, frame_ms: int = 20):
+        self.frame_ms = frame_ms
+        self._sample_rate: int | None = None
+        self._pending = np.zeros(0, dtype=np.int16)
+
+    def push(self, chunk: AudioChunk) -> list[AudioChunk]:
+        """
+        Add a chunk and return every complete frame it produces.
+
+        A sample rate change flushes the partial frame of the previous rate.
+
+        Args:
+            chunk: (sample_rate, samples) as int16, float or uint8 μ-law
+
+        Returns:
+            Complete (sample_rate, int16 frame) tuples
+        """
+        sample_rate, samples = chunk
+        samples = (
+            decode_mulaw(samples) if samples.dtype == np.uint8 else to_int16(samples)
+        )
+
+        frames = []
+        if sample_rate != self._sample_rate:
+            frames.extend(self.flush())
+            self._sample_rate = sample_rate
+
+        pending = np.concatenate([self._pending, samples])
+        frame_size = sample_rate * self.frame_ms // 1000
+        complete = len(pending) // frame_size * frame_size
+
+        for start in range(0, complete, frame_size):
+            frames.append((sample_rate, pending[start : start + frame_size]))
+        self._pending = pending[complete:]
+        return frames
+
+    def flush(self) -> list[AudioChunk]:
+        """Return the partial frame, zero-padded to a full frame."""
+        if self._sample_rate is None or len(self._pending) == 0:
+            return []
+
+        frame_size = self._sample_rate * self.frame_ms // 1000
+        frame = np.zeros(frame_size, dtype=np.int16)
+        frame[: len(self._pending)] = self._pending
+        self._pending = np.zeros(0, dtype=np.int16)
+        return [(self._sample_rate, frame)]
+
+
+class OutputScheduler:
+    """
+    Paces output frames against a playout clock, behind an adaptive jitter buffer.
+
+    The producer is consumed in a background task so bursts are absorbed by the
+    buffer. Frames are released every `frame_ms`; if the buffer runs dry before
+    the producer is done, the underrun is recorded, the buffer target grows by
+    one step and playout resumes once the target depth is buffered again.
+
+    Use one scheduler per call: the buffer target carries over from one turn
+    to the next, so a call with a late producer doesn't underrun on every turn.
+    """
+
+    def __init__(
+        self,
+        frame_ms: int = settings.audio.frame_ms,
+        min_buffer_ms: int = settings.audio.jitter_buffer_min_ms,
+        max_buffer_ms: int = settings.audio.jitter_buffer_max_ms,
+        shrink_after_frames: int = settings.audio.jitter_buffer_shrink_after_frames,
+    ):
+        """
+        Args:
+            frame_ms: Duration of every output frame
+            min_buffer_ms: Initial (and minimum) jitter buffer depth before playout
+            max_buffer_ms: Maximum jitter buffer depth
+            shrink_after_frames: Steady frames after which the buffer shrinks one frame
+        """
+        self.frame_ms = frame_ms
+        self.min_buffer_frames = max(min_buffer_ms // frame_ms, 1)
+        self.max_buffer_frames = max(max_buffer_ms // frame_ms, self.min_buffer_frames)
+        self.shrink_after_frames = shrink_after_frames
+
+        self.target_frames = self.min_buffer_frames
+        self.stats = SchedulerStats()
+
+    async def _produce(
+        self,
+        chunks: AsyncIterator[AudioChunk],
+        frames: deque,
+        ready: asyncio.Event,
+    ) -> None:
+        framer = FrameBuffer(self.frame_ms)
+        try:
+            async for chunk in chunks:
+                if chunk is None:
+                    continue
+                frames.extend(framer.push(chunk))
+                ready.set()
+            frames.extend(framer.flush())
+        finally:
+            ready.set()
+
+    async def _rebuffer(
+        self, frames: deque, ready: asyncio.Event, producer: asyncio.Task
+    ) -> None:
+        """Wait until the target depth is buffered or the producer is done."""
+        while len(frames) < self.target_frames and not producer.done():
+            ready.clear()
+            await ready.wait()
+
+    async def pace(
+        self, chunks: AsyncIterator[AudioChunk]
+    ) -> AsyncIterator[AudioChunk]:
+        """
+        Re-frame and pace a stream of output chunks.
+
+        Args:
+            chunks: Output chunks, in any size, rate and sample format
+
+        Yields:
+            Fixed-duration int16 frames, released in real time
+        """
+        self.stats = SchedulerStats()
+        frames: deque[AudioChunk] = deque()
+        ready = asyncio.Event()
+        producer = asyncio.create_task(self._produce(chunks, frames, ready))
+        frame_s = self.frame_ms / 1000
+        steady_frames = 0
+
+        try:
+            await self._rebuffer(frames, ready, producer)
+            clock = time.monotonic()
+
+            while frames or not producer.done():
+                if not frames:
+                    # Underrun: the producer is late, grow the buffer and rebuffer
+                    stall_start = time.monotonic()
+                    self.stats.underruns += 1
+                    self.target_frames = min(
+                        self.target_frames + 1, self.max_buffer_frames
+                    )
+                    steady_frames = 0
+                    await self._rebuffer(frames, ready, producer)
+                    if not frames:
+                        break
+                    self.stats.stall_ms += (time.monotonic() - stall_start) * 1000
+                    clock = time.monotonic()
+
+                self.stats.max_buffer_ms = max(
+                    self.stats.max_buffer_ms, len(frames) * self.frame_ms
+                )
+                yield frames.popleft()
+                self.stats.frames += 1
+
+                steady_frames += 1
+                if steady_frames >= self.shrink_after_frames:
+                    self.target_frames = max(
+                        self.target_frames - 1, self.min_buffer_frames
+                    )
+                    steady_frames = 0
+
+                clock += frame_s
+                delay = clock - time.monotonic()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                else:
+                    # We're behind the playout clock, don't try to catch up in a burst
+                    clock = time.monotonic()
+
+            # Surface producer errors
+            await producer
+        finally:
+            producer.cancel()
+            await asyncio.gather(producer, return_exceptions=True)
+            self.stats.target_buffer_ms = self.target_frames * self.frame_ms
+            if self.stats.underruns:
+                logger.warning(f"Output underruns: {self.stats.model_dump()}")
+            else:
+                logger.debug(f"Output playout: {self.stats.model_dump()}")
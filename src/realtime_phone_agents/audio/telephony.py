@@ -0,0 +1,202 @@
+"""
+Telephony (8 kHz μ-law) audio helpers.
+
+Twilio media streams carry 8 kHz μ-law audio, while our TTS providers produce
+24 kHz int16 and effects are decoded as 16 kHz float32. Without an explicit
+output profile every chunk is resampled on its own (with edge artifacts at every
+chunk boundary) right before being sent on the wire.
+`TelephonyOutputStage` converts every outgoing chunk to 8 kHz int16 in a single
+vectorized, stateful pass, so the websocket handler only has to μ-law encode it.
+"""
+
+from typing import Tuple
+
+import numpy as np
+
+AudioChunk = Tuple[int, np.ndarray]  # (sample_rate, samples)
+
+TELEPHONY_SAMPLE_RATE = 8000
+
+_MULAW_BIAS = 0x84
+_MULAW_CLIP = 8159  # 14-bit clip level
+_MULAW_SEGMENT_ENDS = np.array(
+    [0x3F, 0x7F, 0xFF, 0x1FF, 0x3FF, 0x7FF, 0xFFF, 0x1FFF], dtype=np.int32
+)
+
+
+def to_float32(samples: np.ndarray) -> np.ndarray:
+    """Convert mono int16 or float samples to a flat float32 array in [-1, 1]."""
+    samples = np.asarray(samples).reshape(-1)
+    if samples.dtype == np.int16:
+        return samples.astype(np.float32) / 32768.0
+    return samples.astype(np.float32, copy=False)
+
+
+def to_int16(samples: np.ndarray) -> np.ndarray:
+    """Convert float samples in [-1, 1] to int16, clipping out-of-range values."""
+    samples = np.asarray(samples).reshape(-1)
+    if samples.dtype == np.int16:
+        return samples
+    return (np.clip(samples, -1.0, 1.0) * 32767).astype(np.int16)
+
+
+def encode_mulaw(samples: np.ndarray) -> np.ndarray:
+    """
+    Encode int16 PCM samples to G.711 μ-law bytes (vectorized).
+
+    Args:
+        samples: int16 PCM samples
+
+    Returns:
+        uint8 array of μ-law encoded samples
+    """
+    # Same segment search as the reference G.711 implementation on 14-bit PCM
+    pcm = to_int16(samples).astype(np.int32) >> 2
+
+    negative = pcm < 0
+    magnitude = np.minimum(np.where(negative, -pcm, pcm), _MULAW_CLIP) + (
+        _MULAW_BIAS >> 2
+    )
+    segment = np.searchsorted(_MULAW_SEGMENT_ENDS, magnitude)
+
+    mask = np.where(negative, 0x7F, 0xFF)
+    ulaw = (np.minimum(segment, 7) << 4) | ((magnitude >> (segment + 1)) & 0x0F)
+    ulaw = np.where(segment >= 8, 0x7F, ulaw)
+
+    return (ulaw ^ mask).astype(np.uint8)
+
+
+def decode_mulaw(data: bytes | np.ndarray) -> np.ndarray:
+    """
+    Decode G.711 μ-law bytes to int16 PCM samples (vectorized).
+
+    Args:
+        data: μ-law encoded bytes or uint8 array
+
+    Returns:
+        int16 PCM samples
+    """
+    ulaw = ~np.frombuffer(data, dtype=np.uint8).astype(np.int32) & 0xFF
+
+    sign = ulaw & 0x80
+    exponent = (ulaw >> 4) & 0x07
+    mantissa = ulaw & 0x0F
+
+    magnitude = (((mantissa << 3) + _MULAW_BIAS) << exponent) - _MULAW_BIAS
+    return np.where(sign != 0, -magnitude, magnitude).astype(np.int16)
+
+
+def _lowpass_taps(input_rate: int, output_rate: int, num_taps: int) -> np.ndarray:
+    """Windowed-sinc anti-aliasing filter for downsampling to `output_rate`."""
+    cutoff = 0.45 * output_rate / input_rate  # just below Nyquist, normalized
+    n = np.arange(num_taps) - (num_taps - 1) / 2
+    taps = 2 * cutoff * np.sinc(2 * cutoff * n) * np.hamming(num_taps)
+    return (taps / taps.sum()).astype(np.float32)
+
+
+class StreamingResampler:
+    """
+    Stateful resampler for chunked audio.
+
+    Filter history and the fractional read position are carried across calls,
+    so a stream resampled chunk by chunk is identical to resampling it at once.
+    """
+
+    def __init__(self, input_rate: int, output_rate: int, num_taps: int = 63):
+        self.input_rate = input_rate
+        self.output_rate = output_rate
+        self._step = input_rate / output_rate
+
+        self._taps = (
+            _lowpass_taps(input_rate, output_rate, num_taps)
+            if output_rate < input_rate
+            else None
+        )
+        self._history = (
+            np.zeros(len(self._taps) - 1, dtype=np.float32)
+            if self._taps is not None
+            else None
+        )
+        self._last_sample: np.ndarray | None = None
+        self._position = 0.0
+
+    def process(self, samples: np.ndarray) -> np.ndarray:
+        """
+        Resample the next chunk of the stream.
+
+        Args:
+            samples: Mono samples at `input_rate`
+
+        Returns:
+            float32 samples at `output_rate`
+        """
+        samples = to_float32(samples)
+        if samples.size == 0:
+            return samples
+
+        if self._taps is not None:
+            padded = np.concatenate([self._history, samples])
+            self._history = padded[-len(self._history) :]
+            samples = np.convolve(padded, self._taps, mode="valid").astype(np.float32)
+
+        if self._last_sample is not None:
+            samples = np.concatenate([self._last_sample, samples])
+
+        last_index = len(samples) - 1
+        if self._position > last_index:
+            self._position -= last_index
+            self._last_sample = samples[-1:]
+            return np.zeros(0, dtype=np.float32)
+
+        count = int((last_index - self._position) // self._step) + 1
+        positions = self._position + self._step * np.arange(count)
+        output = np.interp(positions, np.arange(len(samples)), samples)
+
+        self._position = positions[-1] + self._step - last_index
+        self._last_sample = samples[-1:]
+
+        return output.astype(np.float32)
+
+
+class TelephonyOutputStage:
+    """
+    Converts every outgoing chunk of a turn to 8 kHz int16 mono.
+
+    One resampler is kept per input rate, so TTS audio and effects at
+    different rates can be interleaved without breaking each other's state.
+    """
+
+    def __init__(self, sample_rate: int = TELEPHONY_SAMPLE_RATE):
+        self.sample_rate = sample_rate
+        self._resamplers: dict[int, StreamingResampler] = {}
+
+    def process(self, chunk: AudioChunk) -> AudioChunk:
+        """
+        Convert one output chunk to the telephony format.
+
+        Args:
+            chunk: (sample_rate, samples) with int16, float or uint8 μ-law samples
+
+        Returns:
+            (sample_rate, int16 samples) at the telephony sample rate
+        """
+        sample_rate, samples = chunk
+
+        if samples.dtype == np.uint8:
+            # Pre-encoded μ-law assets
+            samples = decode_mulaw(samples)
+
+        if sample_rate == self.sample_rate:
+            return self.sample_rate, to_int16(samples)
+
+        resampler = self._resamplers.get(sample_rate)
+        if resampler is None:
+            resampler = StreamingResampler(sample_rate, self.sample_rate)
+            self._resamplers[sample_rate] = resampler
+
+        return self.sample_rate, to_int16(resampler.process(samples))
+
+    def encode(self, chunk: AudioChunk) -> bytes:
+        """Convert one output chunk straight to μ-law bytes for the wire."""
+        _, samples = self.process(chunk)
+        return encode_mulaw(samples).tobytes()
@@ -5,6 +5,7 @@ from .registry import (
     get_avatar,
     list_avatars,
     get_all_avatars,
+    get_prompt_prefix_report,
     register_avatar,
     register_all_avatars,
     version_all_avatars,
@@ -16,6 +17,7 @@ __all__ = [
     "get_avatar",
     "list_avatars",
     "get_all_avatars",
+    "get_prompt_prefix_report",
     "register_avatar",
     "register_all_avatars",
     "version_all_avatars",
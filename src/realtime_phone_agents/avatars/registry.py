@@ -1,5 +1,6 @@
 """Avatar registry and management functions."""
 
+import os
 from pathlib import Path
 from typing import Dict, List, Optional
 from realtime_phone_agents.avatars.base import Avatar
@@ -57,6 +58,8 @@ class AvatarRegistry:
         Args:
             avatar: Avatar instance to register
         """
+        # Render the system prompt once, at load time
+        avatar.get_system_prompt()
         self._avatars[avatar.id] = avatar
     
     def get(self, avatar_id: str) -> Avatar:
@@ -106,6 +109,30 @@ class AvatarRegistry:
         """Get list of all available avatar IDs."""
         return list(self._avatars.keys())
 
+    def prompt_prefix_report(self) -> Dict[str, Dict[str, int]]:
+        """
+        Report how much of each avatar's system prompt is shared with all the others.
+
+        Provider-side prompt caching only hits on a byte-identical prefix, so the
+        shared prefix length is the cacheable part of every call.
+
+        Returns:
+            Dictionary mapping avatar IDs to their prompt and shared prefix lengths
+        """
+        prompts = {
+            avatar_id: avatar.get_system_prompt()
+            for avatar_id, avatar in self._avatars.items()
+        }
+        shared_prefix = os.path.commonprefix(list(prompts.values()))
+
+        return {
+            avatar_id: {
+                "prompt_chars": len(prompt),
+                "shared_prefix_chars": len(shared_prefix),
+            }
+            for avatar_id, prompt in prompts.items()
+        }
+
 
 # Global registry instance
 _registry = AvatarRegistry()
@@ -157,6 +184,16 @@ def register_avatar(avatar: Avatar) -> None:
     _registry.register(avatar)
 
 
+def get_prompt_prefix_report() -> Dict[str, Dict[str, int]]:
+    """
+    Report the cacheable (shared) system prompt prefix length per avatar.
+
+    Returns:
+        Dictionary mapping avatar IDs to their prompt and shared prefix lengths
+    """
+    return _registry.prompt_prefix_report()
+
+
 def register_all_avatars() -> None:
     """Register all avatars from the definitions directory."""
     registry = AvatarRegistry()
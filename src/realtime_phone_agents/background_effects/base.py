@@ -16,6 +16,7 @@ class BaseVoiceEffect(ABC):
     async def stream(self) -> AsyncIterator[AudioChunk]:
         """
         Yields (sample_rate, chunk) pairs.
-        Chunk is expected to be a float32 numpy array in [-1, 1].
+        Chunk is a float32 numpy array in [-1, 1] by default, or int16 PCM /
+        uint8 μ-law when the effect was created with another encoding.
         """
         ...
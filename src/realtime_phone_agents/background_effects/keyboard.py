@@ -1,9 +1,10 @@
 import asyncio
 from pathlib import Path
-from typing import AsyncIterator, List
+from typing import AsyncIterator
 
-from realtime_phone_agents.background_effects.utils.audio_loader import (
-    load_audio_chunks,
+from realtime_phone_agents.background_effects.utils.asset_cache import (
+    Encoding,
+    get_effect_asset_cache,
 )
 
 from .base import AudioChunk, BaseVoiceEffect
@@ -16,6 +17,8 @@ _DEFAULT_KEYBOARD_SOUND = str(_EFFECTS_DIR / "sounds" / "keyboard.mp3")
 class KeyboardEffect(BaseVoiceEffect):
     """
     Streams a keyboard typing sound for up to `max_duration_s` seconds.
+
+    The decoded sound is shared process-wide, chunks are zero-copy views into it.
     """
 
     def __init__(
@@ -24,40 +27,24 @@ class KeyboardEffect(BaseVoiceEffect):
         max_duration_s: float = 3.0,
         chunk_ms: int = 100,
         target_rate: int = 16000,
+        encoding: Encoding = "float32",
     ):
         self.path = path
         self.max_duration_s = max_duration_s
-        self.chunks: List[AudioChunk] = load_audio_chunks(
-            path=path,
-            target_rate=target_rate,
-            chunk_ms=chunk_ms,
-        )
+        self.target_rate = target_rate
+        self.samples_per_chunk = int((target_rate * chunk_ms) / 1000)
+        self.audio = get_effect_asset_cache().get(path, target_rate, encoding)
 
     async def stream(self) -> AsyncIterator[AudioChunk]:
         if self.max_duration_s <= 0:
             return
 
-        total_samples = 0
-        total_samples_allowed = None
-
-        for sample_rate, chunk in self.chunks:
-            # lazy initialize allowed sample budget
-            if total_samples_allowed is None:
-                total_samples_allowed = int(self.max_duration_s * sample_rate)
-
-            if total_samples >= total_samples_allowed:
-                break
-
-            remaining_samples = total_samples_allowed - total_samples
-
-            # Trim last chunk if needed
-            if len(chunk) > remaining_samples:
-                chunk = chunk[:remaining_samples]
-
-            if len(chunk) == 0:
-                break
+        total_samples = min(
+            len(self.audio), int(self.max_duration_s * self.target_rate)
+        )
 
-            yield (sample_rate, chunk)
-            total_samples += len(chunk)
+        for start in range(0, total_samples, self.samples_per_chunk):
+            end = min(start + self.samples_per_chunk, total_samples)
+            yield (self.target_rate, self.audio[start:end])
 
             await asyncio.sleep(0)
@@ -0,0 +1,117 @@
+"""
+Process-wide cache of decoded background effect assets.
+
+Each effect file is decoded through pydub/ffmpeg at most once per process and
+kept as one contiguous array per target format (sample rate + encoding).
+Effects hand out zero-copy slices of these arrays instead of copying chunks.
+Decoded arrays can optionally be persisted as `.npy` next to the source file,
+so ffmpeg isn't spawned at all once they exist.
+"""
+
+import threading
+from pathlib import Path
+from typing import Literal
+
+import numpy as np
+from loguru import logger
+
+from realtime_phone_agents.audio.telephony import (
+    StreamingResampler,
+    encode_mulaw,
+    to_int16,
+)
+from realtime_phone_agents.config import settings
+
+Encoding = Literal["float32", "int16", "mulaw"]
+
+
+class EffectAssetCache:
+    """Decodes effect files once and stores one contiguous array per format."""
+
+    def __init__(self, persist: bool = settings.effects.persist_decoded_assets):
+        self.persist = persist
+        self._assets: dict[tuple[str, int, Encoding], np.ndarray] = {}
+        self._sources: dict[str, tuple[int, np.ndarray]] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _npy_path(path: Path, sample_rate: int, encoding: Encoding) -> Path:
+        return path.with_name(f"{path.name}.{sample_rate}.{encoding}.npy")
+
+    def _decode_source(self, path: Path) -> tuple[int, np.ndarray]:
+        """Decode the source file once, at its native rate, to float32 mono."""
+        key = str(path)
+        if key not in self._sources:
+            from pydub import AudioSegment
+
+            logger.debug(f"Decoding effect asset {path}")
+            audio = AudioSegment.from_file(path).set_channels(1)
+            samples = np.array(audio.get_array_of_samples()).astype(np.float32)
+            samples /= float(1 << (8 * audio.sample_width - 1))
+            self._sources[key] = (audio.frame_rate, samples)
+        return self._sources[key]
+
+    def _build(self, path: Path, sample_rate: int, encoding: Encoding) -> np.ndarray:
+        npy_path = self._npy_path(path, sample_rate, encoding)
+        if npy_path.exists() and npy_path.stat().st_mtime >= path.stat().st_mtime:
+            return np.load(npy_path)
+
+        source_rate, samples = self._decode_source(path)
+        if source_rate != sample_rate:
+            samples = StreamingResampler(source_rate, sample_rate).process(samples)
+
+        if encoding == "int16":
+            audio = to_int16(samples)
+        elif encoding == "mulaw":
+            audio = encode_mulaw(samples)
+        else:
+            audio = np.ascontiguousarray(samples, dtype=np.float32)
+
+        if self.persist:
+            try:
+                np.save(npy_path, audio)
+            except OSError as e:
+                logger.warning(f"Couldn't persist decoded effect asset {npy_path}: {e}")
+
+        return audio
+
+    def get(
+        self, path: str | Path, sample_rate: int, encoding: Encoding = "float32"
+    ) -> np.ndarray:
+        """
+        Get an effect as one contiguous, read-only array in the requested format.
+
+        Args:
+            path: Path to the effect audio file
+            sample_rate: Target sample rate (Hz)
+            encoding: "float32" in [-1, 1], "int16" PCM or "mulaw" (uint8 G.711)
+
+        Returns:
+            The decoded audio array, shared by every caller
+        """
+        path = Path(path).resolve()
+        key = (str(path), sample_rate, encoding)
+
+        audio = self._assets.get(key)
+        if audio is not None:
+            return audio
+
+        with self._lock:
+            audio = self._assets.get(key)
+            if audio is None:
+                audio = self._build(path, sample_rate, encoding)
+                audio.setflags(write=False)
+                self._assets[key] = audio
+        return audio
+
+
+# Global cache instance
+_effect_asset_cache = None
+
+
+def get_effect_asset_cache() -> EffectAssetCache:
+    """Get or create the global effect asset cache."""
+    global _effect_asset_cache
+    if _effect_asset_cache is None:
+        _effect_asset_cache = EffectAssetCache()
+    return _effect_asset_cache
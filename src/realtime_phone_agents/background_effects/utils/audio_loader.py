@@ -1,7 +1,10 @@
 from typing import List, Tuple
 
 import numpy as np
-from pydub import AudioSegment
+
+from realtime_phone_agents.background_effects.utils.asset_cache import (
+    get_effect_asset_cache,
+)
 
 AudioChunk = Tuple[int, np.ndarray]  # (sample_rate, samples)
 
@@ -11,20 +14,12 @@ def load_audio_chunks(
 ) -> List[AudioChunk]:
     """
     Load an audio file and split it into float32 [-1, 1] chunks suitable
-    for the voice pipeline.
+    for the voice pipeline. Chunks are views into the cached decoded asset.
     """
-    audio = AudioSegment.from_file(path).set_channels(1).set_frame_rate(target_rate)
-
-    samples = np.array(audio.get_array_of_samples()).astype(np.float32)
-    samples /= 32768.0  # normalize int16 to float32
+    samples = get_effect_asset_cache().get(path, target_rate, "float32")
 
     samples_per_chunk = int((target_rate * chunk_ms) / 1000)
-    chunks: List[AudioChunk] = []
-
-    for i in range(0, len(samples), samples_per_chunk):
-        chunk = samples[i : i + samples_per_chunk]
-        if len(chunk) == 0:
-            continue
-        chunks.append((target_rate, chunk))
-
-    return chunks
+    return [
+        (target_rate, samples[i : i + samples_per_chunk])
+        for i in range(0, len(samples), samples_per_chunk)
+    ]
@@ -1,4 +1,4 @@
-from typing import ClassVar
+from typing import ClassVar, Literal
 
 from pydantic import BaseModel, Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -40,6 +40,84 @@ class SuperlinkedSettings(BaseModel):
     price_max_value: int = Field(
         default=10000000, description="Maximum value for appartment price in euros"
     )
+    in_memory_snapshot_enabled: bool = Field(
+        default=True,
+        description="Persist and restore the InMemoryExecutor fallback index from a binary snapshot",
+    )
+    in_memory_snapshot_dir: str = Field(
+        default="data/.superlinked_snapshot",
+        description="Directory where the InMemoryExecutor snapshot is stored",
+    )
+    search_backend: Literal["qdrant", "in_memory", "numpy"] = Field(
+        default="qdrant",
+        description=(
+            "Search backend: 'qdrant' (falls back to 'in_memory' if unreachable), "
+            "'in_memory' (Superlinked InMemoryExecutor) or 'numpy' (InMemoryExecutor "
+            "with vectorized exact search, for catalogs that fit in RAM)"
+        ),
+    )
+    query_encoder: Literal["torch", "int8", "onnx"] = Field(
+        default="torch",
+        description=(
+            "Encoder of search queries: 'torch' (the embedding model as is), 'int8' "
+            "(dynamically quantized) or 'onnx' (ONNX Runtime, needs the onnx extra)"
+        ),
+    )
+    query_encoder_threads: int = Field(
+        default=2,
+        description="CPU threads of the onnx query encoder's session, so searches don't starve the audio work (0 keeps the defaults, torch threads are process-wide and left alone)",
+    )
+    query_embedding_cache_size: int = Field(
+        default=1024,
+        description="Query embeddings kept in an LRU cache keyed by normalized text (0 disables it)",
+    )
+    query_encoder_min_cosine: float = Field(
+        default=0.99,
+        description="Minimum cosine agreement of the int8/onnx encoder with the embedding model, below it queries use the model as is",
+    )
+
+
+# --- Property Search Tool Configuration ---
+class PropertyToolSettings(BaseModel):
+    compact_output: bool = Field(
+        default=True,
+        description="Return compact property summaries to the agent instead of full records",
+    )
+    summary_fields: list[str] = Field(
+        default=["id", "price", "location", "rooms", "baths"],
+        description="Property fields included in the compact summaries",
+    )
+    description_max_chars: int = Field(
+        default=0,
+        description="Maximum description length in compact summaries (0 drops it). "
+        "Searches then read the full descriptions from the vector database",
+    )
+    structured_search: bool = Field(
+        default=True,
+        description="Give the agent the structured-filter search tool, whose filters are "
+        "tool arguments, instead of the natural language one (saves an OpenAI call per search)",
+    )
+    cursor_size: int = Field(
+        default=5,
+        description="Properties fetched once per distinct search and kept per session, "
+        "so the agent can go through them without searching again",
+    )
+
+
+# --- Search Prefetch Configuration ---
+class PrefetchSettings(BaseModel):
+    enabled: bool = Field(
+        default=True,
+        description="Start property searches speculatively from the transcription",
+    )
+    limit: int = Field(
+        default=5,
+        description="Number of properties fetched by a speculative search, "
+        "at least property_tool.cursor_size for the tools to use it",
+    )
+    ttl_seconds: float = Field(
+        default=30.0, description="Maximum age of a prefetched result"
+    )
 
 
 # --- Qdrant Configuration ---
@@ -49,6 +127,49 @@ class QdrantSettings(BaseModel):
     api_key: str = Field(default="", description="Qdrant API Key")
     cluster_url: str = Field(default="", description="Qdrant Cluster URL")
     use_qdrant_cloud: bool = Field(default=True, description="Use Qdrant Cloud")
+    payload_indexes: bool = Field(
+        default=True,
+        description="Verify (and create if missing) payload indexes for the filter fields "
+        "at startup and after ingestion",
+    )
+    transport: Literal["http", "grpc"] = Field(
+        default="http",
+        description="Transport used for searches and upserts (grpc keeps persistent channels)",
+    )
+    grpc_port: int = Field(default=6334, description="Qdrant gRPC Port")
+    pool_size: int = Field(
+        default=4,
+        description="gRPC channels kept open to Qdrant per client (grpc transport only)",
+    )
+    timeout_s: int = Field(default=10, description="Qdrant request timeout (seconds)")
+    grpc_keepalive_s: int = Field(
+        default=30,
+        description="Keepalive ping interval of the gRPC channels, so idle channels stay open between calls",
+    )
+    search_algorithm: Literal["flat", "hnsw"] = Field(
+        default="flat",
+        description="Exact (flat) or approximate (hnsw) vector search; quantization only speeds up hnsw",
+    )
+    quantization: Literal["none", "scalar", "binary"] = Field(
+        default="none",
+        description="Quantized copies of the vectors: scalar (int8, 4x smaller) or binary (1 bit, 32x smaller)",
+    )
+    quantization_always_ram: bool = Field(
+        default=True,
+        description="Keep the quantized vectors in RAM, even with on-disk storage",
+    )
+    oversampling: float = Field(
+        default=2.0,
+        description="Candidates preselected with quantized vectors, as a multiple of the limit",
+    )
+    rescore: bool = Field(
+        default=True,
+        description="Re-score quantized candidates with the original vectors",
+    )
+    on_disk: bool = Field(
+        default=False,
+        description="Store original vectors, HNSW graph and payload on disk instead of RAM",
+    )
 
 
 # --- RunPod Configuration ---
@@ -70,6 +191,28 @@ class FasterWhisperSettings(BaseModel):
     model: str = Field(
         default="Systran/faster-whisper-large-v3", description="Faster Whisper Model"
     )
+    api_urls: list[str] = Field(
+        default=[],
+        description="Additional Faster Whisper endpoints, pooled with api_url",
+    )
+    max_concurrency_per_endpoint: int = Field(
+        default=4, description="Concurrent transcriptions allowed per endpoint"
+    )
+    queue_timeout_s: float = Field(
+        default=2.0,
+        description="How long a request waits for a free endpoint slot (seconds)",
+    )
+    request_timeout_s: float = Field(
+        default=10.0, description="Timeout of a single transcription request (seconds)"
+    )
+    failure_cooldown_s: float = Field(
+        default=15.0,
+        description="How long a failing endpoint is left out of rotation (seconds)",
+    )
+    local_standby: bool = Field(
+        default=False,
+        description="Keep a warm local Moonshine model for when every endpoint is saturated",
+    )
 
 
 # --- Orpheus TTS Configuration (RunPod) ---
@@ -77,6 +220,24 @@ class OrpheusTTSSettings(BaseModel):
     api_url: str = Field(
         default="http://localhost:8000", description="Orpheus TTS API URL"
     )
+    api_urls: list[str] = Field(
+        default=[],
+        description="Additional Orpheus endpoints, pooled with api_url for load balancing",
+    )
+    routing: Literal["least_outstanding", "throughput"] = Field(
+        default="least_outstanding",
+        description="How utterances are routed across Orpheus endpoints",
+    )
+    health_check_interval_s: float = Field(
+        default=10.0, description="Interval between endpoint health probes (seconds)"
+    )
+    health_check_timeout_s: float = Field(
+        default=2.0, description="Timeout of a single endpoint health probe (seconds)"
+    )
+    max_attempts: int = Field(
+        default=2,
+        description="Endpoints tried for an utterance that fails before any audio is emitted",
+    )
     model: str = Field(default="orpheus-3b-0.1-ft", description="Orpheus TTS Model")
     voice: str = Field(default="mia", description="Default voice")
     temperature: float = Field(default=0.6, description="Temperature for generation")
@@ -85,6 +246,39 @@ class OrpheusTTSSettings(BaseModel):
     repetition_penalty: float = Field(default=1.1, description="Repetition penalty")
     sample_rate: int = Field(default=24000, description="Audio sample rate (Hz)")
     debug: bool = Field(default=False, description="Enable debug mode")
+    decode_workers: int = Field(
+        default=0,
+        description="SNAC decode worker processes (0 decodes inside the API process)",
+    )
+    decode_torch_threads: int = Field(
+        default=1, description="torch threads of each SNAC decode worker"
+    )
+    decode_slots: int = Field(
+        default=64, description="Token windows that can be in flight in the decode pool"
+    )
+    decode_timeout_s: float = Field(
+        default=2.0,
+        description="Wait for a window from the decode pool before decoding it in-process (seconds)",
+    )
+    decode_max_restarts: int = Field(
+        default=3,
+        description="Dead SNAC decode workers restarted before the pool shrinks",
+    )
+    decode_startup_timeout_s: float = Field(
+        default=120.0,
+        description="Wait for a window while the decode workers still load SNAC (seconds)",
+    )
+    snac_backend: Literal["torch", "onnx", "onnx-int8"] = Field(
+        default="torch",
+        description="SNAC decoder backend: PyTorch reference, ONNX Runtime or int8 ONNX (the onnx ones need the onnx extra)",
+    )
+    snac_onnx_dir: str = Field(
+        default="data/.snac", description="Where exported SNAC ONNX models are cached"
+    )
+    snac_min_snr_db: float = Field(
+        default=25.0,
+        description="Minimum SNR against the torch reference for an alternative SNAC backend (dB)",
+    )
 
 
 # --- Together AI TTS Configuration ---
@@ -100,6 +294,136 @@ class TogetherTTSSettings(BaseModel):
     sample_rate: int = Field(default=24000, description="Audio sample rate (Hz)")
 
 
+# --- Audio Output Configuration ---
+class AudioSettings(BaseModel):
+    telephony_output: bool = Field(
+        default=True,
+        description="Use the native 8 kHz telephony output profile for Twilio calls",
+    )
+    telephony_sample_rate: int = Field(
+        default=8000, description="Sample rate of the telephony output (Hz)"
+    )
+    telephony_tts_sample_rate: int = Field(
+        default=8000,
+        description="Sample rate requested from TTS providers that support it, in the telephony profile (Hz)",
+    )
+    effect_bed_enabled: bool = Field(
+        default=True,
+        description="Mix the effect under speech and tool waits instead of playing it sequentially",
+    )
+    effect_bed_gain: float = Field(
+        default=0.3, description="Gain of the effect bed when mixed under speech"
+    )
+    effect_bed_fill_gain: float = Field(
+        default=1.0,
+        description="Gain of the effect bed when it plays alone during tool waits",
+    )
+    effect_bed_fade_ms: int = Field(
+        default=300,
+        description="Fade-out of the effect bed when the answer starts (ms)",
+    )
+    effect_bed_fill_chunk_ms: int = Field(
+        default=100,
+        description="Duration of each bed-only chunk emitted during tool waits (ms)",
+    )
+    paced_output: bool = Field(
+        default=True,
+        description="Re-frame output into fixed frames and pace it against a playout clock",
+    )
+    frame_ms: int = Field(
+        default=20, description="Duration of every paced output frame (ms)"
+    )
+    jitter_buffer_min_ms: int = Field(
+        default=60, description="Initial and minimum jitter buffer depth (ms)"
+    )
+    jitter_buffer_max_ms: int = Field(
+        default=300, description="Maximum jitter buffer depth after underruns (ms)"
+    )
+    jitter_buffer_shrink_after_frames: int = Field(
+        default=250,
+        description="Underrun-free frames after which the jitter buffer shrinks by one frame",
+    )
+
+
+# --- End-of-Turn Detection Configuration ---
+class EndpointingSettings(BaseModel):
+    adaptive: bool = Field(
+        default=True,
+        description="Adapt the end-of-turn silence to each caller instead of ReplyOnPause's fixed 0.6 s chunks",
+    )
+    window_ms: int = Field(
+        default=200, description="Duration of the windows fed to the VAD (ms)"
+    )
+    preroll_ms: int = Field(
+        default=600,
+        description="Audio kept from before a turn started, so its onset isn't lost (ms)",
+    )
+    started_talking_ms: int = Field(
+        default=200, description="Speech after which the caller started a turn (ms)"
+    )
+    speech_ms: int = Field(
+        default=60,
+        description="Speech in a window above which the window is voiced (ms)",
+    )
+    default_wait_ms: int = Field(
+        default=600,
+        description="Silence that ends a turn until the caller's pauses are known (ms)",
+    )
+    min_wait_ms: int = Field(
+        default=250, description="Shortest silence that ends a turn (ms)"
+    )
+    max_wait_ms: int = Field(
+        default=1500, description="Longest silence needed to end a turn (ms)"
+    )
+    min_pauses: int = Field(
+        default=3,
+        description="Pauses learned before the caller's rhythm replaces the default wait",
+    )
+    pause_margin_std: float = Field(
+        default=1.0,
+        description="Standard deviations of the caller's pauses added to their mean to get the wait",
+    )
+    pause_alpha: float = Field(
+        default=0.2,
+        description="Weight of each new pause in the caller's moving statistics",
+    )
+    falling_energy_ratio: float = Field(
+        default=0.5,
+        description="Last voiced window energy, relative to the turn's median, below which the turn is fading out",
+    )
+    falling_wait_factor: float = Field(
+        default=0.5, description="Wait multiplier of fading turns"
+    )
+    sustained_energy_ratio: float = Field(
+        default=1.2,
+        description="Last voiced window energy, relative to the turn's median, above which the turn stopped abruptly",
+    )
+    sustained_wait_factor: float = Field(
+        default=1.3, description="Wait multiplier of abruptly stopped turns"
+    )
+    resume_window_ms: int = Field(
+        default=800,
+        description="Speech this soon after a cutoff makes it a false cutoff (ms)",
+    )
+    false_cutoff_step: float = Field(
+        default=0.1,
+        description="Increase of the caller's wait margin after a false cutoff",
+    )
+    max_margin: float = Field(default=2.0, description="Largest wait margin")
+    margin_decay: float = Field(
+        default=0.05,
+        description="Decrease of the wait margin (toward 1) after a turn that ended well",
+    )
+
+
+# --- Background Effects Configuration ---
+class EffectsSettings(BaseModel):
+    persist_decoded_assets: bool = Field(
+        default=True,
+        description="Persist decoded effect assets as .npy next to the source file",
+    )
+
+
 # --- Opik Configuration ---
 class OpikSettings(BaseModel):
     api_key: str = Field(default="", description="Opik API Key")
@@ -112,18 +436,36 @@ class TwilioSettings(BaseModel):
     auth_token: str = Field(default="", description="Twilio Auth Token")
 
 
+# --- Warmup Configuration ---
+class WarmupSettings(BaseModel):
+    enabled: bool = Field(default=True, description="Run the startup warmup stage")
+    timeout_seconds: float = Field(
+        default=180.0, description="Maximum time allowed per warmup component"
+    )
+    phrases: list[str] = Field(
+        default=["Let me look for that in the system"],
+        description="Phrases synthesized during warmup to prime the TTS model",
+    )
+
+
 # --- Settings Configuration ---
 class Settings(BaseSettings):
     groq: GroqSettings = Field(default_factory=GroqSettings)
     openai: OpenAISettings = Field(default_factory=OpenAISettings)
     superlinked: SuperlinkedSettings = Field(default_factory=SuperlinkedSettings)
+    property_tool: PropertyToolSettings = Field(default_factory=PropertyToolSettings)
+    prefetch: PrefetchSettings = Field(default_factory=PrefetchSettings)
     qdrant: QdrantSettings = Field(default_factory=QdrantSettings)
     runpod: RunPodSettings = Field(default_factory=RunPodSettings)
     faster_whisper: FasterWhisperSettings = Field(default_factory=FasterWhisperSettings)
     orpheus: OrpheusTTSSettings = Field(default_factory=OrpheusTTSSettings)
     together: TogetherTTSSettings = Field(default_factory=TogetherTTSSettings)
+    audio: AudioSettings = Field(default_factory=AudioSettings)
+    endpointing: EndpointingSettings = Field(default_factory=EndpointingSettings)
+    effects: EffectsSettings = Field(default_factory=EffectsSettings)
     opik: OpikSettings = Field(default_factory=OpikSettings)
     twilio: TwilioSettings = Field(default_factory=TwilioSettings)
+    warmup: WarmupSettings = Field(default_factory=WarmupSettings)
 
     stt_model: str = Field(
         default="whisper-groq",
@@ -0,0 +1,134 @@
+"""
+Precomputed catalog aggregates for count and price range questions.
+
+"How many apartments do you have in Retiro?" or "what's the cheapest in
+Salamanca?" can't be answered by a semantic search with a limit. The
+aggregates of every neighborhood in NEIGHBORHOODS (and of the whole catalog)
+are kept up to date at ingestion instead, one property at a time, so reading
+them costs a dict lookup:
+
+- count
+- min / median / max price (prices kept sorted, so the median is an index)
+- rooms distribution
+
+Properties are keyed by id, re-ingesting a property replaces its previous
+values instead of counting it twice.
+"""
+
+from bisect import bisect_left, insort
+from collections import Counter
+from typing import Any, Iterable
+
+from realtime_phone_agents.infrastructure.superlinked.constants import NEIGHBORHOODS
+
+
+class _Stats:
+    """Aggregates of one group of properties."""
+
+    def __init__(self):
+        self.prices: list[int] = []
+        self.rooms: Counter[int] = Counter()
+        self._summary: dict[str, Any] | None = None
+
+    def add(self, price: int, rooms: int) -> None:
+        insort(self.prices, price)
+        self.rooms[rooms] += 1
+        self._summary = None
+
+    def remove(self, price: int, rooms: int) -> None:
+        del self.prices[bisect_left(self.prices, price)]
+        self.rooms[rooms] -= 1
+        if not self.rooms[rooms]:
+            del self.rooms[rooms]
+        self._summary = None
+
+    def summary(self) -> dict[str, Any]:
+        if self._summary is None:
+            count, prices = len(self.prices), self.prices
+            median = None
+            if count:
+                middle = count // 2
+                median = (
+                    prices[middle]
+                    if count % 2
+                    else (prices[middle - 1] + prices[middle]) // 2
+                )
+            self._summary = {
+                "count": count,
+                "min_price": prices[0] if count else None,
+                "median_price": median,
+                "max_price": prices[-1] if count else None,
+                "rooms": {str(rooms): n for rooms, n in sorted(self.rooms.items())},
+            }
+        return self._summary
+
+
+class CatalogAggregates:
+    """Per-neighborhood and catalog-wide aggregates, updated incrementally."""
+
+    def __init__(self, neighborhoods: list[str] = NEIGHBORHOODS):
+        self.neighborhoods = neighborhoods
+        self._catalog = _Stats()
+        self._by_location = {location: _Stats() for location in neighborhoods}
+        self._properties: dict[str, tuple[str, int, int]] = {}
+
+    def __len__(self) -> int:
+        return len(self._properties)
+
+    def _groups(self, location: str) -> list[_Stats]:
+        groups = [self._catalog]
+        if location in self._by_location:
+            groups.append(self._by_location[location])
+        return groups
+
+    def upsert(self, property_id: Any, location: str, price: int, rooms: int) -> None:
+        """
+        Add a property, or replace the values of an already known one.
+
+        Args:
+            property_id: Id of the property
+            location: Neighborhood of the property
+            price: Price in euros
+            rooms: Number of rooms
+        """
+        key = str(property_id)
+        values = (location, int(price), int(rooms))
+        previous = self._properties.get(key)
+        if previous == values:
+            return
+
+        if previous is not None:
+            for stats in self._groups(previous[0]):
+                stats.remove(*previous[1:])
+
+        self._properties[key] = values
+        for stats in self._groups(location):
+            stats.add(*values[1:])
+
+    def upsert_many(self, records: Iterable[dict[str, Any]]) -> None:
+        """Upsert property records, each with "id", "location", "price" and "rooms" keys."""
+        for record in records:
+            self.upsert(
+                record["id"], record["location"], record["price"], record["rooms"]
+            )
+
+    def clear(self) -> None:
+        """Forget every property."""
+        self.__init__(self.neighborhoods)
+
+    def get(self, location: str | None = None) -> dict[str, Any] | None:
+        """
+        Get the aggregates of a neighborhood, or of the whole catalog.
+
+        Args:
+            location: One of the neighborhoods, None for the whole catalog
+
+        Returns:
+            count, min / median / max price and rooms distribution, or None
+            if the location isn't one of the neighborhoods
+        """
+        if location is None:
+            return self._catalog.summary()
+
+        stats = self._by_location.get(location)
+        return stats.summary() if stats is not None else None
@@ -1,3 +1,6 @@
+import hashlib
+from importlib.metadata import version
+
 from superlinked import framework as sl
 
 from realtime_phone_agents.config import settings
@@ -36,13 +39,36 @@ price_space = sl.NumberSpace(
     mode=sl.Mode.MINIMUM,
 )
 
+# Fields used in query filters, each one gets a payload index in Qdrant
+property_filter_fields = [
+    property_schema.rooms,
+    property_schema.baths,
+    property_schema.sqft,
+    property_schema.price,
+    property_schema.location,
+]
+
 property_index = sl.Index(
     spaces=[description_space, size_space, price_space],
-    fields=[
-        property_schema.rooms,
-        property_schema.baths,
-        property_schema.sqft,
-        property_schema.price,
-        property_schema.location,
-    ],
+    fields=property_filter_fields,
 )
+
+
+def property_index_fingerprint() -> str:
+    """
+    Hash everything the stored vectors depend on.
+
+    That's the schema, the configuration of every space (embedding model,
+    number ranges and modes...) and the Superlinked version. Vectors stored
+    with another fingerprint can't be searched with the current index.
+    """
+    spaces = [description_space, size_space, price_space]
+    config = [
+        version("superlinked"),
+        *(
+            f"{field.name}:{type(field).__name__}"
+            for field in property_schema.schema_fields
+        ),
+        *(repr(space.transformation_config) for space in spaces),
+    ]
+    return hashlib.sha256("\n".join(config).encode()).hexdigest()
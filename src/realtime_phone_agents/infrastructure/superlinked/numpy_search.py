@@ -0,0 +1,195 @@
+"""
+Vectorized exact search for the InMemoryExecutor.
+
+Superlinked's `InMemorySearch.knn_search` evaluates the filters and the dot
+product row by row in Python. `NumpyKNNSearch` is a drop-in replacement that
+keeps the indexed vectors in one contiguous float32 matrix and every filtered
+field in a column array, and answers a search with vectorized filter masks, a
+masked matrix-vector product and an `argpartition` top-k.
+
+Everything else (query vectors, filters, result conversion) still goes
+through Superlinked, so results are the ones of the InMemoryExecutor, ranked
+the same way: by score, ties broken by row id.
+"""
+
+import operator
+from collections import defaultdict
+from typing import Any, Sequence
+
+import numpy as np
+from superlinked.framework.common.interface.comparison_operation_type import (
+    ComparisonOperationType,
+)
+from superlinked.framework.storage.in_memory.in_memory_search import (
+    UNLIMITED_SEARCH_RESULTS,
+    InMemorySearch,
+)
+
+_NUMERIC_OPERATORS = {
+    ComparisonOperationType.GREATER_THAN: operator.gt,
+    ComparisonOperationType.LESS_THAN: operator.lt,
+    ComparisonOperationType.GREATER_EQUAL: operator.ge,
+    ComparisonOperationType.LESS_EQUAL: operator.le,
+}
+
+# Below this share of matching rows, gather the rows before the product
+_GATHER_SELECTIVITY = 0.5
+
+
+class _VectorMatrix:
+    """Indexed vectors of one vector field, stacked in a float32 matrix."""
+
+    def __init__(self, positions: np.ndarray, matrix: np.ndarray):
+        self.positions = positions
+        self.matrix = matrix
+
+
+class NumpyKNNSearch(InMemorySearch):
+    """Drop-in replacement of `InMemorySearch` with vectorized kNN search."""
+
+    def __init__(self):
+        super().__init__()
+        self._vdb: dict[str, dict[str, Any]] | None = None
+        self._row_ids = np.empty(0, dtype=object)
+        self._matrices: dict[str, _VectorMatrix] = {}
+        self._columns: dict[str, np.ndarray] = {}
+        self._numeric_columns: dict[str, np.ndarray | None] = {}
+
+    def invalidate(self) -> None:
+        """Drop the arrays, they are rebuilt from the VDB on the next search."""
+        self._vdb = None
+
+    def _ensure_built(self, vdb: dict[str, dict[str, Any]]) -> None:
+        # Rows are only added by ingestion, which also invalidates the arrays
+        if self._vdb is vdb and len(self._row_ids) == len(vdb):
+            return
+
+        self._vdb = vdb
+        self._row_ids = np.array(list(vdb.keys()), dtype=object)
+        self._matrices.clear()
+        self._columns.clear()
+        self._numeric_columns.clear()
+
+    def _matrix(self, name: str) -> _VectorMatrix:
+        if name not in self._matrices:
+            positions, vectors = [], []
+            for position, row_id in enumerate(self._row_ids):
+                vector = self._vdb[row_id].get(name)
+                if vector is not None and not vector.is_empty:
+                    positions.append(position)
+                    vectors.append(vector.value)
+
+            matrix = (
+                np.ascontiguousarray(np.stack(vectors), dtype=np.float32)
+                if vectors
+                else np.empty((0, 0), dtype=np.float32)
+            )
+            self._matrices[name] = _VectorMatrix(
+                np.array(positions, dtype=np.int64), matrix
+            )
+        return self._matrices[name]
+
+    def _column(self, name: str) -> np.ndarray:
+        if name not in self._columns:
+            self._columns[name] = np.array(
+                [self._vdb[row_id].get(name) for row_id in self._row_ids], dtype=object
+            )
+        return self._columns[name]
+
+    def _numeric_column(self, name: str) -> np.ndarray | None:
+        """The column as float64, missing values as NaN (None if it isn't numeric)."""
+        if name not in self._numeric_columns:
+            values = self._column(name)
+            try:
+                column = np.array(
+                    [np.nan if v is None else v for v in values], dtype=np.float64
+                )
+            except (TypeError, ValueError):
+                column = None
+            self._numeric_columns[name] = column
+        return self._numeric_columns[name]
+
+    def _filter_mask(self, filter_) -> np.ndarray:
+        """Rows matching one filter, with the semantics of `ComparisonOperation.evaluate`."""
+        name = filter_._operand.name
+        op, other = filter_._op, filter_._other
+
+        if op in _NUMERIC_OPERATORS and isinstance(other, (int, float)):
+            column = self._numeric_column(name)
+            if column is not None:
+                # NaN (missing) compares False, like `value is not None and ...`
+                return _NUMERIC_OPERATORS[op](column, other)
+
+        column = self._column(name)
+        if op == ComparisonOperationType.EQUAL:
+            return np.asarray(column == other, dtype=bool)
+        if op == ComparisonOperationType.NOT_EQUAL:
+            return np.asarray(column != other, dtype=bool)
+
+        # Any other operation, evaluated row by row
+        return np.fromiter(
+            (filter_.evaluate(v) for v in column), dtype=bool, count=len(column)
+        )
+
+    def _filters_mask(self, filters: Sequence | None) -> np.ndarray | None:
+        """AND of the ungrouped filters and of every OR group, None without filters."""
+        if not filters:
+            return None
+
+        groups: dict[int | None, list] = defaultdict(list)
+        for filter_ in filters:
+            groups[filter_._group_key].append(filter_)
+
+        mask = np.ones(len(self._row_ids), dtype=bool)
+        for group_key, group in groups.items():
+            masks = [self._filter_mask(filter_) for filter_ in group]
+            combine = np.logical_and if group_key is None else np.logical_or
+            mask &= combine.reduce(masks)
+        return mask
+
+    async def knn_search(
+        self,
+        index_config,
+        vdb,
+        search_params,
+    ) -> Sequence[tuple[str, float]]:
+        self._ensure_built(vdb)
+
+        vectors = self._matrix(search_params.vector_field.name)
+        if vectors.matrix.shape[0] == 0:
+            # Nothing indexed with this vector yet, the (0, 0) matrix fits no query
+            return []
+        query = np.asarray(search_params.vector_field.value.value, dtype=np.float32)
+
+        mask = self._filters_mask(search_params.filters)
+        if mask is None:
+            positions, scores = vectors.positions, vectors.matrix @ query
+        else:
+            selected = mask[vectors.positions]
+            if selected.mean() < _GATHER_SELECTIVITY:
+                rows = np.flatnonzero(selected)
+                positions, scores = (
+                    vectors.positions[rows],
+                    vectors.matrix[rows] @ query,
+                )
+            else:
+                scores = vectors.matrix @ query
+                positions, scores = vectors.positions[selected], scores[selected]
+
+        if search_params.radius:
+            within = scores >= 1 - search_params.radius
+            positions, scores = positions[within], scores[within]
+
+        limit = search_params.limit
+        if limit != UNLIMITED_SEARCH_RESULTS and 0 < limit < len(scores):
+            # Keep every row tied with the k-th score, ties are ranked by row id below
+            cut = len(scores) - limit
+            kth = scores[np.argpartition(scores, cut)[cut]]
+            top = np.flatnonzero(scores >= kth)
+            positions, scores = positions[top], scores[top]
+
+        row_ids = self._row_ids[positions]
+        ranked = sorted(
+            zip(row_ids, scores.tolist()), key=lambda item: (-item[1], item[0])
+        )
+        return ranked if limit == UNLIMITED_SEARCH_RESULTS else ranked[:limit]
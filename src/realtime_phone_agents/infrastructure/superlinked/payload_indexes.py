@@ -0,0 +1,111 @@
+"""
+Qdrant payload indexes for the property filter fields.
+
+Without a payload index, Qdrant evaluates every filter of the search query by
+reading the payload of each candidate point, so filtered searches degrade to
+a scan as the catalog grows. Superlinked only creates the indexes when its
+`INIT_SEARCH_INDICES` setting is on, so they are declared here from the index
+fields and verified (and created if missing) at startup and after ingestion.
+"""
+
+from typing import Any
+
+from loguru import logger
+from qdrant_client import QdrantClient
+from qdrant_client.models import PayloadSchemaType
+from superlinked import framework as sl
+from superlinked.framework.common.storage_manager.storage_naming import StorageNaming
+
+from realtime_phone_agents.infrastructure.superlinked.index import (
+    property_filter_fields,
+)
+
+_PAYLOAD_SCHEMA_BY_FIELD_TYPE = {
+    sl.String: PayloadSchemaType.KEYWORD,
+    sl.Integer: PayloadSchemaType.INTEGER,
+    sl.Float: PayloadSchemaType.FLOAT,
+}
+
+
+def payload_field_name(field: Any) -> str:
+    """Name of the Qdrant payload key Superlinked stores a schema field under."""
+    return StorageNaming.generate_field_name_from_schema_field(field)
+
+
+def payload_schema_type(field: Any) -> PayloadSchemaType:
+    """Qdrant payload index type of a schema field (keyword or integer)."""
+    for field_type, schema_type in _PAYLOAD_SCHEMA_BY_FIELD_TYPE.items():
+        if isinstance(field, field_type):
+            return schema_type
+    raise ValueError(f"No payload index type for field {field.name}")
+
+
+def declared_payload_indexes(
+    fields: list[Any] = property_filter_fields,
+) -> dict[str, PayloadSchemaType]:
+    """
+    Payload indexes every filter field needs.
+
+    Args:
+        fields: Schema fields used in query filters
+
+    Returns:
+        Payload index type by payload key
+    """
+    return {payload_field_name(field): payload_schema_type(field) for field in fields}
+
+
+def _existing_payload_indexes(
+    client: QdrantClient, collection_name: str
+) -> dict[str, str]:
+    payload_schema = client.get_collection(collection_name).payload_schema or {}
+    return {name: str(info.data_type.value) for name, info in payload_schema.items()}
+
+
+def ensure_payload_indexes(
+    client: QdrantClient,
+    collection_name: str,
+    declared: dict[str, PayloadSchemaType] | None = None,
+) -> dict[str, str]:
+    """
+    Create missing payload indexes and verify that every declared one exists.
+
+    Args:
+        client: Qdrant client
+        collection_name: Collection holding the properties
+        declared: Payload index type by payload key (defaults to the filter fields)
+
+    Returns:
+        Status of every payload key: "present" or "created"
+
+    Raises:
+        RuntimeError: If an index is still missing or has the wrong type afterwards
+    """
+    declared = declared or declared_payload_indexes()
+    existing = _existing_payload_indexes(client, collection_name)
+
+    status = {}
+    for field_name, schema_type in declared.items():
+        if existing.get(field_name) == schema_type.value:
+            status[field_name] = "present"
+            continue
+
+        # An index of another type can't be altered in place, recreate it
+        if field_name in existing:
+            logger.warning(
+                f"Payload index {field_name} is {existing[field_name]}, expected {schema_type.value}"
+            )
+            client.delete_payload_index(collection_name, field_name, wait=True)
+
+        client.create_payload_index(collection_name, field_name, schema_type, wait=True)
+        status[field_name] = "created"
+
+    existing = _existing_payload_indexes(client, collection_name)
+    if missing := [
+        field_name
+        for field_name, schema_type in declared.items()
+        if existing.get(field_name) != schema_type.value
+    ]:
+        raise RuntimeError(f"Missing payload indexes in '{collection_name}': {missing}")
+
+    return status
@@ -0,0 +1,71 @@
+"""
+Qdrant connection parameters shared by the search service and the benchmarks.
+
+Search runs on the critical path of a spoken turn, so the per-query overhead
+of the transport matters. With the "grpc" transport, qdrant-client keeps a
+pool of persistent HTTP/2 channels (kept alive between calls by keepalive
+pings) and sends protobuf instead of JSON. The REST URL is still used for
+the operations qdrant-client only implements over HTTP.
+
+The pool size only applies to gRPC: over HTTP, qdrant-client would turn it
+into the maximum number of connections of its httpx client, so the HTTP
+transport keeps the httpx connection limits instead.
+"""
+
+from typing import Any, Literal
+
+from realtime_phone_agents.config import settings
+
+QdrantTransport = Literal["http", "grpc"]
+
+
+def qdrant_url(
+    host: str | None = settings.qdrant.host,
+    port: int | None = settings.qdrant.port,
+    cluster_url: str | None = settings.qdrant.cluster_url,
+    use_cloud: bool | None = settings.qdrant.use_qdrant_cloud,
+) -> str:
+    """Build the REST URL of the Qdrant instance."""
+    if use_cloud:
+        return f"{cluster_url}:{port}"
+    return f"http://{host}:{port}"
+
+
+def qdrant_client_params(
+    transport: QdrantTransport = settings.qdrant.transport,
+    grpc_port: int = settings.qdrant.grpc_port,
+    pool_size: int = settings.qdrant.pool_size,
+    timeout_s: int = settings.qdrant.timeout_s,
+    grpc_keepalive_s: int = settings.qdrant.grpc_keepalive_s,
+) -> dict[str, Any]:
+    """
+    Build the extra QdrantClient / AsyncQdrantClient constructor params.
+
+    Args:
+        transport: "grpc" to prefer gRPC for every call that supports it, or "http"
+        grpc_port: Qdrant gRPC port
+        pool_size: gRPC channels kept open by each client (gRPC only)
+        timeout_s: Request timeout
+        grpc_keepalive_s: Keepalive ping interval of the gRPC channels
+
+    Returns:
+        Keyword arguments for the qdrant-client constructors
+    """
+    params: dict[str, Any] = {"timeout": timeout_s}
+
+    if transport == "grpc":
+        params |= {
+            "prefer_grpc": True,
+            "grpc_port": grpc_port,
+            "pool_size": pool_size,
+            "grpc_options": {
+                "grpc.keepalive_time_ms": grpc_keepalive_s * 1000,
+                "grpc.keepalive_timeout_ms": 5000,
+                "grpc.keepalive_permit_without_calls": 1,
+                "grpc.http2.max_pings_without_data": 0,
+            },
+        }
+    elif transport != "http":
+        raise ValueError(f"Invalid Qdrant transport: {transport}")
+
+    return params
@@ -0,0 +1,144 @@
+"""
+Vector quantization and on-disk storage options for the property collection.
+
+Superlinked creates the collection with full precision vectors held in RAM,
+and on every start compares the per-vector params of the collection with the
+ones it would create. The options are therefore applied at the collection
+level, which that check doesn't look at:
+
+- quantization: "scalar" (int8, 4x smaller) or "binary" (1 bit, 32x smaller)
+  copies of the vectors, kept in RAM and used to preselect candidates
+- on_disk: original vectors memmapped, HNSW graph and payload on disk
+
+Quantized vectors are only used by approximate (HNSW) searches. Oversampling
+and rescoring are search time params, which Superlinked doesn't expose, so
+`QuantizedSearchClient` adds them to every search it sends.
+"""
+
+from typing import Any, Literal
+
+from qdrant_client import AsyncQdrantClient, QdrantClient, models
+
+QuantizationKind = Literal["none", "scalar", "binary"]
+
+# Segments above this size (in KB) are memmapped. Set per collection because
+# per-vector `on_disk` would fail Superlinked's config check on the next start
+_ON_DISK_MEMMAP_THRESHOLD_KB = 1
+
+
+def quantization_config(
+    kind: QuantizationKind, always_ram: bool = True
+) -> models.QuantizationConfig | None:
+    """
+    Build the Qdrant quantization config.
+
+    Args:
+        kind: "none", "scalar" (int8) or "binary"
+        always_ram: Keep the quantized vectors in RAM, even with on-disk storage
+
+    Returns:
+        The quantization config, or None without quantization
+    """
+    if kind == "none":
+        return None
+    elif kind == "scalar":
+        return models.ScalarQuantization(
+            scalar=models.ScalarQuantizationConfig(
+                type=models.ScalarType.INT8, quantile=0.99, always_ram=always_ram
+            )
+        )
+    elif kind == "binary":
+        return models.BinaryQuantization(
+            binary=models.BinaryQuantizationConfig(always_ram=always_ram)
+        )
+    else:
+        raise ValueError(f"Invalid quantization: {kind}")
+
+
+def quantization_search_params(
+    oversampling: float = 2.0, rescore: bool = True
+) -> models.QuantizationSearchParams:
+    """Search time quantization params (oversampling, rescoring with original vectors)."""
+    return models.QuantizationSearchParams(
+        ignore=False, rescore=rescore, oversampling=oversampling
+    )
+
+
+def apply_storage_options(
+    client: QdrantClient,
+    collection_name: str,
+    quantization: QuantizationKind = "none",
+    always_ram: bool = True,
+    on_disk: bool = False,
+) -> list[str]:
+    """
+    Update the collection so it matches the storage options.
+
+    Qdrant applies the changes in the background, by re-optimizing segments.
+
+    Args:
+        client: Qdrant client
+        collection_name: Collection holding the properties
+        quantization: "none", "scalar" or "binary"
+        always_ram: Keep the quantized vectors in RAM
+        on_disk: Store original vectors, HNSW graph and payload on disk
+
+    Returns:
+        The options that were changed (empty if the collection already matched)
+    """
+    config = client.get_collection(collection_name).config
+    update: dict[str, Any] = {}
+
+    expected_quantization = quantization_config(quantization, always_ram)
+    if config.quantization_config != expected_quantization:
+        update["quantization_config"] = (
+            expected_quantization or models.Disabled.DISABLED
+        )
+
+    if bool(config.params.on_disk_payload) != on_disk:
+        update["collection_params"] = models.CollectionParamsDiff(
+            on_disk_payload=on_disk
+        )
+
+    if bool(config.hnsw_config.on_disk) != on_disk:
+        update["hnsw_config"] = models.HnswConfigDiff(on_disk=on_disk)
+
+    memmap_threshold = _ON_DISK_MEMMAP_THRESHOLD_KB if on_disk else 0
+    if (config.optimizer_config.memmap_threshold or 0) != memmap_threshold:
+        update["optimizers_config"] = models.OptimizersConfigDiff(
+            memmap_threshold=memmap_threshold
+        )
+
+    if update:
+        client.update_collection(collection_name, **update)
+
+    return list(update)
+
+
+class QuantizedSearchClient:
+    """
+    Wraps an AsyncQdrantClient to add quantization params to approximate searches.
+
+    Every other attribute is delegated to the wrapped client.
+    """
+
+    def __init__(
+        self, client: AsyncQdrantClient, params: models.QuantizationSearchParams
+    ):
+        self._client = client
+        self._params = params
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._client, name)
+
+    async def query_points(
+        self, *args, search_params: models.SearchParams | None = None, **kwargs
+    ):
+        # Exact searches scan the original vectors, quantization doesn't apply
+        if search_params is None or not search_params.exact:
+            search_params = (search_params or models.SearchParams()).model_copy(
+                update={"quantization": self._params}
+            )
+        return await self._client.query_points(
+            *args, search_params=search_params, **kwargs
+        )
@@ -1,4 +1,5 @@
 from superlinked import framework as sl
+from superlinked.framework.dsl.query.query_descriptor import QueryDescriptor
 
 from realtime_phone_agents.config import settings
 from realtime_phone_agents.infrastructure.superlinked.constants import NEIGHBORHOODS
@@ -14,60 +15,117 @@ openai_config = sl.OpenAIClientConfig(
     api_key=settings.openai.api_key, model=settings.openai.model
 )
 
-property_search_query = (
-    sl.Query(
+
+def property_summary_fields(
+    fields: list[str] = settings.property_tool.summary_fields,
+    description_max_chars: int = settings.property_tool.description_max_chars,
+) -> list[str]:
+    """
+    Schema fields needed to build the compact summaries spoken by the agent.
+
+    Descriptions are stored whole, so summaries that keep a truncated one read
+    every full description from the vector database. They're left out by
+    default, the agent gets them from the property details.
+
+    Args:
+        fields: Fields kept in the summaries
+        description_max_chars: Maximum description length (0 drops it)
+
+    Returns:
+        The field names, without the id that every result carries
+    """
+    selected = [field for field in fields if field != property_schema.id.name]
+    if description_max_chars > 0 and "description" not in selected:
+        selected.append("description")
+    return selected
+
+
+def build_property_search_query(
+    natural_query: bool = True, fields: list[str] | None = None
+) -> QueryDescriptor:
+    """
+    Build the property search query.
+
+    Args:
+        natural_query: Parse a free-text `natural_query` param into the other
+            params with an OpenAI call. Without it, every param is passed directly.
+        fields: Fields returned with each result, all of them if None. Fields
+            that aren't selected aren't read from the vector database.
+
+    Returns:
+        The Superlinked query descriptor
+    """
+    query = sl.Query(
         property_index,
         weights={
             description_space: sl.Param("description_weight"),
             size_space: sl.Param("size_weight"),
             price_space: sl.Param("price_weight"),
         },
-    )
-    .find(property_schema)
-    .with_natural_query(sl.Param("natural_query"), openai_config)
-    .similar(
-        description_space,
-        sl.Param(
-            "description_query",
-            description="The user's natural language query for property search.",
-        ),
-    )
-    .filter(
-        property_schema.location
-        == sl.Param(
-            "location",
-            description="Used to filter appartments by neighborhood",
-            options=NEIGHBORHOODS,
+    ).find(property_schema)
+
+    if natural_query:
+        query = query.with_natural_query(sl.Param("natural_query"), openai_config)
+
+    query = (
+        query.similar(
+            description_space,
+            sl.Param(
+                "description_query",
+                description="The user's natural language query for property search.",
+            ),
         )
-    )
-    .filter(
-        property_schema.rooms
-        >= sl.Param(
-            "min_rooms",
-            description="Used to find apartments with a room count equal to or greater than the specified number",
+        .filter(
+            property_schema.location
+            == sl.Param(
+                "location",
+                description="Used to filter appartments by neighborhood",
+                options=NEIGHBORHOODS,
+            )
         )
-    )
-    .filter(
-        property_schema.baths
-        >= sl.Param(
-            "min_baths",
-            description="Used to find apartments with a bath count equal to or greater than the specified number",
+        .filter(
+            property_schema.rooms
+            >= sl.Param(
+                "min_rooms",
+                description="Used to find apartments with a room count equal to or greater than the specified number",
+            )
         )
-    )
-    .filter(
-        property_schema.sqft
-        >= sl.Param(
-            "sqft_bigger_than",
-            description="Used to find appartments with square feet equal to or greather than the specified number",
+        .filter(
+            property_schema.baths
+            >= sl.Param(
+                "min_baths",
+                description="Used to find apartments with a bath count equal to or greater than the specified number",
+            )
         )
-    )
-    .filter(
-        property_schema.price
-        <= sl.Param(
-            "price_smaller_than",
-            description="Used to find appartments with price less than the specified number",
+        .filter(
+            property_schema.sqft
+            >= sl.Param(
+                "sqft_bigger_than",
+                description="Used to find appartments with square feet equal to or greather than the specified number",
+            )
+        )
+        .filter(
+            property_schema.price
+            <= sl.Param(
+                "price_smaller_than",
+                description="Used to find appartments with price less than the specified number",
+            )
         )
+        .limit(sl.Param("limit"))
     )
-    .limit(sl.Param("limit"))
-    .select_all()
+
+    return query.select_all() if fields is None else query.select(fields)
+
+
+property_search_query = build_property_search_query(natural_query=True)
+
+# Same query with every param passed directly, e.g. as typed tool arguments
+structured_property_search_query = build_property_search_query(natural_query=False)
+
+# Variants returning only the fields of the agent's compact summaries
+property_summary_search_query = build_property_search_query(
+    natural_query=True, fields=property_summary_fields()
+)
+structured_property_summary_search_query = build_property_search_query(
+    natural_query=False, fields=property_summary_fields()
 )
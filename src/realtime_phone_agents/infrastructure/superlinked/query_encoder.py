@@ -0,0 +1,330 @@
+"""
+Optimized query-embedding path for the description space.
+
+Every search embeds its description text with the space's Sentence
+Transformers model, full precision PyTorch on the CPU the audio handlers
+share. `QueryEncoderEngine` replaces Superlinked's engine of that model and
+only changes how query texts are embedded, documents still go through the
+reference model:
+
+- query embeddings are kept in an LRU cache keyed by whitespace-normalized
+  text, so "bright  apartment " and "bright apartment" are embedded once.
+  The text itself is embedded as given
+- optionally, queries run on a lighter encoder: "int8" (PyTorch dynamic
+  quantization of the Linear layers) or "onnx" (ONNX Runtime, needs
+  the `onnx` extra). It is checked against the reference model on
+  VALIDATION_QUERIES at startup, and dropped if their cosine agreement is
+  below `min_cosine`
+- the ONNX Runtime session has its own intra-op thread cap, so concurrent
+  searches don't starve the audio work. PyTorch threads are process-wide
+  and shared with the SNAC/TTS work, so the torch and int8 encoders keep
+  the process defaults
+
+Superlinked only gives queries their own embed calls when the model has a
+query prompt. Without one, queries go through the document path and get
+neither the cache nor the optimized encoder.
+"""
+
+import asyncio
+import copy
+import re
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Literal, Sequence
+
+import numpy as np
+import torch
+from loguru import logger
+from sentence_transformers import SentenceTransformer
+from superlinked.framework.common.space.embedding.model_based.embedding_engine_manager import (
+    ENGINE_BY_HANDLER,
+)
+from superlinked.framework.common.space.embedding.model_based.engine.embedding_engine_config import (
+    EmbeddingEngineConfig,
+)
+from superlinked.framework.common.space.embedding.model_based.engine.sentence_transformers_engine import (
+    SentenceTransformersEngine,
+)
+from superlinked.framework.common.space.embedding.model_based.model_downloader import (
+    ModelDownloader,
+)
+from superlinked.framework.common.space.embedding.model_based.singleton_embedding_engine_manager import (
+    SingletonEmbeddingEngineManager,
+)
+
+from realtime_phone_agents.config import settings
+from realtime_phone_agents.infrastructure.superlinked.index import description_space
+
+QueryEncoderKind = Literal["torch", "int8", "onnx"]
+
+# Queries the optimized encoder is compared with the reference model on
+VALIDATION_QUERIES = [
+    "bright apartment with a terrace",
+    "renovated flat close to the metro",
+    "luxury property with a swimming pool",
+    "quiet family home with parking",
+    "exterior apartment with a balcony and elevator",
+    "cheap studio for students near the university",
+    "penthouse with views of the park",
+    "ground floor with a private garden",
+]
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_query_text(text: str) -> str:
+    """
+    Normalize a query text for the embedding cache key.
+
+    Only whitespace is collapsed and stripped: the model is case and
+    punctuation sensitive, so anything else could return the embedding of a
+    different text.
+    """
+    return _WHITESPACE.sub(" ", text).strip()
+
+
+class QueryEmbeddingCache:
+    """LRU cache of query embeddings, keyed by normalized text."""
+
+    def __init__(self, max_size: int = 1024):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._vectors: OrderedDict[str, Any] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._vectors)
+
+    def get(self, text: str) -> Any | None:
+        """Get the embedding of a normalized text, if cached."""
+        vector = self._vectors.get(text)
+        if vector is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._vectors.move_to_end(text)
+        return vector
+
+    def put(self, text: str, vector: Any) -> None:
+        """Cache the embedding of a normalized text."""
+        if self.max_size <= 0:
+            return
+        self._vectors[text] = vector
+        self._vectors.move_to_end(text)
+        if len(self._vectors) > self.max_size:
+            self._vectors.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every embedding and reset the counters."""
+        self._vectors.clear()
+        self.hits = self.misses = 0
+
+
+class QueryEncoderEngine(SentenceTransformersEngine):
+    """
+    Sentence Transformers engine with a cached, optionally optimized, query path.
+
+    Registered under the key of the `SentenceTransformersEngine` it replaces,
+    so the spaces using that model pick it up without any change.
+    """
+
+    def __init__(
+        self,
+        model_name: str,
+        model_cache_dir: Path | None,
+        config: EmbeddingEngineConfig,
+        encoder: QueryEncoderKind = "torch",
+        threads: int = 2,
+        cache_size: int = 1024,
+        min_cosine: float = 0.99,
+    ):
+        self.encoder = encoder
+        self.threads = threads
+        self.min_cosine = min_cosine
+        self.cache = QueryEmbeddingCache(cache_size)
+        self.agreement: float | None = None
+
+        super().__init__(model_name, model_cache_dir, config)
+        self._query_model = self._load_query_model()
+
+    @property
+    def key(self) -> str:
+        return SentenceTransformersEngine.calculate_key(
+            self._model_name, self._model_cache_dir, self._config
+        )
+
+    @property
+    def query_encoder(self) -> QueryEncoderKind:
+        """The encoder queries actually run on, "torch" if the optimized one was dropped."""
+        return self.encoder if self._query_model is not None else "torch"
+
+    async def embed(
+        self, inputs: Sequence[Any], is_query_context: bool
+    ) -> list[list[float]]:
+        if not is_query_context:
+            return await super().embed(inputs, is_query_context)
+
+        # Cache keys are normalized, but the first original text of each key
+        # is the one embedded
+        keys = [normalize_query_text(text) for text in inputs]
+        originals: dict[str, str] = {}
+        for text, key in zip(inputs, keys):
+            originals.setdefault(key, text)
+
+        vectors = {key: self.cache.get(key) for key in originals}
+        if missing := [key for key, vector in vectors.items() if vector is None]:
+            encoded = await asyncio.to_thread(
+                self.encode_queries, [originals[key] for key in missing]
+            )
+            for key, vector in zip(missing, encoded):
+                self.cache.put(key, vector)
+                vectors[key] = vector
+        return [vectors[key] for key in keys]
+
+    def encode_queries(self, texts: list[str]) -> list[np.ndarray]:
+        """Embed query texts with the query encoder, bypassing the cache."""
+        model = self._query_model or self._model
+        return self._encode(model, texts)
+
+    def _encode(self, model: SentenceTransformer, texts: list[str]) -> list[np.ndarray]:
+        embeddings = model.encode(
+            texts,
+            prompt_name=self._calculate_prompt_name(model, True),
+            show_progress_bar=False,
+            convert_to_numpy=True,
+        )
+        return list(embeddings.astype(np.float32, copy=False))
+
+    def _load_query_model(self) -> SentenceTransformer | None:
+        """Build the optimized query encoder, None to use the reference model."""
+        if self.encoder == "torch":
+            return None
+
+        try:
+            model = self._build_query_model()
+            self.agreement = self._cosine_agreement(model)
+        except Exception as e:
+            logger.warning(
+                f"Failed to load the {self.encoder} query encoder, using the reference model: {e}"
+            )
+            return None
+
+        if self.agreement < self.min_cosine:
+            logger.warning(
+                f"The {self.encoder} query encoder agrees with the reference model at cosine "
+                f"{self.agreement:.4f} < {self.min_cosine}, using the reference model"
+            )
+            return None
+
+        threads = (
+            self.threads if self.encoder == "onnx" and self.threads > 0 else "default"
+        )
+        logger.info(
+            f"Queries embedded with the {self.encoder} encoder "
+            f"(cosine agreement {self.agreement:.4f}, {threads} threads)"
+        )
+        return model
+
+    def _build_query_model(self) -> SentenceTransformer:
+        if self.encoder == "int8":
+            # Dynamic quantization needs a float32 model on the CPU
+            model = copy.deepcopy(self._model).to("cpu").float()
+            return torch.ao.quantization.quantize_dynamic(
+                model, {torch.nn.Linear}, dtype=torch.qint8, inplace=True
+            )
+
+        if self.encoder == "onnx":
+            import onnxruntime
+
+            session_options = onnxruntime.SessionOptions()
+            if self.threads > 0:
+                session_options.intra_op_num_threads = self.threads
+                session_options.inter_op_num_threads = 1
+            return SentenceTransformer(
+                self._model_name,
+                backend="onnx",
+                device="cpu",
+                cache_folder=str(
+                    ModelDownloader().get_cache_dir(self._model_cache_dir)
+                ),
+                model_kwargs={
+                    "provider": "CPUExecutionProvider",
+                    "session_options": session_options,
+                },
+            )
+
+        raise ValueError(f"Invalid query encoder: {self.encoder}")
+
+    def _cosine_agreement(self, model: SentenceTransformer) -> float:
+        """Lowest cosine similarity between the embeddings of both models on VALIDATION_QUERIES."""
+        reference = np.stack(self._encode(self._model, VALIDATION_QUERIES))
+        candidate = np.stack(self._encode(model, VALIDATION_QUERIES))
+        cosine = (reference * candidate).sum(axis=1) / (
+            np.linalg.norm(reference, axis=1) * np.linalg.norm(candidate, axis=1)
+        )
+        return float(cosine.min())
+
+
+def install_query_encoder(
+    space=description_space,
+    encoder: QueryEncoderKind = settings.superlinked.query_encoder,
+    threads: int = settings.superlinked.query_encoder_threads,
+    cache_size: int = settings.superlinked.query_embedding_cache_size,
+    min_cosine: float = settings.superlinked.query_encoder_min_cosine,
+) -> QueryEncoderEngine:
+    """
+    Replace the Superlinked engine of a text space's model with a `QueryEncoderEngine`.
+
+    Must run before the executor embeds anything with that model.
+
+    Args:
+        space: TextSimilaritySpace whose model gets the optimized query path
+        encoder: "torch" (reference model), "int8" or "onnx"
+        threads: Intra-op threads of the ONNX Runtime session, 0 to keep the
+            defaults. The torch and int8 encoders use the process threads
+        cache_size: Query embeddings kept in the LRU cache, 0 disables it
+        min_cosine: Minimum cosine agreement of the optimized encoder with the
+            reference model, below it queries use the reference model
+
+    Returns:
+        The installed engine
+
+    Raises:
+        ValueError: If the model is not a Sentence Transformers one, or this
+            Superlinked version has no engine registry to install it in
+    """
+    config = space.transformation_config.embedding_config
+    manager = SingletonEmbeddingEngineManager()
+    # Superlinked has no public way to register an engine, these are the
+    # internals its manager fills on the first embed of a model
+    if not hasattr(manager, "_key_to_engine") or not hasattr(
+        manager, "_create_delayed_evaluators"
+    ):
+        raise ValueError(
+            "Query encoder not supported by this Superlinked version, "
+            "its embedding engine manager has no engine registry"
+        )
+    if ENGINE_BY_HANDLER.get(config.model_handler) is not SentenceTransformersEngine:
+        raise ValueError(
+            f"Query encoder needs a Sentence Transformers model, got {config.model_handler}"
+        )
+
+    engine = QueryEncoderEngine(
+        config.model_name,
+        config.model_cache_dir,
+        config.embedding_engine_config,
+        encoder=encoder,
+        threads=threads,
+        cache_size=cache_size,
+        min_cosine=min_cosine,
+    )
+
+    if not engine.is_query_prompt_supported():
+        logger.warning(
+            f"{config.model_name} has no query prompt, Superlinked embeds its queries "
+            "as documents so they skip the query cache and encoder"
+        )
+
+    manager._key_to_engine[engine.key] = engine
+    manager._create_delayed_evaluators(engine, engine.key)
+    return engine
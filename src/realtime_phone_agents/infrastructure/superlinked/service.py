@@ -1,15 +1,53 @@
-from typing import Any
+from pathlib import Path
+from typing import Any, Iterator
 
 import pandas as pd
 from loguru import logger
 from superlinked import framework as sl
+from superlinked.framework.storage.qdrant.qdrant_vdb_connector import (
+    ID_PAYLOAD_FIELD_NAME,
+)
 
 from realtime_phone_agents.config import settings
+from realtime_phone_agents.infrastructure.superlinked.aggregates import (
+    CatalogAggregates,
+)
 from realtime_phone_agents.infrastructure.superlinked.index import (
     property_index,
+    property_index_fingerprint,
     property_schema,
 )
-from realtime_phone_agents.infrastructure.superlinked.query import property_search_query
+from realtime_phone_agents.infrastructure.superlinked.numpy_search import (
+    NumpyKNNSearch,
+)
+from realtime_phone_agents.infrastructure.superlinked.payload_indexes import (
+    ensure_payload_indexes,
+    payload_field_name,
+)
+from realtime_phone_agents.infrastructure.superlinked.qdrant_connection import (
+    qdrant_client_params,
+    qdrant_url,
+)
+from realtime_phone_agents.infrastructure.superlinked.qdrant_storage import (
+    QuantizedSearchClient,
+    apply_storage_options,
+    quantization_search_params,
+)
+from realtime_phone_agents.infrastructure.superlinked.query import (
+    property_search_query,
+    property_summary_search_query,
+    structured_property_search_query,
+    structured_property_summary_search_query,
+)
+from realtime_phone_agents.infrastructure.superlinked.query_encoder import (
+    QueryEncoderEngine,
+    install_query_encoder,
+)
+from realtime_phone_agents.infrastructure.superlinked.snapshot import (
+    load_snapshot,
+    save_snapshot,
+    supports_snapshots,
+)
 
 
 class PropertySearchService:
@@ -22,21 +60,79 @@ class PropertySearchService:
         qdrant_api_key: str | None,
         qdrant_cluster_url: str | None,
         qdrant_use_cloud: bool | None,
+        snapshot_dir: str | None = None,
+        search_backend: str = "qdrant",
+        payload_indexes: bool = True,
+        qdrant_transport: str = "http",
+        qdrant_search_algorithm: str = "flat",
+        qdrant_quantization: str = "none",
+        qdrant_quantization_always_ram: bool = True,
+        qdrant_oversampling: float = 2.0,
+        qdrant_rescore: bool = True,
+        qdrant_on_disk: bool = False,
+        query_encoder: str = "torch",
+        query_encoder_threads: int = 2,
+        query_embedding_cache_size: int = 1024,
+        query_encoder_min_cosine: float = 0.99,
     ):
         self.qdrant_host = qdrant_host
         self.qdrant_port = qdrant_port
         self.qdrant_api_key = qdrant_api_key
         self.qdrant_cluster_url = qdrant_cluster_url
         self.qdrant_use_cloud = qdrant_use_cloud
+        self.snapshot_dir = snapshot_dir
+        self.search_backend = search_backend
+        self.payload_indexes = payload_indexes
+        self.qdrant_transport = qdrant_transport
+        self.qdrant_search_algorithm = qdrant_search_algorithm
+        self.qdrant_quantization = qdrant_quantization
+        self.qdrant_quantization_always_ram = qdrant_quantization_always_ram
+        self.qdrant_oversampling = qdrant_oversampling
+        self.qdrant_rescore = qdrant_rescore
+        self.qdrant_on_disk = qdrant_on_disk
+        self.query_encoder = query_encoder
+        self.query_encoder_threads = query_encoder_threads
+        self.query_embedding_cache_size = query_embedding_cache_size
+        self.query_encoder_min_cosine = query_encoder_min_cosine
 
         self.app = None
         self.source = None
+        self.backend: str | None = None
+        self._snapshot_source: dict[str, Any] | None = None
+        self._numpy_search: NumpyKNNSearch | None = None
+        self.aggregates = CatalogAggregates()
+        self.query_engine: QueryEncoderEngine | None = None
 
         # Setup the application
+        self._install_query_encoder()
         self._setup_app()
+        self._load_aggregates()
+
+    def _install_query_encoder(self):
+        """Install the cached, optionally quantized, query embedding path before anything is embedded"""
+        try:
+            self.query_engine = install_query_encoder(
+                encoder=self.query_encoder,
+                threads=self.query_encoder_threads,
+                cache_size=self.query_embedding_cache_size,
+                min_cosine=self.query_encoder_min_cosine,
+            )
+        except Exception as e:
+            logger.error(
+                f"Failed to install the {self.query_encoder} query encoder: {e}"
+            )
 
     def _setup_app(self):
         """Setup  the Superlinked application with RestExecutor and Qdrant, fallback to InMemoryExecutor"""
+        if self.search_backend == "in_memory":
+            self._setup_with_memmory()
+            return
+        if self.search_backend == "numpy":
+            self._setup_with_memmory(numpy_search=True)
+            return
+        if self.search_backend != "qdrant":
+            raise ValueError(f"Invalid search backend: {self.search_backend}")
+
         try:
             self._setup_with_qdrant()
         except Exception as e:
@@ -47,20 +143,26 @@ class PropertySearchService:
 
     def _setup_with_qdrant(self):
         """Setup the Superlinked application with RestExecutor and Qdrant"""
-        protocol = "https" if self.qdrant_use_cloud else "http"
-
-        if self.qdrant_use_cloud:
-            qdrant_url = f"{self.qdrant_cluster_url}:{self.qdrant_port}"
-        else:
-            qdrant_url = f"{protocol}://{self.qdrant_host}:{self.qdrant_port}"
+        url = qdrant_url(
+            self.qdrant_host,
+            self.qdrant_port,
+            self.qdrant_cluster_url,
+            self.qdrant_use_cloud,
+        )
 
         vector_db = sl.QdrantVectorDatabase(
-            url=qdrant_url,
+            url=url,
             api_key=self.qdrant_api_key,
             default_query_limit=3,
+            search_algorithm=(
+                sl.SearchAlgorithm.HNSW
+                if self.qdrant_search_algorithm == "hnsw"
+                else sl.SearchAlgorithm.FLAT
+            ),
+            client_params=qdrant_client_params(transport=self.qdrant_transport),
         )
 
-        logger.info(f"Connecting to Qdrant at {qdrant_url} ...")
+        logger.info(f"Connecting to Qdrant at {url} ({self.qdrant_transport}) ...")
 
         self.source = sl.RestSource(
             property_schema, parser=sl.DataFrameParser(schema=property_schema)
@@ -68,20 +170,81 @@ class PropertySearchService:
 
         search_descriptor = sl.RestDescriptor(query_path="/search")
         rest_query = sl.RestQuery(search_descriptor, property_search_query)
+        structured_rest_query = sl.RestQuery(
+            sl.RestDescriptor(query_path="/search_structured"),
+            structured_property_search_query,
+        )
 
         executor = sl.RestExecutor(
             sources=[self.source],
             indices=[property_index],
-            queries=[rest_query],
+            queries=[rest_query, structured_rest_query],
             vector_database=vector_db,
         )
 
         self.app = executor.run()
+        self.backend = "qdrant"
 
         logger.info("PropertySearchService initialized with Qdrant RestExecutor")
 
-    def _setup_with_memmory(self):
-        """Setup the Superlinked application with InMemoryExecutor"""
+        self._apply_storage_options()
+        self._ensure_payload_indexes()
+
+    def _apply_storage_options(self):
+        """Apply quantization and on-disk storage options to the Qdrant collection"""
+        vdb = self.app.storage_manager._vdb_connector
+        options = (
+            f"quantization={self.qdrant_quantization}, on_disk={self.qdrant_on_disk}"
+        )
+        try:
+            changed = apply_storage_options(
+                vdb._sync_client,
+                vdb.collection_name,
+                quantization=self.qdrant_quantization,
+                always_ram=self.qdrant_quantization_always_ram,
+                on_disk=self.qdrant_on_disk,
+            )
+        except Exception as e:
+            logger.error(f"Failed to apply Qdrant storage options ({options}): {e}")
+            return
+
+        if changed:
+            logger.info(f"Updated Qdrant collection storage ({options}): {changed}")
+
+        # Superlinked sends no quantization params, add them to its searches
+        if self.qdrant_quantization != "none":
+            vdb._search._client = QuantizedSearchClient(
+                vdb._search._client,
+                quantization_search_params(
+                    self.qdrant_oversampling, self.qdrant_rescore
+                ),
+            )
+
+    def _ensure_payload_indexes(self):
+        """Make sure Qdrant has a payload index for every filter field"""
+        if not self.payload_indexes:
+            return
+
+        vdb = self.app.storage_manager._vdb_connector
+        try:
+            status = ensure_payload_indexes(vdb._sync_client, vdb.collection_name)
+        except Exception as e:
+            logger.error(f"Failed to verify Qdrant payload indexes: {e}")
+            return
+
+        if created := [name for name, state in status.items() if state == "created"]:
+            logger.info(f"Created Qdrant payload indexes: {created}")
+        else:
+            logger.info(f"Verified {len(status)} Qdrant payload indexes")
+
+    def _setup_with_memmory(self, numpy_search: bool = False):
+        """
+        Setup the Superlinked application with InMemoryExecutor
+
+        Args:
+            numpy_search: Replace the row by row kNN search of the InMemoryExecutor
+                with the vectorized `NumpyKNNSearch`
+        """
 
         self.source = sl.InMemorySource(
             property_schema, parser=sl.DataFrameParser(schema=property_schema)
@@ -92,28 +255,179 @@ class PropertySearchService:
             indices=[property_index],
         )
         self.app = executor.run()
+        self.backend = "in_memory"
+
+        if numpy_search:
+            self._numpy_search = NumpyKNNSearch()
+            self._in_memory_vdb()._search = self._numpy_search
+            self.backend = "numpy"
+
+        logger.info(
+            f"PropertySearchService initialized with InMemoryExecutor ({self.backend} search)"
+        )
+
+        self._restore_snapshot()
+        self._invalidate_numpy_search()
+
+    def _invalidate_numpy_search(self):
+        """Rebuild the NumPy search arrays on the next search, after rows changed"""
+        if self._numpy_search is not None:
+            self._numpy_search.invalidate()
+
+    def _in_memory_vdb(self):
+        """Return the InMemoryVDB connector backing the InMemoryApp."""
+        return self.app.storage_manager._vdb_connector
+
+    def _snapshots_supported(self) -> bool:
+        """Check that this Superlinked version exposes what snapshots rely on"""
+        vdb = getattr(self.app.storage_manager, "_vdb_connector", None)
+        return vdb is not None and supports_snapshots(vdb)
+
+    def _restore_snapshot(self):
+        """Restore the in-memory index from its binary snapshot, if one exists"""
+        if not self.snapshot_dir:
+            return
+
+        if not self._snapshots_supported():
+            logger.warning(
+                "This Superlinked version doesn't expose the in-memory index "
+                "internals snapshots rely on, snapshots are disabled"
+            )
+            return
+
+        try:
+            manifest = load_snapshot(self._in_memory_vdb(), self.snapshot_dir)
+        except Exception as e:
+            logger.warning(f"Failed to restore in-memory snapshot: {e}")
+            return
+
+        if manifest is not None:
+            self._snapshot_source = manifest.get("source")
+
+    def _save_snapshot(self, source_fingerprint: dict[str, Any]):
+        """Persist the in-memory index so the next start can skip ingestion"""
+        try:
+            save_snapshot(self._in_memory_vdb(), self.snapshot_dir, source_fingerprint)
+            self._snapshot_source = source_fingerprint
+        except Exception as e:
+            logger.warning(f"Failed to save in-memory snapshot: {e}")
+
+    @staticmethod
+    def _source_fingerprint(properties_data_path: str) -> dict[str, Any]:
+        """Describe a data file, and the index it's embedded in, well enough to detect changes"""
+        path = Path(properties_data_path).resolve()
+        stat = path.stat()
+        return {
+            "path": str(path),
+            "size": stat.st_size,
+            "mtime": stat.st_mtime,
+            "index": property_index_fingerprint(),
+        }
+
+    def _stored_aggregate_records(self) -> Iterator[dict[str, Any]]:
+        """Read the fields the catalog aggregates need from the stored properties"""
+        fields = {
+            "location": payload_field_name(property_schema.location),
+            "price": payload_field_name(property_schema.price),
+            "rooms": payload_field_name(property_schema.rooms),
+        }
+        vdb = self.app.storage_manager._vdb_connector
+
+        if self.backend == "qdrant":
+            offset = None
+            while True:
+                points, offset = vdb._sync_client.scroll(
+                    vdb.collection_name,
+                    limit=1024,
+                    offset=offset,
+                    with_payload=[ID_PAYLOAD_FIELD_NAME, *fields.values()],
+                    with_vectors=False,
+                )
+                rows = [
+                    (point.payload[ID_PAYLOAD_FIELD_NAME], point.payload)
+                    for point in points
+                ]
+                yield from self._aggregate_records(rows, fields)
+                if offset is None:
+                    break
+        else:
+            yield from self._aggregate_records(vdb._vdb.items(), fields)
+
+    @staticmethod
+    def _aggregate_records(rows, fields: dict[str, str]) -> Iterator[dict[str, Any]]:
+        # Stored ids are "<schema>:<object id>", both in Qdrant and in memory
+        for entity_id, row in rows:
+            record = {key: row.get(name) for key, name in fields.items()}
+            if None not in record.values():
+                yield {**record, "id": entity_id.split(":", 1)[1]}
+
+    def _load_aggregates(self):
+        """Build the catalog aggregates from the properties already stored"""
+        try:
+            self.aggregates.clear()
+            self.aggregates.upsert_many(self._stored_aggregate_records())
+        except Exception as e:
+            logger.error(f"Failed to load catalog aggregates: {e}")
+            return
 
-        logger.info("PropertySearchService initialized with InMemoryExecutor")
+        if len(self.aggregates):
+            logger.info(
+                f"Loaded catalog aggregates of {len(self.aggregates)} stored properties"
+            )
 
     def ingest_properties(self, properties_data_path: str):
         """Ingest properties from a CSV file into the Superlinked application"""
+        use_snapshot = (
+            self.backend in ("in_memory", "numpy")
+            and bool(self.snapshot_dir)
+            and self._snapshots_supported()
+        )
+
+        if use_snapshot:
+            fingerprint = self._source_fingerprint(properties_data_path)
+            if self._snapshot_source == fingerprint:
+                logger.info(
+                    f"Properties from {properties_data_path} already restored from snapshot, skipping ingestion"
+                )
+                return
 
         logger.info(f"Ingesting properties from {properties_data_path} ...")
         df = pd.read_csv(properties_data_path)
 
         self.source.put([df])
+        self._invalidate_numpy_search()
+        self.aggregates.upsert_many(
+            df[["id", "location", "price", "rooms"]].to_dict("records")
+        )
         logger.info(f"Ingested {len(df)} properties")
 
+        if self.backend == "qdrant":
+            self._ensure_payload_indexes()
+
+        if use_snapshot:
+            self._save_snapshot(fingerprint)
+
     def _result_to_properties(self, result) -> list[dict[str, Any]]:
-        """Convert QueryResult to clean property dicts by extracting entries and merging id into fields."""
-        entries = result.model_dump()["entries"]
-        return [{**entry["fields"], "id": int(entry["id"])} for entry in entries]
+        """Convert QueryResult to clean property dicts by merging each entry's id into its fields."""
+        return [{**entry.fields, "id": int(entry.id)} for entry in result.entries]
 
-    async def search_properties(self, query: str, limit: int = 1):
-        """Search for properties using semantic search and natural queries"""
+    async def search_properties(
+        self, query: str, limit: int = 1, summary: bool = False
+    ):
+        """
+        Search for properties using semantic search and natural queries
+
+        Args:
+            query: Natural language query
+            limit: Maximum number of properties to return
+            summary: Only return the fields of the agent's compact summaries
+        """
+        search_query = (
+            property_summary_search_query if summary else property_search_query
+        )
         try:
             results = await self.app.async_query(
-                property_search_query, natural_query=query, limit=limit
+                search_query, natural_query=query, limit=limit
             )
             properties = self._result_to_properties(results)
 
@@ -126,6 +440,141 @@ class PropertySearchService:
             logger.error(f"Error searching properties: {e}")
             return []
 
+    async def search_properties_structured(
+        self,
+        description_query: str | None = None,
+        location: str | None = None,
+        min_rooms: int | None = None,
+        min_baths: int | None = None,
+        sqft_bigger_than: int | None = None,
+        price_smaller_than: int | None = None,
+        description_weight: float = 1.0,
+        size_weight: float = 0.0,
+        price_weight: float = 0.0,
+        limit: int = 1,
+        summary: bool = False,
+    ) -> list[dict[str, Any]]:
+        """
+        Search for properties with explicit filters, without natural query parsing.
+
+        Skips the OpenAI call that `search_properties` makes to turn free text
+        into these same params. Filters left as None are not applied.
+
+        Args:
+            description_query: Free text matched against property descriptions
+            location: Neighborhood, one of NEIGHBORHOODS
+            min_rooms: Minimum number of rooms
+            min_baths: Minimum number of bathrooms
+            sqft_bigger_than: Minimum size in square feet
+            price_smaller_than: Maximum price
+            description_weight: Weight of the description similarity
+            size_weight: Weight of the size preference (bigger first)
+            price_weight: Weight of the price preference (cheaper first)
+            limit: Maximum number of properties to return
+            summary: Only return the fields of the agent's compact summaries
+
+        Returns:
+            The matching properties
+        """
+        params = {
+            "description_query": description_query,
+            "location": location,
+            "min_rooms": min_rooms,
+            "min_baths": min_baths,
+            "sqft_bigger_than": sqft_bigger_than,
+            "price_smaller_than": price_smaller_than,
+        }
+        search_query = (
+            structured_property_summary_search_query
+            if summary
+            else structured_property_search_query
+        )
+        try:
+            results = await self.app.async_query(
+                search_query,
+                **params,
+                description_weight=description_weight,
+                size_weight=size_weight,
+                price_weight=price_weight,
+                limit=limit,
+            )
+            properties = self._result_to_properties(results)
+
+            if not properties:
+                filters = {k: v for k, v in params.items() if v is not None}
+                logger.warning(f"Properties for filters {filters} not found")
+                return []
+
+            return properties
+        except Exception as e:
+            logger.error(f"Error searching properties: {e}")
+            return []
+
+    def get_catalog_stats(self, location: str | None = None) -> dict[str, Any] | None:
+        """
+        Get the precomputed aggregates of a neighborhood, or of the whole catalog.
+
+        Args:
+            location: Neighborhood, one of NEIGHBORHOODS, None for the whole catalog
+
+        Returns:
+            count, min / median / max price and rooms distribution, or None if
+            the location isn't one of the neighborhoods
+        """
+        return self.aggregates.get(location)
+
+    async def get_property(self, property_id: int) -> dict[str, Any] | None:
+        """
+        Get the full record of a property by id, without any vector search.
+
+        Reads the stored fields of a single object: one point retrieval in
+        Qdrant, one dict lookup in memory. No query embedding is computed.
+
+        Args:
+            property_id: Id of the property
+
+        Returns:
+            The property record, or None if there is no property with that id
+        """
+        storage_manager = self.app.storage_manager
+        vdb = storage_manager._vdb_connector
+        entity_builder = storage_manager._entity_builder
+
+        fields = {
+            entity_builder.convert_schema_field_to_field(
+                schema_field
+            ): schema_field.name
+            for schema_field in property_schema.schema_fields
+        }
+        entity = entity_builder.compose_entity(
+            entity_builder.compose_entity_id(
+                property_schema._schema_name, str(property_id)
+            ),
+            list(fields),
+        )
+
+        # The in-memory store is a defaultdict, reading a missing row would add it
+        if self.backend in ("in_memory", "numpy"):
+            if vdb._get_row_id_from_entity_id(entity.id_) not in vdb._vdb:
+                return None
+
+        try:
+            [entity_data] = await vdb.read_entities([entity])
+        except Exception as e:
+            logger.error(f"Error reading property {property_id}: {e}")
+            return None
+
+        if not entity_data.field_data:
+            return None
+
+        names = {field.name: name for field, name in fields.items()}
+        return {
+            **{
+                names[name]: data.value for name, data in entity_data.field_data.items()
+            },
+            "id": int(property_id),
+        }
+
 
 # Global service instance
 _property_service = None
@@ -137,6 +586,24 @@ def get_property_search_service(
     qdrant_api_key: str | None = settings.qdrant.api_key,
     qdrant_cluster_url: str | None = settings.qdrant.cluster_url,
     qdrant_use_cloud: bool | None = settings.qdrant.use_qdrant_cloud,
+    snapshot_dir: str | None = (
+        settings.superlinked.in_memory_snapshot_dir
+        if settings.superlinked.in_memory_snapshot_enabled
+        else None
+    ),
+    search_backend: str = settings.superlinked.search_backend,
+    payload_indexes: bool = settings.qdrant.payload_indexes,
+    qdrant_transport: str = settings.qdrant.transport,
+    qdrant_search_algorithm: str = settings.qdrant.search_algorithm,
+    qdrant_quantization: str = settings.qdrant.quantization,
+    qdrant_quantization_always_ram: bool = settings.qdrant.quantization_always_ram,
+    qdrant_oversampling: float = settings.qdrant.oversampling,
+    qdrant_rescore: bool = settings.qdrant.rescore,
+    qdrant_on_disk: bool = settings.qdrant.on_disk,
+    query_encoder: str = settings.superlinked.query_encoder,
+    query_encoder_threads: int = settings.superlinked.query_encoder_threads,
+    query_embedding_cache_size: int = settings.superlinked.query_embedding_cache_size,
+    query_encoder_min_cosine: float = settings.superlinked.query_encoder_min_cosine,
 ) -> PropertySearchService:
     """Get or create the global property search service instance."""
     global _property_service
@@ -147,5 +614,19 @@ def get_property_search_service(
             qdrant_api_key=qdrant_api_key,
             qdrant_cluster_url=qdrant_cluster_url,
             qdrant_use_cloud=qdrant_use_cloud,
+            snapshot_dir=snapshot_dir,
+            search_backend=search_backend,
+            payload_indexes=payload_indexes,
+            qdrant_transport=qdrant_transport,
+            qdrant_search_algorithm=qdrant_search_algorithm,
+            qdrant_quantization=qdrant_quantization,
+            qdrant_quantization_always_ram=qdrant_quantization_always_ram,
+            qdrant_oversampling=qdrant_oversampling,
+            qdrant_rescore=qdrant_rescore,
+            qdrant_on_disk=qdrant_on_disk,
+            query_encoder=query_encoder,
+            query_encoder_threads=query_encoder_threads,
+            query_embedding_cache_size=query_embedding_cache_size,
+            query_encoder_min_cosine=query_encoder_min_cosine,
         )
     return _property_service
@@ -0,0 +1,170 @@
+"""
+Binary snapshot / restore for the InMemoryExecutor fallback index.
+
+Superlinked's own `InMemoryVDB.persist` serialises every vector as a JSON list,
+which is slow to write and even slower to parse back. Here the vectors of each
+field are stacked into one contiguous float32 `.npy` matrix that is memory-mapped
+on restore, so every restored `Vector` is a zero-copy view into the mapped file.
+All the remaining (scalar) fields go through Superlinked's JSON codec.
+
+Snapshot layout:
+    manifest.json       -> app identifier, source fingerprint, vector field files
+    rows.json           -> row ids and the non-vector fields of each row
+    vectors_<n>.npy     -> (rows_with_field, dim) float32 matrix for one field
+    vectors_<n>_rows.npy-> row positions owning each matrix row
+"""
+
+import json
+import shutil
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+from loguru import logger
+from superlinked.framework.common.data_types import Vector
+from superlinked.framework.storage.in_memory.json_codec import JsonDecoder, JsonEncoder
+
+SNAPSHOT_VERSION = 1
+MANIFEST_FILE = "manifest.json"
+ROWS_FILE = "rows.json"
+
+
+def supports_snapshots(vdb) -> bool:
+    """
+    Check that an `InMemoryVDB` exposes the internals snapshots read and write.
+
+    They are private Superlinked attributes, another Superlinked release may
+    not have them.
+    """
+    return hasattr(vdb, "_vdb") and hasattr(
+        getattr(vdb, "search_index_manager", None), "_index_configs"
+    )
+
+
+def _app_identifier(vdb) -> str:
+    """Identify the index layout so a snapshot is never restored into a different index."""
+    return "_".join(sorted(vdb.search_index_manager._index_configs.keys()))
+
+
+def save_snapshot(
+    vdb,
+    snapshot_dir: str | Path,
+    source_fingerprint: dict[str, Any] | None = None,
+) -> None:
+    """
+    Write the content of an `InMemoryVDB` to `snapshot_dir`.
+
+    The snapshot is written to a sibling temporary directory first and then
+    swapped in, so a crash mid-write never leaves a half-written snapshot behind.
+
+    Args:
+        vdb: The `InMemoryVDB` connector of a running InMemoryApp.
+        snapshot_dir: Target directory of the snapshot.
+        source_fingerprint: Optional description of the ingested data, stored in
+            the manifest so callers can tell whether the snapshot is up to date.
+    """
+    snapshot_dir = Path(snapshot_dir)
+    row_ids = list(vdb._vdb.keys())
+
+    scalar_rows: list[dict[str, Any]] = []
+    vectors: dict[str, tuple[list[int], list[np.ndarray]]] = {}
+
+    for position, row_id in enumerate(row_ids):
+        scalars = {}
+        for name, value in vdb._vdb[row_id].items():
+            if isinstance(value, Vector) and not value.is_empty:
+                positions, values = vectors.setdefault(name, ([], []))
+                positions.append(position)
+                values.append(value.value)
+            else:
+                scalars[name] = value
+        scalar_rows.append(scalars)
+
+    tmp_dir = snapshot_dir.with_name(f"{snapshot_dir.name}.tmp")
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+    tmp_dir.mkdir(parents=True)
+
+    vector_fields: dict[str, str] = {}
+    for name, (positions, values) in vectors.items():
+        if len({len(v) for v in values}) != 1:
+            # Ragged vectors can't be stacked, keep them in the JSON part
+            for position, value in zip(positions, values):
+                scalar_rows[position][name] = Vector(value)
+            continue
+
+        file_stem = f"vectors_{len(vector_fields)}"
+        np.save(tmp_dir / f"{file_stem}.npy", np.stack(values).astype(np.float32))
+        np.save(
+            tmp_dir / f"{file_stem}_rows.npy", np.asarray(positions, dtype=np.int64)
+        )
+        vector_fields[name] = file_stem
+
+    with open(tmp_dir / ROWS_FILE, "w") as f:
+        json.dump({"row_ids": row_ids, "rows": scalar_rows}, f, cls=JsonEncoder)
+
+    manifest = {
+        "version": SNAPSHOT_VERSION,
+        "app_identifier": _app_identifier(vdb),
+        "source": source_fingerprint or {},
+        "row_count": len(row_ids),
+        "vector_fields": vector_fields,
+    }
+    with open(tmp_dir / MANIFEST_FILE, "w") as f:
+        json.dump(manifest, f)
+
+    shutil.rmtree(snapshot_dir, ignore_errors=True)
+    tmp_dir.rename(snapshot_dir)
+
+    logger.info(
+        f"Saved in-memory snapshot with {len(row_ids)} rows and "
+        f"{len(vector_fields)} vector fields to {snapshot_dir}"
+    )
+
+
+def load_snapshot(vdb, snapshot_dir: str | Path) -> dict[str, Any] | None:
+    """
+    Restore an `InMemoryVDB` from a snapshot written by `save_snapshot`.
+
+    Args:
+        vdb: The `InMemoryVDB` connector of a freshly started InMemoryApp.
+        snapshot_dir: Directory of the snapshot.
+
+    Returns:
+        The snapshot manifest, or None if there is no compatible snapshot.
+    """
+    snapshot_dir = Path(snapshot_dir)
+    manifest_path = snapshot_dir / MANIFEST_FILE
+
+    if not manifest_path.exists():
+        return None
+
+    with open(manifest_path) as f:
+        manifest = json.load(f)
+
+    if manifest.get("version") != SNAPSHOT_VERSION:
+        logger.warning(f"Ignoring snapshot at {snapshot_dir}: unsupported version")
+        return None
+
+    if manifest.get("app_identifier") != _app_identifier(vdb):
+        logger.warning(
+            f"Ignoring snapshot at {snapshot_dir}: it was built for a different index"
+        )
+        return None
+
+    with open(snapshot_dir / ROWS_FILE) as f:
+        data = json.load(f, cls=JsonDecoder)
+
+    row_ids: list[str] = data["row_ids"]
+    rows: list[dict[str, Any]] = data["rows"]
+
+    for name, file_stem in manifest["vector_fields"].items():
+        matrix = np.load(snapshot_dir / f"{file_stem}.npy", mmap_mode="r")
+        positions = np.load(snapshot_dir / f"{file_stem}_rows.npy")
+        for matrix_row, position in enumerate(positions.tolist()):
+            rows[position][name] = Vector(matrix[matrix_row])
+
+    for row_id, fields in zip(row_ids, rows):
+        vdb._vdb[row_id].update(fields)
+
+    logger.info(f"Restored {len(row_ids)} rows from in-memory snapshot {snapshot_dir}")
+    return manifest
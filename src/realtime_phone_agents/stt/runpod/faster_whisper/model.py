@@ -1,33 +1,102 @@
+import openai
 from fastrtc import audio_to_bytes
-from openai import OpenAI
+from loguru import logger
 
 from realtime_phone_agents.stt.base import STTModel
+from realtime_phone_agents.stt.local.moonshine import MoonshineSTT
 from realtime_phone_agents.stt.runpod.faster_whisper.options import (
     FasterWhisperSTTOptions,
 )
+from realtime_phone_agents.stt.runpod.faster_whisper.pool import WhisperEndpointPool
+
+# Errors after which the request is retried on another endpoint
+_FAILOVER_ERRORS = (
+    openai.APIConnectionError,
+    openai.APITimeoutError,
+    openai.InternalServerError,
+    openai.RateLimitError,
+)
 
 
 class FasterWhisperSTT(STTModel):
-    """Speech-to-Text model using Faster Whisper."""
+    """Speech-to-Text model using Faster Whisper, pooled across endpoints."""
 
     def __init__(self, options: FasterWhisperSTTOptions | None = None):
         self.options = options or FasterWhisperSTTOptions()
-        self.client = OpenAI(
-            api_key="",
-            base_url=f"{self.options.api_url}/v1",
+        self._pool = self._create_pool()
+
+        # Warm local model, used only when every remote endpoint is saturated
+        self._standby = MoonshineSTT() if self.options.local_standby else None
+
+    def _create_pool(self) -> WhisperEndpointPool:
+        return WhisperEndpointPool(
+            [self.options.api_url, *self.options.api_urls],
+            max_concurrency=self.options.max_concurrency_per_endpoint,
+            request_timeout_s=self.options.request_timeout_s,
+            failure_cooldown_s=self.options.failure_cooldown_s,
         )
 
+    @property
+    def client(self) -> openai.OpenAI:
+        """Client of the primary endpoint."""
+        return self._pool.endpoints[0].client
+
+    @property
+    def endpoint_pool(self) -> WhisperEndpointPool:
+        """Get the pool of faster-whisper endpoints."""
+        return self._pool
+
     def set_model(self, model: str) -> None:
         self.options.model = model
 
     def set_api_url(self, api_url: str) -> None:
         self.options.api_url = api_url
+        self._pool = self._create_pool()
 
     def stt(self, audio_data: bytes) -> str:
-        """Convert speech audio to text."""
-        response = self.client.audio.transcriptions.create(
-            file=("audio.wav", audio_to_bytes(audio_data)),
-            model=self.options.model,
-            response_format="verbose_json",
+        """
+        Convert speech audio to text.
+
+        The request goes to the least loaded endpoint with a free slot and
+        fails over to the next one on connection, timeout or server errors.
+        With the local standby enabled, saturated endpoints are not waited on.
+
+        Args:
+            audio_data: Audio chunk (sample_rate, samples)
+
+        Returns:
+            Transcribed text
+        """
+        audio_bytes = audio_to_bytes(audio_data)
+        queue_timeout_s = (
+            0.0 if self._standby is not None else self.options.queue_timeout_s
+        )
+        attempted: set[str] = set()
+
+        while True:
+            endpoint = self._pool.acquire(exclude=attempted, timeout_s=queue_timeout_s)
+            if endpoint is None:
+                break
+            attempted.add(endpoint.url)
+
+            try:
+                response = endpoint.client.audio.transcriptions.create(
+                    file=("audio.wav", audio_bytes),
+                    model=self.options.model,
+                    response_format="verbose_json",
+                )
+                self._pool.mark_succeeded(endpoint)
+                return response.text
+            except _FAILOVER_ERRORS as e:
+                self._pool.mark_failed(endpoint)
+                logger.warning(f"Faster Whisper endpoint {endpoint.url} failed: {e}")
+            finally:
+                self._pool.release(endpoint)
+
+        if self._standby is not None:
+            logger.info("Faster Whisper endpoints saturated, using local standby")
+            return self._standby.stt(audio_data)
+
+        raise RuntimeError(
+            f"No Faster Whisper endpoint available (tried {len(attempted)})"
         )
-        return response.text
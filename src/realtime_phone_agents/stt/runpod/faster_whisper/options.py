@@ -8,9 +8,33 @@ class FasterWhisperSTTOptions(BaseModel):
 
     api_url: str = Field(
         default_factory=lambda: settings.faster_whisper.api_url,
-        description="Orpheus TTS API URL",
+        description="Faster Whisper API URL",
     )
     model: str = Field(
         default_factory=lambda: settings.faster_whisper.model,
         description="Faster Whisper Model",
     )
+    api_urls: list[str] = Field(
+        default_factory=lambda: list(settings.faster_whisper.api_urls),
+        description="Additional Faster Whisper endpoints, pooled with api_url",
+    )
+    max_concurrency_per_endpoint: int = Field(
+        default_factory=lambda: settings.faster_whisper.max_concurrency_per_endpoint,
+        description="Concurrent transcriptions allowed per endpoint",
+    )
+    queue_timeout_s: float = Field(
+        default_factory=lambda: settings.faster_whisper.queue_timeout_s,
+        description="How long a request waits for a free endpoint slot (seconds)",
+    )
+    request_timeout_s: float = Field(
+        default_factory=lambda: settings.faster_whisper.request_timeout_s,
+        description="Timeout of a single transcription request (seconds)",
+    )
+    failure_cooldown_s: float = Field(
+        default_factory=lambda: settings.faster_whisper.failure_cooldown_s,
+        description="How long a failing endpoint is left out of rotation (seconds)",
+    )
+    local_standby: bool = Field(
+        default_factory=lambda: settings.faster_whisper.local_standby,
+        description="Fall back to a warm local Moonshine model when endpoints are saturated",
+    )
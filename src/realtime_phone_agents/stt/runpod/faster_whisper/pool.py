@@ -0,0 +1,153 @@
+"""
+Pooling of speaches / faster-whisper endpoints.
+
+Every endpoint accepts a bounded number of concurrent transcriptions. A
+request goes to the least loaded endpoint with a free slot, waits (up to a
+timeout) for a slot when all of them are busy, and fails over to the next
+endpoint when one errors. Failing endpoints sit out a cooldown period.
+"""
+
+import threading
+import time
+
+from openai import OpenAI
+
+
+class WhisperEndpoint:
+    """One faster-whisper endpoint, with its own client and load counters."""
+
+    def __init__(self, url: str, max_concurrency: int, request_timeout_s: float):
+        self.url = url.rstrip("/")
+        self.max_concurrency = max(max_concurrency, 1)
+        self.client = OpenAI(
+            api_key="",
+            base_url=f"{self.url}/v1",
+            timeout=request_timeout_s,
+            max_retries=0,
+        )
+
+        self.in_flight = 0
+        self.ejected_until = 0.0
+        self.failures = 0
+
+    @property
+    def load(self) -> float:
+        """Share of the endpoint's concurrency slots in use."""
+        return self.in_flight / self.max_concurrency
+
+    @property
+    def has_capacity(self) -> bool:
+        return self.in_flight < self.max_concurrency
+
+    def is_ejected(self, now: float) -> bool:
+        return now < self.ejected_until
+
+
+class WhisperEndpointPool:
+    """Concurrency-limited, queue-aware routing across faster-whisper endpoints."""
+
+    def __init__(
+        self,
+        urls: list[str],
+        max_concurrency: int = 4,
+        request_timeout_s: float = 10.0,
+        failure_cooldown_s: float = 15.0,
+    ):
+        """
+        Args:
+            urls: Endpoint base URLs (duplicates are ignored)
+            max_concurrency: Concurrent transcriptions allowed per endpoint
+            request_timeout_s: Timeout of a single transcription request
+            failure_cooldown_s: How long a failing endpoint is left out of rotation
+        """
+        unique_urls = dict.fromkeys(url.rstrip("/") for url in urls if url)
+        self.endpoints = [
+            WhisperEndpoint(url, max_concurrency, request_timeout_s)
+            for url in unique_urls
+        ]
+        self.failure_cooldown_s = failure_cooldown_s
+
+        self._waiting = 0
+        self._condition = threading.Condition()
+
+    def acquire(
+        self,
+        exclude: set[str] | None = None,
+        timeout_s: float = 0.0,
+    ) -> WhisperEndpoint | None:
+        """
+        Reserve a slot on the least loaded endpoint.
+
+        Endpoints in cooldown are only used when every candidate is in cooldown.
+
+        Args:
+            exclude: URLs already tried for this request
+            timeout_s: How long to wait for a free slot (0 doesn't wait)
+
+        Returns:
+            The reserved endpoint, or None if no slot became free in time
+        """
+        exclude = exclude or set()
+        deadline = time.monotonic() + timeout_s
+
+        with self._condition:
+            self._waiting += 1
+            try:
+                while True:
+                    now = time.monotonic()
+                    candidates = [e for e in self.endpoints if e.url not in exclude]
+                    if not candidates:
+                        return None
+
+                    candidates = [
+                        e for e in candidates if not e.is_ejected(now)
+                    ] or candidates
+                    free = [e for e in candidates if e.has_capacity]
+                    if free:
+                        endpoint = min(free, key=lambda e: e.load)
+                        endpoint.in_flight += 1
+                        return endpoint
+
+                    remaining = deadline - now
+                    if remaining <= 0:
+                        return None
+                    self._condition.wait(remaining)
+            finally:
+                self._waiting -= 1
+
+    def release(self, endpoint: WhisperEndpoint) -> None:
+        """Free the slot reserved by `acquire`."""
+        with self._condition:
+            endpoint.in_flight -= 1
+            self._condition.notify()
+
+    def mark_failed(self, endpoint: WhisperEndpoint) -> None:
+        """Leave an endpoint out of rotation for the cooldown period."""
+        with self._condition:
+            endpoint.failures += 1
+            endpoint.ejected_until = time.monotonic() + self.failure_cooldown_s
+
+    def mark_succeeded(self, endpoint: WhisperEndpoint) -> None:
+        with self._condition:
+            endpoint.failures = 0
+            endpoint.ejected_until = 0.0
+
+    @property
+    def queue_depth(self) -> int:
+        """Requests currently waiting for a free slot."""
+        return self._waiting
+
+    def report(self) -> list[dict]:
+        """Snapshot of the load of every endpoint."""
+        now = time.monotonic()
+        with self._condition:
+            return [
+                {
+                    "url": e.url,
+                    "in_flight": e.in_flight,
+                    "max_concurrency": e.max_concurrency,
+                    "ejected": e.is_ejected(now),
+                    "failures": e.failures,
+                }
+                for e in self.endpoints
+            ]
@@ -45,3 +45,31 @@ class TTSModel(ABC):
             Generator[tuple[int, NDArray[np.int16]], None, None]: Generator of (sample_rate, chunk) pairs
         """
         pass
+
+    def request_sample_rate(self, sample_rate: int) -> None:
+        """
+        Ask the model to produce audio at `sample_rate`, if the provider supports it.
+
+        Models with a fixed output rate keep their native rate, the output
+        stage of the agent resamples their audio instead.
+
+        Args:
+            sample_rate: Desired output sample rate (Hz)
+        """
+        pass
+
+    async def wait_ready(self) -> None:
+        """
+        Wait until the background resources of the model can serve utterances.
+
+        Models without background resources are ready right away.
+        """
+        pass
+
+    async def aclose(self) -> None:
+        """
+        Close the connections the model opened in the running event loop.
+
+        Models without async connections have nothing to close.
+        """
+        pass
@@ -0,0 +1,420 @@
+"""
+SNAC decoding in a pool of dedicated worker processes.
+
+Decoding Orpheus token windows with SNAC is CPU heavy. Run inside the API
+process, it competes for the GIL with the event loop, LangGraph and WebRTC,
+and torch's intra-op threads oversubscribe the cores when several calls
+decode at once. The pool moves decoding to separate processes, each pinned
+to a fixed number of torch threads.
+
+Token windows and PCM are exchanged through two shared-memory arrays split
+in fixed slots; the queues only carry slot indices. Every worker has its own
+task queue, so the windows in flight on a worker that dies are known: their
+futures fail, their slots are freed and the worker is restarted. Once the
+restarts are used up and no worker is left, windows are decoded in-process.
+
+Workers load SNAC before reporting ready, which takes seconds. Until every
+worker is ready, windows wait for their audio up to a longer startup timeout,
+so the first utterances aren't decoded in-process while the workers load.
+"""
+
+import atexit
+import itertools
+import multiprocessing as mp
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from multiprocessing.shared_memory import SharedMemory
+
+import numpy as np
+from loguru import logger
+
+WINDOW_TOKENS = 28  # 4 SNAC frames of 7 tokens
+WINDOW_SAMPLES = 2048  # PCM samples produced per window
+
+_STOP = None
+_READY = "ready"
+
+
+class DecodeWorkerDiedError(RuntimeError):
+    """The decode worker a window was dispatched to died before decoding it."""
+
+
+def _worker_main(
+    index: int,
+    input_name: str,
+    output_name: str,
+    slots: int,
+    torch_threads: int,
+    tasks: mp.Queue,
+    results: mp.Queue,
+) -> None:
+    """Decode loop of one worker process."""
+    import torch
+
+    torch.set_num_threads(torch_threads)
+    torch.set_num_interop_threads(1)
+
+    from realtime_phone_agents.tts.runpod.orpheus.snac_backends import (
+        get_snac_backend,
+    )
+    from realtime_phone_agents.tts.runpod.orpheus.token_decoders import (
+        convert_to_audio,
+    )
+
+    # Build the configured backend (export, validation) before the first window
+    get_snac_backend()
+
+    input_shm = SharedMemory(name=input_name)
+    output_shm = SharedMemory(name=output_name)
+    windows = np.ndarray((slots, WINDOW_TOKENS), dtype=np.int32, buffer=input_shm.buf)
+    pcm = np.ndarray((slots, WINDOW_SAMPLES), dtype=np.int16, buffer=output_shm.buf)
+    results.put((_READY, index))
+
+    try:
+        while True:
+            task = tasks.get()
+            if task is _STOP:
+                break
+
+            slot, task_id, count = task
+            try:
+                audio_bytes = convert_to_audio(windows[slot].tolist(), count)
+            except Exception as e:
+                logger.error(f"SNAC decode worker failed: {e}")
+                audio_bytes = None
+
+            if audio_bytes is None:
+                results.put((slot, task_id, -1))
+                continue
+
+            audio = np.frombuffer(audio_bytes, dtype=np.int16)[:WINDOW_SAMPLES]
+            pcm[slot, : len(audio)] = audio
+            results.put((slot, task_id, len(audio)))
+    finally:
+        del windows, pcm
+        input_shm.close()
+        output_shm.close()
+
+
+def _decode_in_process(window: list[int], count: int) -> np.ndarray | None:
+    """Decode one window in the calling process, the fallback without workers."""
+    from realtime_phone_agents.tts.runpod.orpheus.token_decoders import (
+        convert_to_audio,
+    )
+
+    audio_bytes = convert_to_audio(window, count)
+    if audio_bytes is None:
+        return None
+    return np.frombuffer(audio_bytes, dtype=np.int16)
+
+
+class SNACDecodePool:
+    """Dispatches SNAC token windows to worker processes through shared memory."""
+
+    def __init__(
+        self,
+        workers: int,
+        torch_threads: int = 1,
+        slots: int = 64,
+        timeout_s: float = 2.0,
+        max_restarts: int = 3,
+        liveness_interval_s: float = 0.5,
+        startup_timeout_s: float = 120.0,
+    ):
+        """
+        Args:
+            workers: Number of decode processes
+            torch_threads: torch intra-op threads of each process
+            slots: Windows that can be in flight at once, across all callers
+            timeout_s: How long `decode` waits for a window, and `submit` for
+                a free slot, before decoding it in-process
+            max_restarts: Dead workers restarted over the pool's lifetime
+            liveness_interval_s: How often the workers are checked for liveness
+            startup_timeout_s: How long windows wait for their audio instead,
+                until every worker has loaded SNAC
+        """
+        self.workers = workers
+        self.torch_threads = torch_threads
+        self.slots = slots
+        self.timeout_s = timeout_s
+        self.max_restarts = max_restarts
+        self.liveness_interval_s = liveness_interval_s
+        self.startup_timeout_s = startup_timeout_s
+        self.restarts = 0
+
+        self._input_shm = SharedMemory(
+            create=True, size=slots * WINDOW_TOKENS * np.dtype(np.int32).itemsize
+        )
+        self._output_shm = SharedMemory(
+            create=True, size=slots * WINDOW_SAMPLES * np.dtype(np.int16).itemsize
+        )
+        self._windows = np.ndarray(
+            (slots, WINDOW_TOKENS), dtype=np.int32, buffer=self._input_shm.buf
+        )
+        self._pcm = np.ndarray(
+            (slots, WINDOW_SAMPLES), dtype=np.int16, buffer=self._output_shm.buf
+        )
+
+        self._free_slots: queue.Queue[int] = queue.Queue()
+        for slot in range(slots):
+            self._free_slots.put(slot)
+
+        # slot -> (task id, worker index, future) of every window in flight
+        self._in_flight: dict[int, tuple[int, int, Future]] = {}
+        self._task_ids = itertools.count()
+        self._lock = threading.Lock()
+        self._closed = False
+
+        self._context = mp.get_context("spawn")
+        self._results = self._context.Queue()
+        self._tasks: list[mp.Queue] = [None] * workers
+        self._processes: list[mp.Process | None] = [None] * workers
+        self._ready = [False] * workers
+        self._started = threading.Event()
+        for index in range(workers):
+            self._start_worker(index)
+
+        self._collector = threading.Thread(
+            target=self._collect, name="snac-decode-results", daemon=True
+        )
+        self._collector.start()
+
+        logger.info(
+            f"Started {workers} SNAC decode workers ({torch_threads} torch threads each)"
+        )
+
+    @property
+    def alive_workers(self) -> int:
+        """Number of workers windows can be dispatched to."""
+        return sum(process is not None for process in self._processes)
+
+    @property
+    def result_timeout_s(self) -> float:
+        """How long a window waits for its audio before it's decoded in-process."""
+        return self.timeout_s if self._started.is_set() else self.startup_timeout_s
+
+    def wait_ready(self, timeout: float | None = None) -> bool:
+        """
+        Wait until every worker has loaded SNAC.
+
+        Args:
+            timeout: Maximum wait in seconds (None waits indefinitely)
+
+        Returns:
+            True if the workers are ready, False on timeout
+        """
+        return self._started.wait(timeout)
+
+    def _update_started(self) -> None:
+        """Mark the pool started once no live worker is still loading (lock held)."""
+        if all(
+            ready or process is None
+            for ready, process in zip(self._ready, self._processes)
+        ):
+            self._started.set()
+
+    def _start_worker(self, index: int) -> None:
+        tasks = self._context.Queue()
+        process = self._context.Process(
+            target=_worker_main,
+            args=(
+                index,
+                self._input_shm.name,
+                self._output_shm.name,
+                self.slots,
+                self.torch_threads,
+                tasks,
+                self._results,
+            ),
+            name=f"snac-decoder-{index}",
+            daemon=True,
+        )
+        process.start()
+        self._tasks[index] = tasks
+        self._processes[index] = process
+        self._ready[index] = False
+
+    def _collect(self) -> None:
+        """Resolve the future of every decoded window, and watch the workers."""
+        last_check = time.monotonic()
+        while True:
+            try:
+                result = self._results.get(timeout=self.liveness_interval_s)
+            except queue.Empty:
+                result = ()
+            if result is _STOP:
+                break
+
+            if time.monotonic() - last_check >= self.liveness_interval_s:
+                self._check_workers()
+                last_check = time.monotonic()
+            if not result:
+                continue
+
+            if result[0] == _READY:
+                with self._lock:
+                    self._ready[result[1]] = True
+                    self._update_started()
+                logger.info(f"SNAC decode worker {result[1]} ready")
+                continue
+
+            slot, task_id, num_samples = result
+            with self._lock:
+                entry = self._in_flight.get(slot)
+                # Already failed (and the slot maybe reused) when its worker died
+                if entry is None or entry[0] != task_id:
+                    continue
+                del self._in_flight[slot]
+
+            audio = self._pcm[slot, :num_samples].copy() if num_samples >= 0 else None
+            self._free_slots.put(slot)
+            entry[2].set_result(audio)
+
+    def _check_workers(self) -> None:
+        """Fail the windows of dead workers, free their slots and restart them."""
+        failed: list[tuple[int, Future, str]] = []
+        with self._lock:
+            if self._closed:
+                return
+
+            for index, process in enumerate(self._processes):
+                if process is None or process.is_alive():
+                    continue
+
+                lost = [
+                    slot
+                    for slot, (_, worker, _) in self._in_flight.items()
+                    if worker == index
+                ]
+                for slot in lost:
+                    failed.append((slot, self._in_flight.pop(slot)[2], process.name))
+                logger.error(
+                    f"SNAC decode worker {process.name} died (exit code "
+                    f"{process.exitcode}) with {len(lost)} windows in flight"
+                )
+
+                if self.restarts < self.max_restarts:
+                    self.restarts += 1
+                    self._start_worker(index)
+                    logger.info(f"Restarted SNAC decode worker {process.name}")
+                else:
+                    self._processes[index] = None
+                    logger.error(
+                        f"SNAC decode worker {process.name} not restarted, "
+                        f"{self.alive_workers} workers left"
+                    )
+            self._update_started()
+
+        for slot, future, name in failed:
+            self._free_slots.put(slot)
+            future.set_exception(
+                DecodeWorkerDiedError(f"SNAC decode worker {name} died")
+            )
+
+    def submit(self, window: list[int], count: int) -> Future:
+        """
+        Queue one token window for decoding.
+
+        Blocks while every slot is in flight, up to `timeout_s`. Without a free
+        slot or a live worker, the window is decoded in-process.
+
+        Args:
+            window: The last 28 SNAC codes
+            count: Token count of the stream (for logging)
+
+        Returns:
+            Future of the int16 PCM of the window (None if the codes are invalid),
+            failed with DecodeWorkerDiedError if its worker dies
+        """
+        try:
+            slot = (
+                self._free_slots.get(timeout=self.timeout_s)
+                if self.alive_workers
+                else None
+            )
+        except queue.Empty:
+            logger.warning("No free SNAC decode slot, decoding the window in-process")
+            slot = None
+
+        future: Future = Future()
+        if slot is not None:
+            with self._lock:
+                live = [
+                    i
+                    for i, process in enumerate(self._processes)
+                    if process is not None
+                ]
+                if live:
+                    # Least loaded live worker, among the ready ones if any
+                    ready = [i for i in live if self._ready[i]]
+                    load = [worker for _, worker, _ in self._in_flight.values()]
+                    index = min(ready or live, key=load.count)
+                    task_id = next(self._task_ids)
+                    self._windows[slot] = window[-WINDOW_TOKENS:]
+                    self._in_flight[slot] = (task_id, index, future)
+                    self._tasks[index].put((slot, task_id, count))
+                    return future
+            self._free_slots.put(slot)
+
+        future.set_result(_decode_in_process(window[-WINDOW_TOKENS:], count))
+        return future
+
+    def decode(self, window: list[int], count: int) -> np.ndarray | None:
+        """Decode one token window and wait for its PCM, in-process if the pool fails it."""
+        try:
+            return self.submit(window, count).result(timeout=self.result_timeout_s)
+        except Exception as e:
+            logger.warning(
+                f"SNAC decode pool failed a window, decoding it in-process: {e!r}"
+            )
+            return _decode_in_process(window[-WINDOW_TOKENS:], count)
+
+    def close(self) -> None:
+        """Stop the workers and release the shared memory."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+
+        processes = [process for process in self._processes if process is not None]
+        for tasks, process in zip(self._tasks, self._processes):
+            if process is not None:
+                tasks.put(_STOP)
+        for process in processes:
+            process.join(timeout=5)
+        self._results.put(_STOP)
+        self._collector.join(timeout=5)
+
+        del self._windows, self._pcm
+        for shm in (self._input_shm, self._output_shm):
+            shm.close()
+            shm.unlink()
+
+
+# Global decode pool instance
+_snac_decode_pool = None
+
+
+def get_snac_decode_pool(
+    workers: int,
+    torch_threads: int = 1,
+    slots: int = 64,
+    timeout_s: float = 2.0,
+    max_restarts: int = 3,
+    startup_timeout_s: float = 120.0,
+) -> SNACDecodePool:
+    """Get or create the global SNAC decode pool."""
+    global _snac_decode_pool
+    if _snac_decode_pool is None:
+        _snac_decode_pool = SNACDecodePool(
+            workers,
+            torch_threads,
+            slots,
+            timeout_s,
+            max_restarts,
+            startup_timeout_s=startup_timeout_s,
+        )
+        atexit.register(_snac_decode_pool.close)
+    return _snac_decode_pool
@@ -0,0 +1,200 @@
+"""
+Health-aware routing across several Orpheus (llama.cpp) endpoints.
+
+Each utterance is routed to one endpoint, either the one with the fewest
+outstanding requests or the one with the best measured tokens/s per
+outstanding request. Endpoints that fail are ejected until a periodic
+health probe sees them answering again.
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from typing import Generator, Literal
+
+import requests
+from loguru import logger
+
+RoutingStrategy = Literal["least_outstanding", "throughput"]
+
+# Weight of the latest measurement in the tokens/s moving average
+_THROUGHPUT_EWMA_ALPHA = 0.3
+
+
+class OrpheusEndpoint:
+    """Live routing state of one Orpheus endpoint."""
+
+    def __init__(self, url: str):
+        self.url = url.rstrip("/")
+        self.outstanding = 0
+        self.healthy = True
+        self.tokens_per_s: float | None = None
+        self.failures = 0
+
+    def observe(self, tokens: int, elapsed_s: float) -> None:
+        """
+        Record the throughput of a completed generation.
+
+        Args:
+            tokens: Number of tokens generated
+            elapsed_s: Wall time of the generation (seconds)
+        """
+        if tokens <= 0 or elapsed_s <= 0:
+            return
+
+        rate = tokens / elapsed_s
+        if self.tokens_per_s is None:
+            self.tokens_per_s = rate
+        else:
+            self.tokens_per_s += _THROUGHPUT_EWMA_ALPHA * (rate - self.tokens_per_s)
+
+
+class OrpheusEndpointPool:
+    """Routes utterances across Orpheus endpoints and tracks their health."""
+
+    def __init__(
+        self,
+        urls: list[str],
+        routing: RoutingStrategy = "least_outstanding",
+        health_check_interval_s: float = 10.0,
+        health_check_timeout_s: float = 2.0,
+        session: requests.Session | None = None,
+    ):
+        """
+        Args:
+            urls: Endpoint base URLs (duplicates are ignored)
+            routing: "least_outstanding" or "throughput"
+            health_check_interval_s: Interval between health probes (0 disables them)
+            health_check_timeout_s: Timeout of a single health probe
+            session: HTTP session used for the probes
+        """
+        unique_urls = dict.fromkeys(url.rstrip("/") for url in urls if url)
+        self.endpoints = [OrpheusEndpoint(url) for url in unique_urls]
+        self.routing = routing
+        self.health_check_interval_s = health_check_interval_s
+        self.health_check_timeout_s = health_check_timeout_s
+
+        self._session = session or requests.Session()
+        self._lock = threading.Lock()
+        self._probe_thread: threading.Thread | None = None
+
+    def _score(self, endpoint: OrpheusEndpoint) -> tuple:
+        """Lower is better."""
+        if self.routing == "throughput":
+            # Unmeasured endpoints are tried optimistically
+            known = [
+                e.tokens_per_s for e in self.endpoints if e.tokens_per_s is not None
+            ]
+            rate = endpoint.tokens_per_s or max(known, default=1.0)
+            return (-rate / (endpoint.outstanding + 1),)
+        return (endpoint.outstanding, -(endpoint.tokens_per_s or 0.0))
+
+    def select(self, exclude: set[str] | None = None) -> OrpheusEndpoint | None:
+        """
+        Pick the endpoint for the next utterance.
+
+        Healthy endpoints are preferred. If none is healthy, every endpoint is
+        a candidate, so a pool that was wrongly ejected can still serve.
+
+        Args:
+            exclude: URLs already tried for this utterance
+
+        Returns:
+            The selected endpoint, or None if every endpoint is excluded
+        """
+        self._ensure_health_checks()
+        exclude = exclude or set()
+
+        with self._lock:
+            candidates = [e for e in self.endpoints if e.url not in exclude]
+            healthy = [e for e in candidates if e.healthy]
+            candidates = healthy or candidates
+            if not candidates:
+                return None
+            return min(candidates, key=self._score)
+
+    @contextmanager
+    def track(
+        self, endpoint: OrpheusEndpoint
+    ) -> Generator[OrpheusEndpoint, None, None]:
+        """Count a request as outstanding on `endpoint` while it runs."""
+        with self._lock:
+            endpoint.outstanding += 1
+        try:
+            yield endpoint
+        finally:
+            with self._lock:
+                endpoint.outstanding -= 1
+
+    def mark_failed(self, endpoint: OrpheusEndpoint) -> None:
+        """Eject an endpoint until a health probe sees it answering again."""
+        with self._lock:
+            endpoint.failures += 1
+            if endpoint.healthy and len(self.endpoints) > 1:
+                logger.warning(f"Ejecting unhealthy Orpheus endpoint {endpoint.url}")
+                endpoint.healthy = False
+
+    def mark_succeeded(self, endpoint: OrpheusEndpoint) -> None:
+        with self._lock:
+            endpoint.failures = 0
+
+    def probe(self, endpoint: OrpheusEndpoint) -> bool:
+        """
+        Check an endpoint through the llama.cpp `/health` route.
+
+        Args:
+            endpoint: Endpoint to check
+
+        Returns:
+            True if the endpoint is healthy
+        """
+        try:
+            response = self._session.get(
+                f"{endpoint.url}/health", timeout=self.health_check_timeout_s
+            )
+            healthy = response.status_code == 200
+        except requests.RequestException:
+            healthy = False
+
+        with self._lock:
+            if healthy != endpoint.healthy:
+                state = "back in rotation" if healthy else "ejected"
+                logger.info(f"Orpheus endpoint {endpoint.url} {state}")
+            endpoint.healthy = healthy or len(self.endpoints) == 1
+        return healthy
+
+    def _probe_loop(self) -> None:
+        while True:
+            time.sleep(self.health_check_interval_s)
+            for endpoint in self.endpoints:
+                self.probe(endpoint)
+
+    def _ensure_health_checks(self) -> None:
+        """Start the background probe thread on first use of a multi-endpoint pool."""
+        if (
+            self._probe_thread is not None
+            or len(self.endpoints) < 2
+            or self.health_check_interval_s <= 0
+        ):
+            return
+
+        with self._lock:
+            if self._probe_thread is None:
+                self._probe_thread = threading.Thread(
+                    target=self._probe_loop, name="orpheus-health", daemon=True
+                )
+                self._probe_thread.start()
+
+    def report(self) -> list[dict]:
+        """Snapshot of the routing state of every endpoint."""
+        with self._lock:
+            return [
+                {
+                    "url": e.url,
+                    "healthy": e.healthy,
+                    "outstanding": e.outstanding,
+                    "tokens_per_s": e.tokens_per_s,
+                    "failures": e.failures,
+                }
+                for e in self.endpoints
+            ]
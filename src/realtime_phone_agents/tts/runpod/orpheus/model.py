@@ -9,24 +9,37 @@ License: MIT
 """
 
 import asyncio
-import json
-import threading
 import time
 import traceback
-from typing import AsyncGenerator, Generator, Optional
+from collections import deque
+from concurrent.futures import Future
+from contextlib import aclosing
+from typing import AsyncGenerator, Generator
 
+import httpx
 import numpy as np
 import requests
 from loguru import logger
 from numpy.typing import NDArray
 
 from realtime_phone_agents.tts.base import TTSModel
-from realtime_phone_agents.tts.runpod.orpheus.options import (
-    CUSTOM_TOKEN_PREFIX,
-    OrpheusTTSOptions,
+from realtime_phone_agents.tts.runpod.orpheus.decode_pool import (
+    SNACDecodePool,
+    get_snac_decode_pool,
+)
+from realtime_phone_agents.tts.runpod.orpheus.endpoints import (
+    OrpheusEndpoint,
+    OrpheusEndpointPool,
+)
+from realtime_phone_agents.tts.runpod.orpheus.options import OrpheusTTSOptions
+from realtime_phone_agents.tts.runpod.orpheus.sse import (
+    OrpheusSSEParser,
+    custom_token_to_id,
 )
 from realtime_phone_agents.tts.runpod.orpheus.token_decoders import (
+    TokenDecoder,
     convert_to_audio,
+    tokens_decoder,
 )
 
 
@@ -40,6 +53,40 @@ class OrpheusTTSModel(TTSModel):
         """
         self.options = options or OrpheusTTSOptions()
 
+        # Persistent session so every utterance reuses the pooled connection
+        self._session = requests.Session()
+        # Async clients of stream_tts, one per event loop: a client is bound to
+        # the loop it was first used in (startup warmups may run in another one)
+        self._async_clients: dict[asyncio.AbstractEventLoop, httpx.AsyncClient] = {}
+
+        # Every utterance is routed to one endpoint of the pool
+        self._pool = OrpheusEndpointPool(
+            [self.options.api_url, *self.options.api_urls],
+            routing=self.options.routing,
+            health_check_interval_s=self.options.health_check_interval_s,
+            health_check_timeout_s=self.options.health_check_timeout_s,
+            session=self._session,
+        )
+
+        # SNAC decoding runs in worker processes when configured, off the GIL
+        self._decode_pool: SNACDecodePool | None = (
+            get_snac_decode_pool(
+                self.options.decode_workers,
+                self.options.decode_torch_threads,
+                self.options.decode_slots,
+                self.options.decode_timeout_s,
+                self.options.decode_max_restarts,
+                self.options.decode_startup_timeout_s,
+            )
+            if self.options.decode_workers > 0
+            else None
+        )
+
+    @property
+    def endpoint_pool(self) -> OrpheusEndpointPool:
+        """Get the pool of Orpheus endpoints utterances are routed to."""
+        return self._pool
+
     def set_voice(self, voice: str) -> None:
         """
         Set the voice for the Orpheus TTS model.
@@ -49,6 +96,38 @@ class OrpheusTTSModel(TTSModel):
         """
         self.options.voice = voice
 
+    def _get_async_client(self) -> httpx.AsyncClient:
+        """Get or create the async client of the running event loop."""
+        loop = asyncio.get_running_loop()
+        client = self._async_clients.get(loop)
+        if client is None:
+            # Clients of closed loops can't be used, nor closed, anymore
+            for stale in [other for other in self._async_clients if other.is_closed()]:
+                del self._async_clients[stale]
+            client = httpx.AsyncClient(timeout=None)
+            self._async_clients[loop] = client
+        return client
+
+    async def wait_ready(self) -> None:
+        """Wait for the SNAC decode workers to load their decoder, if there are any."""
+        if self._decode_pool is None:
+            return
+
+        ready = await asyncio.to_thread(
+            self._decode_pool.wait_ready, self.options.decode_startup_timeout_s
+        )
+        if not ready:
+            logger.warning(
+                "SNAC decode workers still not ready after "
+                f"{self.options.decode_startup_timeout_s}s"
+            )
+
+    async def aclose(self) -> None:
+        """Close the async client of the running event loop."""
+        client = self._async_clients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.aclose()
+
     def _format_prompt(self, prompt: str, voice: str) -> str:
         """
         Format the input prompt with Orpheus-specific tokens.
@@ -62,38 +141,43 @@ class OrpheusTTSModel(TTSModel):
         """
         return f"<|audio|>{voice}: {prompt}<|eot_id|>"
 
+    def _completion_payload(self, text: str, options: OrpheusTTSOptions) -> dict:
+        """Build the streaming completion request of an utterance."""
+        return {
+            "model": options.model,
+            "prompt": self._format_prompt(text, options.voice),
+            "max_tokens": options.max_tokens,
+            "temperature": options.temperature,
+            "top_p": options.top_p,
+            "repeat_penalty": options.repetition_penalty,
+            "stream": True,
+        }
+
     def _generate_tokens_sync(
         self,
         text: str,
         options: OrpheusTTSOptions,
-    ) -> Generator[str, None, None]:
+        endpoint: OrpheusEndpoint | None = None,
+    ) -> Generator[int, None, None]:
         """
         Generate audio tokens synchronously via streaming API.
 
         Args:
             text: Text to convert to speech.
             options: TTS configuration options.
+            endpoint: Endpoint to request (defaults to options.api_url).
 
         Yields:
-            Individual token strings as they arrive from the API.
+            Custom token numbers as they arrive from the API.
         """
         logger.debug(f"Generating tokens for text: {text}")
-        formatted_prompt = self._format_prompt(text, options.voice)
-
-        payload = {
-            "model": options.model,
-            "prompt": formatted_prompt,
-            "max_tokens": options.max_tokens,
-            "temperature": options.temperature,
-            "top_p": options.top_p,
-            "repeat_penalty": options.repetition_penalty,
-            "stream": True,
-        }
+        payload = self._completion_payload(text, options)
+        api_url = endpoint.url if endpoint is not None else options.api_url
 
         try:
-            logger.debug(f"Requesting API: {options.api_url}")
-            response = requests.post(
-                f"{options.api_url}/v1/completions",
+            logger.debug(f"Requesting API: {api_url}")
+            response = self._session.post(
+                f"{api_url}/v1/completions",
                 headers=options.headers,
                 json=payload,
                 stream=True,
@@ -103,69 +187,88 @@ class OrpheusTTSModel(TTSModel):
 
             token_counter = 0
             start_time = time.time()
-
-            for line in response.iter_lines():
-                if not line:
-                    continue
-
-                line_str = line.decode("utf-8")
-                if not line_str.startswith("data: "):
-                    continue
-
-                data_str = line_str[6:].strip()
-                if data_str == "[DONE]":
-                    logger.debug("Token generation complete")
+            parser = OrpheusSSEParser()
+
+            # Parse every network read in bulk, it may hold several events
+            for data in response.iter_content(chunk_size=None):
+                for number in parser.feed(data):
+                    token_counter += 1
+                    if token_counter == 1:
+                        elapsed = time.time() - start_time
+                        logger.info(f"Time to first token: {elapsed:.2f}s")
+                    yield number
+                if parser.done:
                     break
+            else:
+                yield from parser.flush()
+
+            logger.debug("Token generation complete")
+            if endpoint is not None:
+                endpoint.observe(token_counter, time.time() - start_time)
 
-                try:
-                    data = json.loads(data_str)
-                except json.JSONDecodeError as e:
-                    logger.error(f"JSON decode error: {e}")
-                    continue
-
-                if "choices" in data and data["choices"]:
-                    token_text = data["choices"][0].get("text", "")
-                    if token_text:
-                        token_counter += 1
-                        if token_counter == 1:
-                            elapsed = time.time() - start_time
-                            logger.info(f"Time to first token: {elapsed:.2f}s")
-                        yield token_text
+            if parser.fallbacks:
+                logger.debug(
+                    f"SSE lines parsed through the JSON fallback: {parser.fallbacks}"
+                )
 
         except requests.RequestException as e:
             logger.error(f"API request failed: {e}")
             raise
 
-    def _turn_token_into_id(self, token_string: str, index: int) -> Optional[int]:
+    async def _generate_tokens(
+        self,
+        text: str,
+        options: OrpheusTTSOptions,
+        endpoint: OrpheusEndpoint,
+    ) -> AsyncGenerator[int, None]:
         """
-        Convert a token string to its numeric audio token ID.
+        Generate audio tokens asynchronously via streaming API.
 
         Args:
-            token_string: Token text containing custom token markers.
-            index: Current token position (used for offset calculation).
+            text: Text to convert to speech.
+            options: TTS configuration options.
+            endpoint: Endpoint to request.
 
-        Returns:
-            Decoded token ID or None if invalid.
+        Yields:
+            Custom token numbers as they arrive from the API.
         """
-        token_string = token_string.strip()
-        last_token_start = token_string.rfind(CUSTOM_TOKEN_PREFIX)
+        logger.debug(f"Generating tokens for text: {text}")
+        client = self._get_async_client()
+
+        token_counter = 0
+        start_time = time.time()
+        parser = OrpheusSSEParser()
+
+        logger.debug(f"Requesting API: {endpoint.url}")
+        async with client.stream(
+            "POST",
+            f"{endpoint.url}/v1/completions",
+            headers=options.headers,
+            json=self._completion_payload(text, options),
+        ) as response:
+            response.raise_for_status()
 
-        if last_token_start == -1:
-            return None
+            # Parse every network read in bulk, it may hold several events
+            async for data in response.aiter_bytes():
+                for number in parser.feed(data):
+                    token_counter += 1
+                    if token_counter == 1:
+                        elapsed = time.time() - start_time
+                        logger.info(f"Time to first token: {elapsed:.2f}s")
+                    yield number
+                if parser.done:
+                    break
+            else:
+                for number in parser.flush():
+                    yield number
 
-        last_token = token_string[last_token_start:]
+        logger.debug("Token generation complete")
+        endpoint.observe(token_counter, time.time() - start_time)
 
-        if last_token.startswith(CUSTOM_TOKEN_PREFIX) and last_token.endswith(">"):
-            try:
-                number_str = last_token[
-                    14:-1
-                ]  # Extract number from <custom_token_XXXXX>
-                token_id = int(number_str) - 10 - ((index % 7) * 4096)
-                return token_id
-            except ValueError:
-                return None
-
-        return None
+        if parser.fallbacks:
+            logger.debug(
+                f"SSE lines parsed through the JSON fallback: {parser.fallbacks}"
+            )
 
     def _convert_buffer(
         self,
@@ -195,41 +298,136 @@ class OrpheusTTSModel(TTSModel):
             traceback.print_exc()
             return None
 
+    def _pooled_result(
+        self, window: list[int], count: int, future: Future
+    ) -> NDArray[np.int16] | None:
+        """
+        Wait for a window submitted to the decode pool.
+
+        A window the pool doesn't decode in time, or whose worker died, is
+        decoded in-process instead.
+        """
+        try:
+            return future.result(timeout=self._decode_pool.result_timeout_s)
+        except Exception as e:
+            logger.warning(
+                f"SNAC decode pool failed a window, decoding it in-process: {e!r}"
+            )
+            return self._convert_buffer(window, count)
+
+    async def _pooled_result_async(
+        self, window: list[int], count: int, future: Future
+    ) -> NDArray[np.int16] | None:
+        """Async counterpart of `_pooled_result`, awaited without blocking the loop."""
+        result = asyncio.wrap_future(future)
+        # Not wait_for: cancelling the wrapper would cancel the pool's future
+        done, _ = await asyncio.wait(
+            {result}, timeout=self._decode_pool.result_timeout_s
+        )
+        if result in done and result.exception() is None:
+            return result.result()
+
+        error = result.exception() if result in done else TimeoutError()
+        logger.warning(
+            f"SNAC decode pool failed a window, decoding it in-process: {error!r}"
+        )
+        return await asyncio.to_thread(self._convert_buffer, window, count)
+
     def _token_decoder_sync(
         self,
-        token_gen: Generator[str, None, None],
+        token_gen: Generator[int, None, None],
     ) -> Generator[NDArray[np.int16], None, None]:
         """
         Decode streaming tokens into audio chunks.
 
         Buffers tokens and yields audio at regular intervals using Orpheus's
-        multi-frame encoding (28 tokens, output every 7 tokens).
+        multi-frame encoding (28 tokens, output every 7 tokens). With a decode
+        pool, windows are decoded in the background while tokens keep arriving,
+        and their audio is yielded in order.
 
         Args:
-            token_gen: Generator yielding token strings.
+            token_gen: Generator yielding custom token numbers.
 
         Yields:
             Audio chunks as numpy arrays of PCM samples.
         """
-        buffer: list[int] = []
-        count = 0
+        decoder = TokenDecoder()
+        pending: deque[tuple[list[int], int, Future]] = deque()
 
         logger.debug("Starting token decoding")
-        for token_text in token_gen:
-            token_id = self._turn_token_into_id(token_text, count)
-            if token_id is None or token_id <= 0:
+        for number in token_gen:
+            window = decoder.push(custom_token_to_id(number, decoder.count))
+            if window is None:
+                continue
+
+            if self._decode_pool is None:
+                audio_samples = self._convert_buffer(window, decoder.count)
+                if audio_samples is not None and audio_samples.size > 0:
+                    yield audio_samples
                 continue
 
-            buffer.append(token_id)
-            count += 1
+            future = self._decode_pool.submit(window, decoder.count)
+            pending.append((window, decoder.count, future))
+            while pending and pending[0][2].done():
+                audio_samples = self._pooled_result(*pending.popleft())
+                if audio_samples is not None and audio_samples.size > 0:
+                    yield audio_samples
+
+        while pending:
+            audio_samples = self._pooled_result(*pending.popleft())
+            if audio_samples is not None and audio_samples.size > 0:
+                yield audio_samples
+
+    async def _token_decoder(
+        self,
+        token_gen: AsyncGenerator[int, None],
+    ) -> AsyncGenerator[NDArray[np.int16], None]:
+        """
+        Decode streaming tokens into audio chunks, without blocking the event loop.
+
+        Same decoding as `_token_decoder_sync`. Without a decode pool, every
+        window is decoded in a worker thread. With one, windows are submitted
+        as soon as they are due and their audio is awaited in order, so several
+        windows decode while tokens keep arriving.
+
+        Args:
+            token_gen: Async generator yielding custom token numbers.
+
+        Yields:
+            Audio chunks as numpy arrays of PCM samples.
+        """
+        if self._decode_pool is None:
+            async for audio_samples in tokens_decoder(
+                token_gen, decode=self._convert_buffer, to_id=custom_token_to_id
+            ):
+                if audio_samples.size > 0:
+                    yield audio_samples
+            return
+
+        decoder = TokenDecoder()
+        pending: deque[tuple[list[int], int, Future]] = deque()
+
+        logger.debug("Starting token decoding")
+        async for number in token_gen:
+            window = decoder.push(custom_token_to_id(number, decoder.count))
+            if window is None:
+                continue
 
-            # Generate audio every 7 tokens after initial 28
-            if count % 7 == 0 and count > 27:
-                buffer_to_process = buffer[-28:]
-                audio_samples = self._convert_buffer(buffer_to_process, count)
+            # submit blocks while every slot is in flight, off the event loop
+            future = await asyncio.to_thread(
+                self._decode_pool.submit, window, decoder.count
+            )
+            pending.append((window, decoder.count, future))
+            while pending and pending[0][2].done():
+                audio_samples = await self._pooled_result_async(*pending.popleft())
                 if audio_samples is not None and audio_samples.size > 0:
                     yield audio_samples
 
+        while pending:
+            audio_samples = await self._pooled_result_async(*pending.popleft())
+            if audio_samples is not None and audio_samples.size > 0:
+                yield audio_samples
+
     def stream_tts_sync(
         self,
         text: str,
@@ -246,14 +444,39 @@ class OrpheusTTSModel(TTSModel):
             Tuples of (sample_rate, audio_chunk).
         """
         opts = options or self.options
+        attempted: set[str] = set()
 
-        try:
-            token_gen = self._generate_tokens_sync(text, opts)
-            for audio_chunk in self._token_decoder_sync(token_gen):
-                yield opts.sample_rate, audio_chunk
-        except Exception as e:
-            logger.error(f"Sync streaming error: {e}")
-            traceback.print_exc()
+        # A failed utterance is retried on another endpoint, as long as no
+        # audio has been emitted yet
+        while len(attempted) < max(opts.max_attempts, 1):
+            endpoint = self._pool.select(exclude=attempted)
+            if endpoint is None:
+                break
+            attempted.add(endpoint.url)
+
+            emitted = False
+            try:
+                with self._pool.track(endpoint):
+                    token_gen = self._generate_tokens_sync(text, opts, endpoint)
+                    for audio_chunk in self._token_decoder_sync(token_gen):
+                        emitted = True
+                        yield opts.sample_rate, audio_chunk
+                self._pool.mark_succeeded(endpoint)
+                return
+            except requests.RequestException as e:
+                self._pool.mark_failed(endpoint)
+                if emitted:
+                    logger.error(
+                        f"Orpheus endpoint {endpoint.url} failed mid-utterance: {e}"
+                    )
+                    return
+                logger.warning(f"Orpheus endpoint {endpoint.url} failed, retrying: {e}")
+            except Exception as e:
+                logger.error(f"Sync streaming error: {e}")
+                traceback.print_exc()
+                return
+
+        logger.error(f"No Orpheus endpoint could synthesize the utterance: {text!r}")
 
     async def stream_tts(
         self,
@@ -276,33 +499,42 @@ class OrpheusTTSModel(TTSModel):
             Tuples of (sample_rate, audio_chunk) as they become available.
         """
         opts = options or self.options
-        loop = asyncio.get_running_loop()
-        queue: asyncio.Queue[tuple[int, NDArray[np.int16]] | None] = asyncio.Queue()
+        attempted: set[str] = set()
+
+        # Same retries as stream_tts_sync, tokens are streamed and decoded
+        # without blocking the event loop
+        while len(attempted) < max(opts.max_attempts, 1):
+            endpoint = self._pool.select(exclude=attempted)
+            if endpoint is None:
+                break
+            attempted.add(endpoint.url)
 
-        def worker():
-            """Background thread worker that feeds the async queue."""
+            emitted = False
             try:
-                for sample_rate, chunk in self.stream_tts_sync(text, opts):
-                    # Send chunk to async queue
-                    asyncio.run_coroutine_threadsafe(
-                        queue.put((sample_rate, chunk)), loop
+                with self._pool.track(endpoint):
+                    # Closed right away if the caller stops early, with its request
+                    async with aclosing(
+                        self._generate_tokens(text, opts, endpoint)
+                    ) as token_gen:
+                        async for audio_chunk in self._token_decoder(token_gen):
+                            emitted = True
+                            yield opts.sample_rate, audio_chunk
+                self._pool.mark_succeeded(endpoint)
+                return
+            except httpx.HTTPError as e:
+                self._pool.mark_failed(endpoint)
+                if emitted:
+                    logger.error(
+                        f"Orpheus endpoint {endpoint.url} failed mid-utterance: {e}"
                     )
+                    return
+                logger.warning(f"Orpheus endpoint {endpoint.url} failed, retrying: {e}")
             except Exception as e:
-                logger.error(f"Worker thread error: {e}")
+                logger.error(f"Async streaming error: {e}")
                 traceback.print_exc()
-            finally:
-                # Signal completion
-                asyncio.run_coroutine_threadsafe(queue.put(None), loop)
+                return
 
-        # Start background worker
-        threading.Thread(target=worker, daemon=True).start()
-
-        # Yield chunks as they arrive
-        while True:
-            item = await queue.get()
-            if item is None:
-                break
-            yield item
+        logger.error(f"No Orpheus endpoint could synthesize the utterance: {text!r}")
 
     async def tts(
         self,
@@ -1,3 +1,5 @@
+from typing import Literal
+
 from pydantic import BaseModel, Field
 
 from realtime_phone_agents.config import settings
@@ -13,6 +15,26 @@ class OrpheusTTSOptions(BaseModel):
         default_factory=lambda: settings.orpheus.api_url,
         description="Orpheus TTS API URL",
     )
+    api_urls: list[str] = Field(
+        default_factory=lambda: list(settings.orpheus.api_urls),
+        description="Additional Orpheus endpoints, pooled with api_url",
+    )
+    routing: Literal["least_outstanding", "throughput"] = Field(
+        default_factory=lambda: settings.orpheus.routing,
+        description="How utterances are routed across endpoints",
+    )
+    health_check_interval_s: float = Field(
+        default_factory=lambda: settings.orpheus.health_check_interval_s,
+        description="Interval between endpoint health probes (seconds)",
+    )
+    health_check_timeout_s: float = Field(
+        default_factory=lambda: settings.orpheus.health_check_timeout_s,
+        description="Timeout of a single endpoint health probe (seconds)",
+    )
+    max_attempts: int = Field(
+        default_factory=lambda: settings.orpheus.max_attempts,
+        description="Endpoints tried for an utterance that fails before any audio",
+    )
     model: str = Field(
         default_factory=lambda: settings.orpheus.model, description="Orpheus TTS Model"
     )
@@ -47,5 +69,29 @@ class OrpheusTTSOptions(BaseModel):
     debug: bool = Field(
         default_factory=lambda: settings.orpheus.debug, description="Enable debug mode"
     )
+    decode_workers: int = Field(
+        default_factory=lambda: settings.orpheus.decode_workers,
+        description="SNAC decode worker processes (0 decodes in-process)",
+    )
+    decode_torch_threads: int = Field(
+        default_factory=lambda: settings.orpheus.decode_torch_threads,
+        description="torch threads of each SNAC decode worker",
+    )
+    decode_slots: int = Field(
+        default_factory=lambda: settings.orpheus.decode_slots,
+        description="Token windows that can be in flight in the decode pool",
+    )
+    decode_timeout_s: float = Field(
+        default_factory=lambda: settings.orpheus.decode_timeout_s,
+        description="Wait for a window from the decode pool before decoding it in-process (seconds)",
+    )
+    decode_max_restarts: int = Field(
+        default_factory=lambda: settings.orpheus.decode_max_restarts,
+        description="Dead SNAC decode workers restarted before the pool shrinks",
+    )
+    decode_startup_timeout_s: float = Field(
+        default_factory=lambda: settings.orpheus.decode_startup_timeout_s,
+        description="Wait for a window while the decode workers still load SNAC (seconds)",
+    )
 
     model_config = {"arbitrary_types_allowed": True}
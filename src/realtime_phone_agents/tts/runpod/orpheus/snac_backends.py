@@ -0,0 +1,301 @@
+"""
+Pluggable SNAC decoder backends.
+
+- "torch": the reference PyTorch SNAC decoder (CUDA / MPS / CPU)
+- "onnx": the SNAC decoder exported to ONNX, run by ONNX Runtime on CPU
+- "onnx-int8": the ONNX export with int8 dynamic quantization of its weights
+
+The ONNX models are exported once and cached on disk. Every alternative
+backend is checked against the torch reference when it's built: if its audio
+isn't within `snac_min_snr_db` of the reference, the torch backend is used.
+"""
+
+import os
+import tempfile
+import threading
+from abc import ABC, abstractmethod
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Literal
+
+import numpy as np
+from loguru import logger
+
+from realtime_phone_agents.config import settings
+
+SNACBackendName = Literal["torch", "onnx", "onnx-int8"]
+
+SNAC_MODEL_ID = "hubertsiuzdak/snac_24khz"
+_CODE_INPUTS = ["codes_0", "codes_1", "codes_2"]
+
+
+class SNACBackend(ABC):
+    """Decodes SNAC codes (3 levels) into audio."""
+
+    name: str
+
+    @abstractmethod
+    def decode(self, codes: list[np.ndarray]) -> np.ndarray:
+        """
+        Decode one window of SNAC codes.
+
+        Args:
+            codes: int32 codes of shape (1, n), (1, 2n) and (1, 4n)
+
+        Returns:
+            float32 audio of shape (1, 1, samples)
+        """
+        pass
+
+
+class TorchSNACBackend(SNACBackend):
+    """The reference PyTorch SNAC decoder."""
+
+    name = "torch"
+
+    def __init__(self):
+        import torch
+
+        from realtime_phone_agents.tts.runpod.orpheus.token_decoders import (
+            get_snac_device,
+            get_snac_model,
+        )
+
+        self._torch = torch
+        self._device = get_snac_device()
+        self._model = get_snac_model()
+
+    def decode(self, codes: list[np.ndarray]) -> np.ndarray:
+        tensors = [self._torch.from_numpy(c).to(self._device) for c in codes]
+        with self._torch.inference_mode():
+            audio = self._model.decode(tensors)
+        return audio.detach().cpu().numpy()
+
+
+@contextmanager
+def _atomic_path(path: Path) -> Iterator[Path]:
+    """
+    Yield a temporary path next to `path`, moved onto it once written.
+
+    Decode workers build their backend concurrently, none of them may load a
+    model another one is still writing.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(
+        dir=path.parent, prefix=f".{path.stem}.", suffix=path.suffix
+    )
+    os.close(fd)
+    try:
+        yield Path(tmp)
+        os.replace(tmp, path)
+    finally:
+        if os.path.exists(tmp):
+            os.unlink(tmp)
+
+
+def export_snac_decoder(path: Path) -> Path:
+    """
+    Export the SNAC decoder (codes -> audio) to ONNX.
+
+    Args:
+        path: Destination of the ONNX model
+
+    Returns:
+        The path of the exported model
+    """
+    import torch
+    from snac import SNAC
+
+    model = SNAC.from_pretrained(SNAC_MODEL_ID).eval()
+
+    # Fold weight norm into plain weights, the exported graph gets simpler
+    for module in model.modules():
+        if hasattr(module, "weight_g"):
+            torch.nn.utils.remove_weight_norm(module)
+
+    class _Decoder(torch.nn.Module):
+        def __init__(self, snac: SNAC):
+            super().__init__()
+            self.snac = snac
+
+        def forward(self, codes_0, codes_1, codes_2):
+            return self.snac.decode([codes_0, codes_1, codes_2])
+
+    frames = 4
+    example = tuple(
+        torch.zeros((1, frames * 2**level), dtype=torch.int32) for level in range(3)
+    )
+
+    with _atomic_path(path) as tmp:
+        torch.onnx.export(
+            _Decoder(model),
+            example,
+            str(tmp),
+            input_names=_CODE_INPUTS,
+            output_names=["audio"],
+            dynamic_axes={
+                name: {1: f"frames_{i}"} for i, name in enumerate(_CODE_INPUTS)
+            }
+            | {"audio": {2: "samples"}},
+            opset_version=17,
+            dynamo=False,
+        )
+    logger.info(f"Exported SNAC decoder to {path}")
+    return path
+
+
+def quantize_snac_decoder(source: Path, path: Path) -> Path:
+    """
+    Quantize the weights of an exported SNAC decoder to int8.
+
+    Args:
+        source: The float ONNX model
+        path: Destination of the quantized model
+
+    Returns:
+        The path of the quantized model
+    """
+    from onnxruntime.quantization import QuantType, quantize_dynamic
+
+    with _atomic_path(path) as tmp:
+        quantize_dynamic(str(source), str(tmp), weight_type=QuantType.QInt8)
+    logger.info(f"Quantized SNAC decoder to {path}")
+    return path
+
+
+class OnnxSNACBackend(SNACBackend):
+    """SNAC decoder exported to ONNX, optionally int8-quantized, on ONNX Runtime."""
+
+    def __init__(
+        self,
+        quantized: bool = False,
+        model_dir: str | Path = settings.orpheus.snac_onnx_dir,
+        threads: int = settings.orpheus.decode_torch_threads,
+    ):
+        """
+        Args:
+            quantized: Use int8 dynamic quantization of the weights
+            model_dir: Where exported models are cached
+            threads: ONNX Runtime intra-op threads
+        """
+        import onnxruntime as ort
+
+        self.name = "onnx-int8" if quantized else "onnx"
+
+        model_dir = Path(model_dir)
+        path = model_dir / "snac_24khz_decoder.onnx"
+        if not path.exists():
+            export_snac_decoder(path)
+        if quantized:
+            source, path = path, model_dir / "snac_24khz_decoder.int8.onnx"
+            if not path.exists():
+                quantize_snac_decoder(source, path)
+
+        options = ort.SessionOptions()
+        options.intra_op_num_threads = threads
+        options.inter_op_num_threads = 1
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+
+        self._session = ort.InferenceSession(
+            str(path), options, providers=["CPUExecutionProvider"]
+        )
+
+    def decode(self, codes: list[np.ndarray]) -> np.ndarray:
+        inputs = {
+            name: c.astype(np.int32, copy=False) for name, c in zip(_CODE_INPUTS, codes)
+        }
+        return self._session.run(None, inputs)[0]
+
+
+def create_snac_backend(name: SNACBackendName) -> SNACBackend:
+    """Instantiate a SNAC backend by name."""
+    if name == "torch":
+        return TorchSNACBackend()
+    elif name == "onnx":
+        return OnnxSNACBackend(quantized=False)
+    elif name == "onnx-int8":
+        return OnnxSNACBackend(quantized=True)
+    else:
+        raise ValueError(f"Invalid SNAC backend: {name}")
+
+
+def random_code_windows(
+    count: int, frames: int = 4, seed: int = 0
+) -> list[list[np.ndarray]]:
+    """Random but valid SNAC code windows, for validation and benchmarks."""
+    rng = np.random.default_rng(seed)
+    return [
+        [
+            rng.integers(0, 4096, size=(1, frames * 2**level), dtype=np.int32)
+            for level in range(3)
+        ]
+        for _ in range(count)
+    ]
+
+
+def snr_db(reference: np.ndarray, candidate: np.ndarray) -> float:
+    """Signal-to-noise ratio of `candidate` against `reference` (dB)."""
+    reference = reference.astype(np.float64).reshape(-1)
+    noise = reference - candidate.astype(np.float64).reshape(-1)
+    noise_power = np.sum(noise**2)
+    if noise_power == 0:
+        return float("inf")
+    return float(10 * np.log10(np.sum(reference**2) / noise_power))
+
+
+def measure_snr(
+    backend: SNACBackend, reference: SNACBackend, windows: list[list[np.ndarray]]
+) -> float:
+    """Worst-case SNR of a backend against the reference over code windows."""
+    return min(
+        snr_db(reference.decode(codes), backend.decode(codes)) for codes in windows
+    )
+
+
+# Global backend instance
+_snac_backend = None
+_snac_backend_lock = threading.Lock()
+
+
+def get_snac_backend(
+    name: SNACBackendName = settings.orpheus.snac_backend,
+    min_snr_db: float = settings.orpheus.snac_min_snr_db,
+) -> SNACBackend:
+    """
+    Get or create the global SNAC backend.
+
+    Alternative backends fall back to torch if they can't be built or if their
+    audio is not within `min_snr_db` of the torch reference.
+    """
+    global _snac_backend
+    if _snac_backend is not None:
+        return _snac_backend
+
+    # Utterances decode in parallel threads, build the backend only once
+    with _snac_backend_lock:
+        if _snac_backend is None:
+            _snac_backend = _build_snac_backend(name, min_snr_db)
+    return _snac_backend
+
+
+def _build_snac_backend(name: SNACBackendName, min_snr_db: float) -> SNACBackend:
+    reference = TorchSNACBackend()
+    if name == "torch":
+        return reference
+
+    try:
+        backend = create_snac_backend(name)
+        snr = measure_snr(backend, reference, random_code_windows(4))
+    except Exception as e:
+        logger.error(f"Couldn't build the {name} SNAC backend, using torch: {e}")
+        return reference
+
+    if snr < min_snr_db:
+        logger.error(
+            f"{name} SNAC backend SNR {snr:.1f} dB is below {min_snr_db} dB, using torch"
+        )
+        return reference
+
+    logger.info(f"Using the {name} SNAC backend (SNR {snr:.1f} dB vs torch)")
+    return backend
@@ -0,0 +1,162 @@
+"""
+Fast-path parser for the Orpheus completions SSE stream.
+
+Every streamed token arrives as one SSE event such as
+
+    data: {"choices":[{"text":"<custom_token_4242>","index":0,...}],...}
+
+Instead of decoding each line, running `json.loads` on the whole payload and
+slicing the token string, the parser works on the raw bytes of every network
+read: one regex scan extracts the token numbers of all the events in the read.
+Reads with any other kind of event are parsed line by line, slicing the `text`
+field, and lines that don't have the expected shape fall back to a full JSON
+decode.
+"""
+
+import json
+import re
+
+from loguru import logger
+
+from realtime_phone_agents.tts.runpod.orpheus.options import CUSTOM_TOKEN_PREFIX
+
+_DATA_PREFIX = b"data: "
+_DONE = b"[DONE]"
+_TEXT_KEY = b'"text":"'
+_TOKEN_PREFIX = CUSTOM_TOKEN_PREFIX.encode()
+_DONE_EVENT = _DATA_PREFIX + _DONE
+
+# Text field of a regular audio token event: a single custom token, nothing else
+_TOKEN_EVENT = re.compile(_TEXT_KEY + re.escape(_TOKEN_PREFIX) + rb'(\d+)>"')
+
+
+def parse_custom_token(text: bytes) -> int | None:
+    """
+    Parse the number of the last `<custom_token_N>` in a token text.
+
+    Args:
+        text: Raw token text
+
+    Returns:
+        The custom token number, or None if the text has no valid custom token
+    """
+    start = text.rfind(_TOKEN_PREFIX)
+    if start == -1:
+        return None
+
+    start += len(_TOKEN_PREFIX)
+    end = text.find(b">", start)
+    if end == -1 or text[end + 1 :].strip():
+        return None
+
+    try:
+        return int(text[start:end])
+    except ValueError:
+        return None
+
+
+def custom_token_to_id(number: int, index: int) -> int:
+    """
+    Convert a custom token number to its SNAC code.
+
+    Args:
+        number: Custom token number, as parsed from `<custom_token_N>`
+        index: Position of the token in the audio token stream
+
+    Returns:
+        The SNAC code (codes of the 7 positions of a frame are offset by 4096)
+    """
+    return number - 10 - ((index % 7) * 4096)
+
+
+class OrpheusSSEParser:
+    """Incremental SSE parser that turns network reads into custom token numbers."""
+
+    def __init__(self):
+        self.done = False
+        self.fallbacks = 0
+        self._pending = b""
+
+    def feed(self, data: bytes) -> list[int]:
+        """
+        Parse one network read, which may hold any number of (partial) events.
+
+        Args:
+            data: Raw bytes read from the response
+
+        Returns:
+            Custom token numbers of every complete event in the read
+        """
+        buffer = self._pending + data
+        end = buffer.rfind(b"\n") + 1
+        complete, self._pending = buffer[:end], buffer[end:]
+        if not complete or self.done:
+            return []
+
+        done_at = complete.find(_DONE_EVENT)
+        if done_at != -1:
+            self.done = True
+            complete = complete[:done_at]
+
+        # Bulk path: one regex scan over the whole read, as long as every
+        # event in it is a regular audio token event
+        numbers = [int(n) for n in _TOKEN_EVENT.findall(complete)]
+        if len(numbers) == complete.count(_DATA_PREFIX):
+            return numbers
+
+        numbers = []
+        for line in complete.split(b"\n"):
+            number = self.parse_line(line)
+            if number is not None:
+                numbers.append(number)
+        return numbers
+
+    def flush(self) -> list[int]:
+        """Parse the last line, if the stream didn't end with a newline."""
+        line, self._pending = self._pending, b""
+        number = self.parse_line(line) if line else None
+        return [number] if number is not None else []
+
+    def parse_line(self, line: bytes) -> int | None:
+        """
+        Parse one SSE line.
+
+        Args:
+            line: Raw line, without the trailing newline
+
+        Returns:
+            The custom token number of the event, or None
+        """
+        if not line.startswith(_DATA_PREFIX):
+            return None
+
+        payload = line[len(_DATA_PREFIX) :].strip()
+        if payload == _DONE:
+            self.done = True
+            return None
+
+        # Fast path: slice the text field, which never needs unescaping for audio tokens
+        start = payload.find(_TEXT_KEY)
+        if start != -1:
+            start += len(_TEXT_KEY)
+            end = payload.find(b'"', start)
+            if end != -1 and b"\\" not in payload[start:end]:
+                return parse_custom_token(payload[start:end])
+
+        return self._parse_json(payload)
+
+    def _parse_json(self, payload: bytes) -> int | None:
+        """Slow path for payloads that don't have the expected shape."""
+        self.fallbacks += 1
+        try:
+            data = json.loads(payload)
+        except json.JSONDecodeError as e:
+            logger.error(f"JSON decode error: {e}")
+            return None
+
+        choices = data.get("choices") if isinstance(data, dict) else None
+        if not choices:
+            return None
+
+        text = choices[0].get("text", "")
+        return parse_custom_token(text.encode()) if text else None
@@ -2,140 +2,68 @@
 # Source: https://github.com/canopyai/Orpheus-TTS/blob/main/orpheus_tts_pypi/orpheus_tts/decoder.py
 
 import asyncio
-import queue
-import threading
+from collections import deque
+from typing import TYPE_CHECKING
 
 import numpy as np
-import torch
-from snac import SNAC
-
-model = SNAC.from_pretrained("hubertsiuzdak/snac_24khz").eval()
-
-# Check if CUDA is available and set device accordingly
-snac_device = (
-    "cuda"
-    if torch.cuda.is_available()
-    else "mps"
-    if torch.backends.mps.is_available()
-    else "cpu"
+
+from realtime_phone_agents.tts.runpod.orpheus.snac_backends import (
+    SNAC_MODEL_ID,
+    get_snac_backend,
 )
-model = model.to(snac_device)
+
+if TYPE_CHECKING:
+    from snac import SNAC
+
+# Loaded on first use, so processes that only dispatch to decode workers never
+# load it, nor import torch
+_model = None
+
+
+def get_snac_device() -> str:
+    """Get the device SNAC runs on: CUDA if available, then MPS, then CPU."""
+    import torch
+
+    if torch.cuda.is_available():
+        return "cuda"
+    if torch.backends.mps.is_available():
+        return "mps"
+    return "cpu"
+
+
+def get_snac_model() -> "SNAC":
+    """Get or load the SNAC model on the selected device."""
+    global _model
+    if _model is None:
+        from snac import SNAC
+
+        _model = SNAC.from_pretrained(SNAC_MODEL_ID).eval().to(get_snac_device())
+    return _model
 
 
 def convert_to_audio(multiframe, count):
     if len(multiframe) < 7:
         return
 
-    codes_0 = torch.tensor([], device=snac_device, dtype=torch.int32)
-    codes_1 = torch.tensor([], device=snac_device, dtype=torch.int32)
-    codes_2 = torch.tensor([], device=snac_device, dtype=torch.int32)
-
     num_frames = len(multiframe) // 7
-    frame = multiframe[: num_frames * 7]
-
-    for j in range(num_frames):
-        i = 7 * j
-        if codes_0.shape[0] == 0:
-            codes_0 = torch.tensor([frame[i]], device=snac_device, dtype=torch.int32)
-        else:
-            codes_0 = torch.cat(
-                [
-                    codes_0,
-                    torch.tensor([frame[i]], device=snac_device, dtype=torch.int32),
-                ]
-            )
-
-        if codes_1.shape[0] == 0:
-            codes_1 = torch.tensor(
-                [frame[i + 1]], device=snac_device, dtype=torch.int32
-            )
-            codes_1 = torch.cat(
-                [
-                    codes_1,
-                    torch.tensor([frame[i + 4]], device=snac_device, dtype=torch.int32),
-                ]
-            )
-        else:
-            codes_1 = torch.cat(
-                [
-                    codes_1,
-                    torch.tensor([frame[i + 1]], device=snac_device, dtype=torch.int32),
-                ]
-            )
-            codes_1 = torch.cat(
-                [
-                    codes_1,
-                    torch.tensor([frame[i + 4]], device=snac_device, dtype=torch.int32),
-                ]
-            )
-
-        if codes_2.shape[0] == 0:
-            codes_2 = torch.tensor(
-                [frame[i + 2]], device=snac_device, dtype=torch.int32
-            )
-            codes_2 = torch.cat(
-                [
-                    codes_2,
-                    torch.tensor([frame[i + 3]], device=snac_device, dtype=torch.int32),
-                ]
-            )
-            codes_2 = torch.cat(
-                [
-                    codes_2,
-                    torch.tensor([frame[i + 5]], device=snac_device, dtype=torch.int32),
-                ]
-            )
-            codes_2 = torch.cat(
-                [
-                    codes_2,
-                    torch.tensor([frame[i + 6]], device=snac_device, dtype=torch.int32),
-                ]
-            )
-        else:
-            codes_2 = torch.cat(
-                [
-                    codes_2,
-                    torch.tensor([frame[i + 2]], device=snac_device, dtype=torch.int32),
-                ]
-            )
-            codes_2 = torch.cat(
-                [
-                    codes_2,
-                    torch.tensor([frame[i + 3]], device=snac_device, dtype=torch.int32),
-                ]
-            )
-            codes_2 = torch.cat(
-                [
-                    codes_2,
-                    torch.tensor([frame[i + 5]], device=snac_device, dtype=torch.int32),
-                ]
-            )
-            codes_2 = torch.cat(
-                [
-                    codes_2,
-                    torch.tensor([frame[i + 6]], device=snac_device, dtype=torch.int32),
-                ]
-            )
-
-    codes = [codes_0.unsqueeze(0), codes_1.unsqueeze(0), codes_2.unsqueeze(0)]
+    frame = np.asarray(multiframe[: num_frames * 7], dtype=np.int32).reshape(
+        num_frames, 7
+    )
+
+    # Redistribute the 7 tokens of every frame over the 3 SNAC levels
+    codes = [
+        frame[:, 0].reshape(1, -1),
+        frame[:, [1, 4]].reshape(1, -1),
+        frame[:, [2, 3, 5, 6]].reshape(1, -1),
+    ]
     # check that all tokens are between 0 and 4096 otherwise return *
-    if (
-        torch.any(codes[0] < 0)
-        or torch.any(codes[0] > 4096)
-        or torch.any(codes[1] < 0)
-        or torch.any(codes[1] > 4096)
-        or torch.any(codes[2] < 0)
-        or torch.any(codes[2] > 4096)
-    ):
+    if any(np.any(c < 0) or np.any(c > 4096) for c in codes):
         return
 
-    with torch.inference_mode():
-        audio_hat = model.decode(codes)
+    audio_hat = get_snac_backend().decode(codes)
 
     audio_slice = audio_hat[:, :, 2048:4096]
-    detached_audio = audio_slice.detach().cpu()
-    audio_np = detached_audio.numpy()
-    audio_int16 = (audio_np * 32767).astype(np.int16)
+    audio_int16 = (audio_slice * 32767).astype(np.int16)
     audio_bytes = audio_int16.tobytes()
     return audio_bytes
 
@@ -165,49 +93,67 @@ def turn_token_into_id(token_string, index):
         return None
 
 
-async def tokens_decoder(token_gen):
-    buffer = []
-    count = 0
+class TokenDecoder:
+    """
+    Stateful decoding core shared by the sync and async token decoders.
+
+    Tracks the position in the audio token stream and the last 28 SNAC codes,
+    and hands out a window to decode every 7 tokens once 28 have arrived.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self._window: deque[int] = deque(maxlen=28)
+
+    def push(self, token_id: int | None) -> list[int] | None:
+        """
+        Add one SNAC code to the stream.
+
+        Args:
+            token_id: SNAC code (None or non-positive codes are skipped)
+
+        Returns:
+            The window of the last 28 codes when it's due for decoding, else None
+        """
+        if token_id is None or token_id <= 0:
+            return None
+
+        self._window.append(token_id)
+        self.count += 1
+
+        if self.count % 7 == 0 and self.count > 27:
+            return list(self._window)
+        return None
+
+
+async def tokens_decoder(token_gen, decode=convert_to_audio, to_id=turn_token_into_id):
+    """
+    Decode an async stream of tokens into audio chunks.
+
+    SNAC decoding is blocking, every window is decoded in a worker thread so
+    the event loop keeps running.
+
+    Args:
+        token_gen: Async iterator of streamed tokens
+        decode: Decodes a window of SNAC codes, given the token count
+        to_id: Converts a token and its index in the stream to a SNAC code
+    """
+    decoder = TokenDecoder()
     async for token_sim in token_gen:
-        token = turn_token_into_id(token_sim, count)
-        if token is None:
-            pass
-        else:
-            if token > 0:
-                buffer.append(token)
-                count += 1
-
-                if count % 7 == 0 and count > 27:
-                    buffer_to_proc = buffer[-28:]
-                    audio_samples = convert_to_audio(buffer_to_proc, count)
-                    if audio_samples is not None:
-                        yield audio_samples
-
-
-def tokens_decoder_sync(syn_token_gen):
-    audio_queue = queue.Queue()
-
-    # Convert the synchronous token generator into an async generator.
-    async def async_token_gen():
-        for token in syn_token_gen:
-            yield token
-
-    async def async_producer():
-        # tokens_decoder.tokens_decoder is assumed to be an async generator that processes tokens.
-        async for audio_chunk in tokens_decoder(async_token_gen()):
-            audio_queue.put(audio_chunk)
-        audio_queue.put(None)  # Sentinel
-
-    def run_async():
-        asyncio.run(async_producer())
-
-    thread = threading.Thread(target=run_async)
-    thread.start()
-
-    while True:
-        audio = audio_queue.get()
-        if audio is None:
-            break
-        yield audio
-
-    thread.join()
+        window = decoder.push(to_id(token_sim, decoder.count))
+        if window is not None:
+            audio_samples = await asyncio.to_thread(decode, window, decoder.count)
+            if audio_samples is not None:
+                yield audio_samples
+
+
+def tokens_decoder_sync(
+    syn_token_gen, decode=convert_to_audio, to_id=turn_token_into_id
+):
+    decoder = TokenDecoder()
+    for token_sim in syn_token_gen:
+        window = decoder.push(to_id(token_sim, decoder.count))
+        if window is not None:
+            audio_samples = decode(window, decoder.count)
+            if audio_samples is not None:
+                yield audio_samples
@@ -68,6 +68,12 @@ class TogetherTTSModel(TTSModel):
         if not self.options.voice:
             self.options.voice = DEFAULT_VOICES.get(self.options.model, "tara")
 
+        # Persistent client so every utterance reuses the pooled TLS connection
+        self._client = httpx.Client(
+            timeout=httpx.Timeout(300.0, connect=10.0),
+            headers=self._get_headers(),
+        )
+
         logger.info(
             f"🎤 Together AI TTS client ready (model: {self.options.model}, voice: {self.options.voice})"
         )
@@ -81,6 +87,15 @@ class TogetherTTSModel(TTSModel):
         """
         self.options.voice = voice
 
+    def request_sample_rate(self, sample_rate: int) -> None:
+        """
+        Ask Together AI to stream raw PCM at `sample_rate`.
+
+        Args:
+            sample_rate: Desired output sample rate (Hz)
+        """
+        self.options.sample_rate = sample_rate
+
     def _get_headers(self) -> dict[str, str]:
         """Get HTTP headers for API requests."""
         return {
@@ -123,44 +138,20 @@ class TogetherTTSModel(TTSModel):
         pcm_buffer = b""
 
         try:
-            with httpx.Client(
-                timeout=httpx.Timeout(300.0, connect=10.0),
-                headers=self._get_headers(),
-            ) as client:
-                with client.stream("POST", speech_url, json=payload) as response:
-                    response.raise_for_status()
-
-                    content_type = response.headers.get("content-type", "")
-                    logger.debug(f"📥 Response content-type: {content_type}")
-
-                    for chunk in response.iter_bytes():
-                        if not chunk:
-                            continue
-
-                        pcm_buffer += chunk
-
-                        # Send complete 2-byte aligned chunks (int16 = 2 bytes per sample)
-                        if len(pcm_buffer) >= self.MIN_CHUNK_SIZE:
-                            complete_samples = len(pcm_buffer) // 2
-                            if complete_samples > 0:
-                                complete_bytes = complete_samples * 2
-                                chunks_received += 1
-                                total_bytes += complete_bytes
-
-                                audio_chunk = np.frombuffer(
-                                    pcm_buffer[:complete_bytes], dtype=np.int16
-                                )
+            with self._client.stream("POST", speech_url, json=payload) as response:
+                response.raise_for_status()
+
+                content_type = response.headers.get("content-type", "")
+                logger.debug(f"📥 Response content-type: {content_type}")
 
-                                if chunks_received == 1:
-                                    logger.debug(
-                                        f"🎵 First audio chunk: {complete_bytes} bytes"
-                                    )
+                for chunk in response.iter_bytes():
+                    if not chunk:
+                        continue
 
-                                yield audio_chunk
-                                pcm_buffer = pcm_buffer[complete_bytes:]
+                    pcm_buffer += chunk
 
-                    # Flush remaining buffer
-                    if pcm_buffer:
+                    # Send complete 2-byte aligned chunks (int16 = 2 bytes per sample)
+                    if len(pcm_buffer) >= self.MIN_CHUNK_SIZE:
                         complete_samples = len(pcm_buffer) // 2
                         if complete_samples > 0:
                             complete_bytes = complete_samples * 2
@@ -170,7 +161,27 @@ class TogetherTTSModel(TTSModel):
                             audio_chunk = np.frombuffer(
                                 pcm_buffer[:complete_bytes], dtype=np.int16
                             )
+
+                            if chunks_received == 1:
+                                logger.debug(
+                                    f"🎵 First audio chunk: {complete_bytes} bytes"
+                                )
+
                             yield audio_chunk
+                            pcm_buffer = pcm_buffer[complete_bytes:]
+
+                # Flush remaining buffer
+                if pcm_buffer:
+                    complete_samples = len(pcm_buffer) // 2
+                    if complete_samples > 0:
+                        complete_bytes = complete_samples * 2
+                        chunks_received += 1
+                        total_bytes += complete_bytes
+
+                        audio_chunk = np.frombuffer(
+                            pcm_buffer[:complete_bytes], dtype=np.int16
+                        )
+                        yield audio_chunk
 
             logger.info(
                 f"✅ Together AI TTS completed: {chunks_received} chunks, {total_bytes} bytes"
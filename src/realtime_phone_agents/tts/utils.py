@@ -2,7 +2,6 @@ from realtime_phone_agents.tts.base import TTSModel
 from realtime_phone_agents.tts.local.kokoro import KokoroTTSModel
 from realtime_phone_agents.tts.runpod import OrpheusTTSModel
 from realtime_phone_agents.tts.togetherai import TogetherTTSModel
-from loguru import logger
 
 def get_tts_model(model_name: str) -> TTSModel:
     """Get a TTS model by name.
@@ -15,10 +14,7 @@ def get_tts_model(model_name: str) -> TTSModel:
     if model_name == "kokoro":
         return KokoroTTSModel()
     elif model_name == "orpheus-runpod":
-        orpheus_model = OrpheusTTSModel()
-        logger.info("Warming up Orpheus TTS model...")
-        orpheus_model.tts_blocking("This is just a simple message to warmup the model")
-        return orpheus_model
+        return OrpheusTTSModel()
     elif model_name == "together":
         return TogetherTTSModel()
     else:
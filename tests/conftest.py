@@ -0,0 +1,48 @@
+from typing import Any
+
+import pytest
+
+from realtime_phone_agents.agent import prefetch
+from realtime_phone_agents.agent.tools import (
+    property_search,
+    result_cursor,
+    result_store,
+)
+
+
+class FakePropertySearchService:
+    """Stands in for the Superlinked service, recording every search it runs."""
+
+    def __init__(self, count: int = 10):
+        self.properties = [
+            {"id": i, "price": 100000 * i, "location": "Barrio de Salamanca"}
+            for i in range(1, count + 1)
+        ]
+        self.searches: list[dict[str, Any]] = []
+
+    async def search_properties(
+        self, query: str, limit: int = 1, summary: bool = False
+    ) -> list[dict[str, Any]]:
+        self.searches.append({"query": query, "limit": limit})
+        return self.properties[:limit]
+
+    async def search_properties_structured(
+        self, limit: int = 1, summary: bool = False, **params: Any
+    ) -> list[dict[str, Any]]:
+        self.searches.append({**params, "limit": limit})
+        return self.properties[:limit]
+
+    async def get_property(self, property_id: int) -> dict[str, Any] | None:
+        return next((p for p in self.properties if p["id"] == property_id), None)
+
+
+@pytest.fixture
+def search_service(monkeypatch) -> FakePropertySearchService:
+    """Fake search service, with fresh per-session stores and prefetcher."""
+    service = FakePropertySearchService()
+    monkeypatch.setattr(prefetch, "get_property_search_service", lambda: service)
+    monkeypatch.setattr(property_search, "get_property_search_service", lambda: service)
+    monkeypatch.setattr(prefetch, "_search_prefetcher", None)
+    monkeypatch.setattr(result_cursor, "_cursor_store", None)
+    monkeypatch.setattr(result_store, "_result_store", None)
+    return service
@@ -0,0 +1,112 @@
+import asyncio
+from concurrent.futures import Future
+
+import numpy as np
+import pytest
+
+from realtime_phone_agents.tts.runpod.orpheus import model as orpheus_model
+from realtime_phone_agents.tts.runpod.orpheus.model import OrpheusTTSModel
+from realtime_phone_agents.tts.runpod.orpheus.options import OrpheusTTSOptions
+
+WINDOW_SAMPLES = 2048
+
+
+def stub_convert_to_audio(multiframe: list[int], count: int) -> bytes:
+    """Stand-in for SNAC: the PCM of a window is its token count, repeated."""
+    return np.full(WINDOW_SAMPLES, count, dtype=np.int16).tobytes()
+
+
+class FakeDecodePool:
+    """Decode pool whose futures are completed right away by the stub decoder."""
+
+    result_timeout_s = 1.0
+
+    def __init__(self):
+        self.submitted: list[int] = []
+
+    def submit(self, window: list[int], count: int) -> Future:
+        self.submitted.append(count)
+        future: Future = Future()
+        future.set_result(
+            np.frombuffer(stub_convert_to_audio(window, count), dtype=np.int16)
+        )
+        return future
+
+
+def custom_tokens(n: int) -> list[int]:
+    """Custom token numbers whose SNAC codes are all 1."""
+    return [1 + 10 + (index % 7) * 4096 for index in range(n)]
+
+
+# 28 tokens fill the first window, then every 7 tokens make another one
+TOKENS = custom_tokens(49)
+WINDOW_COUNTS = [28, 35, 42, 49]
+
+
+@pytest.fixture
+def tts_model(monkeypatch) -> OrpheusTTSModel:
+    monkeypatch.setattr(orpheus_model, "convert_to_audio", stub_convert_to_audio)
+    return OrpheusTTSModel(OrpheusTTSOptions(decode_workers=0))
+
+
+def chunk_counts(chunks: list[np.ndarray]) -> list[int]:
+    assert all(len(chunk) == WINDOW_SAMPLES for chunk in chunks)
+    return [int(chunk[0]) for chunk in chunks]
+
+
+async def collect(chunks) -> list[np.ndarray]:
+    return [chunk async for chunk in chunks]
+
+
+async def token_stream(tokens: list[int]):
+    for token in tokens:
+        yield token
+
+
+def test_sync_decoding(tts_model):
+    chunks = list(tts_model._token_decoder_sync(iter(TOKENS)))
+    assert chunk_counts(chunks) == WINDOW_COUNTS
+
+
+def test_async_decoding(tts_model):
+    chunks = asyncio.run(collect(tts_model._token_decoder(token_stream(TOKENS))))
+    assert chunk_counts(chunks) == WINDOW_COUNTS
+
+
+def test_pooled_sync_decoding(tts_model):
+    tts_model._decode_pool = FakeDecodePool()
+    chunks = list(tts_model._token_decoder_sync(iter(TOKENS)))
+    assert chunk_counts(chunks) == WINDOW_COUNTS
+    assert tts_model._decode_pool.submitted == WINDOW_COUNTS
+
+
+def test_pooled_async_decoding(tts_model):
+    tts_model._decode_pool = FakeDecodePool()
+    chunks = asyncio.run(collect(tts_model._token_decoder(token_stream(TOKENS))))
+    assert chunk_counts(chunks) == WINDOW_COUNTS
+    assert tts_model._decode_pool.submitted == WINDOW_COUNTS
+
+
+def test_pooled_decoding_falls_back_in_process(tts_model):
+    class FailingDecodePool(FakeDecodePool):
+        def submit(self, window: list[int], count: int) -> Future:
+            self.submitted.append(count)
+            future: Future = Future()
+            future.set_exception(RuntimeError("worker died"))
+            return future
+
+    tts_model._decode_pool = FailingDecodePool()
+    sync_chunks = list(tts_model._token_decoder_sync(iter(TOKENS)))
+    async_chunks = asyncio.run(collect(tts_model._token_decoder(token_stream(TOKENS))))
+    assert chunk_counts(sync_chunks) == WINDOW_COUNTS
+    assert chunk_counts(async_chunks) == WINDOW_COUNTS
+
+
+def test_async_client_per_event_loop(tts_model):
+    async def client():
+        return tts_model._get_async_client()
+
+    first = asyncio.run(client())
+    second = asyncio.run(client())
+    assert first is not second
+    assert list(tts_model._async_clients.values()) == [second]
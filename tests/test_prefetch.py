@@ -0,0 +1,68 @@
+import asyncio
+
+from realtime_phone_agents.agent import prefetch
+from realtime_phone_agents.agent.prefetch import SearchPrefetcher
+from realtime_phone_agents.agent.tools.property_search import (
+    search_property_structured_tool,
+    search_property_tool,
+)
+from realtime_phone_agents.config import settings
+
+
+def thread_config(thread_id: str) -> dict:
+    return {"configurable": {"thread_id": thread_id}}
+
+
+def _use_prefetcher(monkeypatch, structured: bool) -> SearchPrefetcher:
+    prefetcher = SearchPrefetcher(
+        limit=settings.property_tool.cursor_size, structured=structured
+    )
+    monkeypatch.setattr(prefetch, "_search_prefetcher", prefetcher)
+    return prefetcher
+
+
+def test_tool_uses_prefetch_of_its_thread(monkeypatch, search_service):
+    prefetcher = _use_prefetcher(monkeypatch, structured=False)
+
+    async def turn():
+        assert prefetcher.start("thread-1", "Show me flats in Salamanca")
+        return await search_property_tool.ainvoke(
+            {"query": "flats in Salamanca"}, config=thread_config("thread-1")
+        )
+
+    assert "Salamanca" in asyncio.run(turn())
+    assert search_service.searches == [
+        {"query": "Show me flats in Salamanca", "limit": prefetcher.limit}
+    ]
+
+
+def test_tool_ignores_prefetch_of_another_thread(monkeypatch, search_service):
+    prefetcher = _use_prefetcher(monkeypatch, structured=False)
+
+    async def turn():
+        assert prefetcher.start("thread-1", "Show me flats in Salamanca")
+        return await search_property_tool.ainvoke(
+            {"query": "flats in Salamanca"}, config=thread_config("thread-2")
+        )
+
+    asyncio.run(turn())
+    assert [search["query"] for search in search_service.searches] == [
+        "Show me flats in Salamanca",
+        "flats in Salamanca",
+    ]
+
+
+def test_structured_tool_uses_prefetch_of_its_thread(monkeypatch, search_service):
+    _use_prefetcher(monkeypatch, structured=True)
+
+    async def turn():
+        assert prefetch.get_search_prefetcher().start(
+            "thread-1", "two bedroom flats in Salamanca"
+        )
+        return await search_property_structured_tool.ainvoke(
+            {"location": "Barrio de Salamanca", "min_rooms": 2},
+            config=thread_config("thread-1"),
+        )
+
+    asyncio.run(turn())
+    assert len(search_service.searches) == 1
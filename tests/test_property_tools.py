@@ -0,0 +1,43 @@
+import asyncio
+
+import pytest
+
+from realtime_phone_agents.agent.tools.property_search import (
+    browse_search_results_tool,
+    get_property_details_tool,
+    get_property_tools,
+    search_property_tool,
+)
+
+
+@pytest.mark.parametrize("structured", [False, True])
+def test_runnable_config_is_not_in_tool_schema(structured):
+    for tool in get_property_tools(structured):
+        assert "config" not in tool.args, tool.name
+
+
+def thread_config(thread_id: str) -> dict:
+    return {"configurable": {"thread_id": thread_id}}
+
+
+def test_search_results_are_kept_per_thread(search_service):
+    async def calls():
+        await search_property_tool.ainvoke(
+            {"query": "flats in Salamanca"}, config=thread_config("thread-1")
+        )
+        own = await browse_search_results_tool.ainvoke(
+            {"action": "next"}, config=thread_config("thread-1")
+        )
+        other = await browse_search_results_tool.ainvoke(
+            {"action": "next"}, config=thread_config("thread-2")
+        )
+        details = await get_property_details_tool.ainvoke(
+            {"property_id": 1}, config=thread_config("thread-2")
+        )
+        return own, other, details
+
+    own, other, details = asyncio.run(calls())
+
+    assert '"id":2' in own
+    assert other.startswith("There are no search results yet")
+    assert details.startswith("No details available")